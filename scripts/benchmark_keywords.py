@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Keyword Matching Benchmark
+==========================
+Measures the keyword checks of the cleaner on the saved articles
+(data/articles), the old way and with keyword_matcher.py, and checks that
+both give the same answers.
+
+CHECKS:
+- consent:  the consent-wall phrases, searched in every raw page
+            (source_rules.is_consent_wall, used by the cleaner and render_strategy)
+- noise:    the noise keywords, searched in every line of every page
+            (cleaners/utils.py remove_inline_noise)
+- links:    the video URL patterns, searched in every article link
+            (source_rules.is_video_page)
+
+METHODS:
+- regex:        one compiled alternation "a|b|c" (source_rules.py before)
+- any-in:       any(keyword in text ...) (remove_inline_noise before)
+- aho-corasick: a textbook Aho-Corasick automaton, in pure Python
+- matcher:      keyword_matcher.py (what the pipeline uses now)
+
+HOW TO RUN:
+    python scripts/benchmark_keywords.py
+    python scripts/benchmark_keywords.py --limit 500 --repeat 5
+    python scripts/benchmark_keywords.py --articles-dir /path/to/data/articles
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+# The stand-in server knows how to read the saved raw pages
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import scrapingbee_standin
+
+# Add src to path for imports
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import keyword_matcher
+import source_rules
+from cleaners import utils as cleaner_utils
+
+ARTICLES_DIR = Path(__file__).resolve().parent.parent / "data" / "articles"
+BLOB_DIR = Path(__file__).resolve().parent.parent / "data" / "blobs"
+
+# The same keyword lists the pipeline uses
+NOISE_KEYWORDS_LIST = [
+    "read comments", "share on", "whatsapp", "facebook", "twitter",
+    "subscribe", "iniciar sesión", "log in", "sign up",
+    "reportar un error", "publicidad", "advertisement", "sponsor",
+    "all rights reserved", "copyright",
+    "privacidade", "consentimento", "cookies", "aceitar", "concordo",
+    "partilhar", "copiar link", "subscrever", "já é subscritor",
+]
+
+
+# =============================================================================
+# THE OLD WAYS (for comparison)
+# =============================================================================
+
+def compile_regex(keywords):
+    """
+    One alternation of all keywords (how source_rules.py compiled them before).
+    """
+    keywords = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+def build_automaton(keywords):
+    """
+    A textbook Aho-Corasick automaton: (goto, fail, is_end) lists.
+    """
+    goto = [{}]
+    fail = [0]
+    is_end = [False]
+    for keyword in keywords:
+        state = 0
+        for char in keyword:
+            if char not in goto[state]:
+                goto.append({})
+                fail.append(0)
+                is_end.append(False)
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        is_end[state] = True
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(char, 0)
+            is_end[next_state] = is_end[next_state] or is_end[fail[next_state]]
+    return goto, fail, is_end
+
+
+def automaton_contains_any(automaton, text):
+    """
+    Walk the text through the automaton; True at the first keyword end.
+    """
+    goto, fail, is_end = automaton
+    state = 0
+    for char in text:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        if is_end[state]:
+            return True
+    return False
+
+
+def noise_lines_old(text, keywords):
+    """
+    remove_inline_noise before: lower-case each line, any() over all keywords.
+    """
+    found = []
+    for i, line in enumerate(text.split("\n")):
+        lower_line = line.strip().lower()
+        if any(keyword in lower_line for keyword in keywords):
+            found.append(i)
+    return found
+
+
+def noise_lines_regex(text, regex):
+    found = []
+    for i, line in enumerate(text.split("\n")):
+        if regex.search(line.strip().lower()):
+            found.append(i)
+    return found
+
+
+def noise_lines_automaton(text, automaton):
+    found = []
+    for i, line in enumerate(text.split("\n")):
+        if automaton_contains_any(automaton, line.strip().lower()):
+            found.append(i)
+    return found
+
+
+def noise_lines_matcher(text, matcher):
+    """
+    remove_inline_noise now: only the keywords found in the text, per line.
+    """
+    found = []
+    present = keyword_matcher.keywords_in_text(matcher, text)
+    if not present["keywords"]:
+        return found
+    for i, line in enumerate(text.split("\n")):
+        if keyword_matcher.contains_any(present, line.strip()):
+            found.append(i)
+    return found
+
+
+# =============================================================================
+# RUNNING
+# =============================================================================
+
+def time_method(function, items, repeat):
+    """
+    Best of "repeat" runs of function over all items.
+
+    RETURNS:
+    - (seconds, list of results)
+    """
+    best = None
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [function(item) for item in items]
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best:
+            best = seconds
+    return best, results
+
+
+def run_check(name, items, methods, repeat):
+    """
+    Time every method of one check and print a table (first method = baseline).
+    """
+    print(f"\n{name} ({len(items)} items)")
+    print(f"  {'METHOD':<14} {'TOTAL(ms)':>10} {'PER ITEM(us)':>13} {'SPEEDUP':>8}")
+    baseline = None
+    expected = None
+    for method_name, function in methods:
+        seconds, results = time_method(function, items, repeat)
+        if expected is None:
+            expected = results
+            baseline = seconds
+        same = "" if results == expected else "  [DIFFERENT RESULTS]"
+        print(f"  {method_name:<14} {seconds * 1000:>10.1f} {seconds / max(len(items), 1) * 1e6:>13.1f} "
+              f"{baseline / max(seconds, 1e-9):>7.1f}x{same}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the cleaner's keyword checks on saved articles")
+    parser.add_argument("--articles-dir", type=str, default=str(ARTICLES_DIR), help="Saved articles to read")
+    parser.add_argument("--blob-dir", type=str, default=str(BLOB_DIR), help="Blob storage of the raw pages")
+    parser.add_argument("--limit", type=int, default=None, help="Read at most this many articles")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method, the best one counts (default: 3)")
+    parser.add_argument("--skip-automaton", action="store_true", help="Leave out the (slow) pure-Python automaton")
+    args = parser.parse_args()
+
+    bodies = scrapingbee_standin.load_bodies(args.articles_dir, args.blob_dir, limit=args.limit)
+    if not bodies:
+        print(f"[ERROR] No saved articles in {args.articles_dir}")
+        sys.exit(1)
+
+    pages = list(bodies.values())
+    links = list(bodies.keys())
+    total_chars = sum(len(page) for page in pages)
+    print(f"[INFO] {len(pages)} pages, {total_chars / len(pages):.0f} characters on average")
+
+    # 1. Consent-wall phrases in the whole page
+    consent_phrases = source_rules.CLEAN_RULES["consent_phrases"]
+    consent_regex = compile_regex(consent_phrases)
+    consent_automaton = build_automaton(consent_phrases)
+
+    def consent_regex_check(page):
+        return consent_regex.search(page) is not None
+
+    def consent_any_in_check(page):
+        return any(phrase in page for phrase in consent_phrases)
+
+    def consent_automaton_check(page):
+        return automaton_contains_any(consent_automaton, page)
+
+    methods = [
+        ("regex", consent_regex_check),
+        ("any-in", consent_any_in_check),
+        ("matcher", source_rules.is_consent_wall),
+    ]
+    if not args.skip_automaton:
+        methods.insert(2, ("aho-corasick", consent_automaton_check))
+    run_check("CONSENT PHRASES (whole page)", pages, methods, args.repeat)
+
+    # 2. Noise keywords in every line
+    noise_lower = [keyword.lower() for keyword in NOISE_KEYWORDS_LIST]
+    noise_regex = compile_regex(noise_lower)
+    noise_automaton = build_automaton(noise_lower)
+
+    def noise_any_in_check(page):
+        return noise_lines_old(page, noise_lower)
+
+    def noise_regex_check(page):
+        return noise_lines_regex(page, noise_regex)
+
+    def noise_automaton_check(page):
+        return noise_lines_automaton(page, noise_automaton)
+
+    def noise_matcher_check(page):
+        return noise_lines_matcher(page, cleaner_utils.NOISE_KEYWORDS)
+
+    methods = [
+        ("any-in", noise_any_in_check),
+        ("regex", noise_regex_check),
+        ("matcher", noise_matcher_check),
+    ]
+    if not args.skip_automaton:
+        methods.insert(2, ("aho-corasick", noise_automaton_check))
+    run_check("NOISE KEYWORDS (every line)", pages, methods, args.repeat)
+
+    # 3. Video URL patterns in the link
+    link_patterns = source_rules.CLEAN_RULES["exclude_link_patterns"]
+    link_regex = compile_regex(link_patterns)
+
+    def link_regex_check(link):
+        return link_regex.search(link) is not None
+
+    def link_matcher_check(link):
+        return keyword_matcher.contains_any(source_rules.CLEAN["exclude_link"], link)
+
+    methods = [
+        ("regex", link_regex_check),
+        ("matcher", link_matcher_check),
+    ]
+    run_check("VIDEO LINK PATTERNS (every link)", links, methods, args.repeat)
+    print()
+
+
+if __name__ == "__main__":
+    main()
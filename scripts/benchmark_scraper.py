@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Scraper Load Benchmark
+======================
+Runs src/02__scraper.py against the local ScrapingBee stand-in
+(scripts/scrapingbee_standin.py) at several concurrency settings and
+reports how fast it goes - without spending a single credit.
+
+FOR EVERY CONCURRENCY SETTING:
+1. Make a temporary working folder with generated links (data/links/BENCH_*)
+2. Run the scraper on it as a normal subprocess
+3. Read the scraper's summary and the stand-in's request counters
+
+REPORTED:
+- articles/s:     articles saved per second (the scraper's own summary)
+- p50 / p95:      ScrapingBee request latency seen by the stand-in
+- requests:       requests sent for the articles, incl. throttled ones
+- retry overhead: extra requests per article, in percent
+- peak:           most requests in flight (AIMD controller)
+
+HOW TO RUN:
+    python scripts/benchmark_scraper.py
+    python scripts/benchmark_scraper.py --concurrency 5,10,20,40 --articles 300
+    python scripts/benchmark_scraper.py --max-concurrent 10 --rate-429 0.05 --latency-median 0.5
+
+    # Compare with a fixed number in flight (no AIMD)
+    python scripts/benchmark_scraper.py --no-adaptive
+
+Article bodies are replayed from data/articles when it has any. The
+benchmark never writes to the real data/ folder.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# The stand-in server lives next to this script
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import scrapingbee_standin
+
+SCRAPER = Path(__file__).resolve().parent.parent / "src" / "02__scraper.py"
+
+DEFAULT_CONCURRENCY = "5,10,20"
+DEFAULT_ARTICLES = 200
+DEFAULT_SOURCES = 8
+
+
+def write_links(work_dir, articles, sources):
+    """
+    Write generated indexer output (data/links/<SOURCE>/<run>.jsonl).
+    """
+    now = int(time.time())
+    for s in range(sources):
+        source = f"BENCH_{s + 1:02d}"
+        folder = os.path.join(work_dir, "data", "links", source)
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, "20260101_000000.jsonl"), "w", encoding="utf-8") as f:
+            for i in range(s, articles, sources):
+                record = {
+                    "source": source,
+                    "link": f"https://bench.example/{source.lower()}/article-{i}",
+                    "title": f"Benchmark article {i}",
+                    "published_ts": now - i * 60,
+                }
+                f.write(json.dumps(record) + "\n")
+
+
+def percentile(values, share):
+    """
+    The value below which "share" (0.5, 0.95) of the values lie.
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(share * (len(values) - 1))))]
+
+
+def read_summary(output):
+    """
+    Pick the numbers we need out of the scraper's printed summary.
+    """
+    summary = {"seconds": 0.0, "per_second": 0.0, "successful": 0, "errors": 0, "throttled": 0, "peak": 0}
+
+    match = re.search(r"Time: ([\d.]+)s \(([\d.]+) articles/s\)", output)
+    if match:
+        summary["seconds"] = float(match.group(1))
+        summary["per_second"] = float(match.group(2))
+    match = re.search(r"Successful: (\d+)", output)
+    if match:
+        summary["successful"] = int(match.group(1))
+    match = re.search(r"Errors: (\d+)", output)
+    if match:
+        summary["errors"] = int(match.group(1))
+    match = re.search(r"Throttled answers: (\d+)", output)
+    if match:
+        summary["throttled"] = int(match.group(1))
+    match = re.search(r"Requests in flight: peak (\d+)", output)
+    if match:
+        summary["peak"] = int(match.group(1))
+    return summary
+
+
+def run_once(base_url, concurrency, args):
+    """
+    Run the scraper once in a fresh temporary folder.
+
+    RETURNS:
+    - The summary dictionary (see read_summary), or None if the scraper failed
+    """
+    with tempfile.TemporaryDirectory(prefix="scraper_bench_") as work_dir:
+        write_links(work_dir, args.articles, args.sources)
+
+        command = [
+            sys.executable, str(SCRAPER),
+            "--base-url", base_url,
+            "--concurrency", str(concurrency),
+            "--source-rate", "0",
+            "--render", args.render,
+        ]
+        if args.no_adaptive:
+            command.append("--no-adaptive")
+
+        env = dict(os.environ)
+        env["SCRAPINGBEE_API_KEY"] = "benchmark"
+
+        result = subprocess.run(command, cwd=work_dir, env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"[ERROR] Scraper failed (exit code {result.returncode}):")
+            print(result.stderr[-2000:])
+            return None
+
+        return read_summary(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark 02__scraper.py against a local ScrapingBee stand-in")
+    parser.add_argument("--concurrency", type=str, default=DEFAULT_CONCURRENCY,
+                        help=f"Comma-separated --concurrency values to try (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--articles", type=int, default=DEFAULT_ARTICLES,
+                        help=f"Articles per run (default: {DEFAULT_ARTICLES})")
+    parser.add_argument("--sources", type=int, default=DEFAULT_SOURCES,
+                        help=f"Sources the articles are spread over (default: {DEFAULT_SOURCES})")
+    parser.add_argument("--render", choices=["auto", "js", "static"], default="js",
+                        help="Scraper --render mode (default: js, one request per article)")
+    parser.add_argument("--no-adaptive", action="store_true", help="Run the scraper with --no-adaptive")
+    parser.add_argument("--base-url", type=str, default=None,
+                        help="Use an already running stand-in instead of starting one (no latency columns)")
+    scrapingbee_standin.add_settings_arguments(parser)
+    args = parser.parse_args()
+
+    concurrency_values = [int(value) for value in args.concurrency.split(",") if value.strip()]
+
+    print("=" * 78)
+    print("SCRAPER BENCHMARK")
+    print("=" * 78)
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = scrapingbee_standin.start_server(scrapingbee_standin.settings_from_args(args))
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+    print(f"[INFO] Endpoint: {base_url}")
+    print(f"[INFO] {args.articles} articles over {args.sources} sources, render: {args.render}, "
+          f"latency: {args.latency} (median {args.latency_median}s), "
+          f"429: {args.rate_429:.0%}, 500: {args.rate_500:.0%}, plan limit: {args.max_concurrent or 'none'}")
+    print()
+
+    rows = []
+    for concurrency in concurrency_values:
+        print(f"[INFO] Running with --concurrency {concurrency}...")
+        if server is not None:
+            scrapingbee_standin.reset_stats()
+
+        summary = run_once(base_url, concurrency, args)
+        if summary is None:
+            continue
+
+        if server is not None:
+            stats = scrapingbee_standin.get_stats()
+            summary["requests"] = stats["requests"]
+            summary["p50"] = percentile(stats["latencies"], 0.50)
+            summary["p95"] = percentile(stats["latencies"], 0.95)
+        summary["concurrency"] = concurrency
+        rows.append(summary)
+
+    if server is not None:
+        server.shutdown()
+
+    # Results table
+    print()
+    print(f"{'CONC':>5} {'ART/S':>7} {'TIME(s)':>8} {'OK':>5} {'ERR':>4} {'P50(s)':>7} {'P95(s)':>7} "
+          f"{'REQS':>6} {'RETRY%':>7} {'PEAK':>5}")
+    print("-" * 78)
+    for row in rows:
+        done = row["successful"] + row["errors"]
+        if "requests" in row:
+            overhead = (row["requests"] - done) / max(done, 1) * 100
+            latency = f"{row['p50']:>7.2f} {row['p95']:>7.2f} {row['requests']:>6} {overhead:>6.1f}%"
+        else:
+            latency = f"{'-':>7} {'-':>7} {'-':>6} {'-':>7}"
+        print(f"{row['concurrency']:>5} {row['per_second']:>7.2f} {row['seconds']:>8.1f} "
+              f"{row['successful']:>5} {row['errors']:>4} {latency} {row['peak']:>5}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
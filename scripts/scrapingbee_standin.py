@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+ScrapingBee Stand-in Server
+===========================
+A local HTTP server that answers like the ScrapingBee API, so we can measure
+and tune 02__scraper.py (concurrency, AIMD, retries) without spending credits.
+
+WHAT IT IMITATES:
+- GET /api/v1?api_key=...&url=...&render_js=true|false&return_page_markdown=true
+- Latency: fixed, uniform or lognormal (like real ScrapingBee: most answers
+  are quick, a few are very slow). render_js=true is slower (--js-factor).
+- Errors: a share of 429 (with Retry-After) and 500 answers, and 429 for
+  every request above the plan's concurrent-request limit (--max-concurrent)
+- Bodies: the real raw pages of data/articles/*.json (inline or blob
+  storage), found by the requested URL; unknown URLs get one of them picked
+  by URL hash, or a generated page if data/articles is empty
+- Headers: Spb-cost (1 static / 5 JavaScript), Spb-resolved-url
+
+HOW TO RUN:
+    python scripts/scrapingbee_standin.py --port 8000 --latency lognormal --latency-median 1.5
+
+    # Then, in another terminal:
+    SCRAPINGBEE_API_KEY=test python src/02__scraper.py --base-url http://127.0.0.1:8000/api/v1
+
+    # Imitate a 10-request plan that also throttles 5% of requests
+    python scripts/scrapingbee_standin.py --max-concurrent 10 --rate-429 0.05
+
+scripts/benchmark_scraper.py starts this server by itself.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add src to path for imports
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import blob_store  # Raw pages of articles saved in blob storage mode
+
+ARTICLES_DIR = Path(__file__).resolve().parent.parent / "data" / "articles"
+BLOB_DIR = Path(__file__).resolve().parent.parent / "data" / "blobs"
+
+# Default behaviour (all can be changed on the command line)
+DEFAULT_PORT = 8000
+DEFAULT_LATENCY = "lognormal"
+DEFAULT_LATENCY_MEDIAN = 1.5   # Seconds for a static page
+DEFAULT_LATENCY_SPREAD = 0.5   # lognormal: sigma, uniform: +/- share of the median
+DEFAULT_JS_FACTOR = 2.5        # render_js=true takes this many times longer
+DEFAULT_RETRY_AFTER = 2        # Seconds in the Retry-After header of a 429
+
+# The server's settings and counters (one dictionary, shared by all request threads)
+STATE = {
+    "settings": {},
+    "bodies": {},        # link -> raw page
+    "body_list": [],     # all raw pages, for unknown links
+    "lock": threading.Lock(),
+    "in_flight": 0,
+    "stats": None,
+}
+
+
+def new_stats():
+    """
+    Empty request counters.
+    """
+    return {
+        "requests": 0,
+        "by_status": {},
+        "latencies": [],
+        "static": 0,
+        "js": 0,
+    }
+
+
+def load_bodies(articles_dir=ARTICLES_DIR, blob_dir=BLOB_DIR, limit=None):
+    """
+    Load the raw pages of saved articles, so answers look like real pages.
+
+    RETURNS:
+    - A dictionary { link: raw_page }
+    """
+    bodies = {}
+    for filepath in Path(articles_dir).glob("*.json"):
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (data.get("scrapingbee") or {}).get("success") is False:
+                continue
+            content = blob_store.load_raw_content(data, str(blob_dir))
+        except Exception as e:
+            print(f"[WARNING] Could not read {filepath.name}: {e}")
+            continue
+        if content and data.get("link"):
+            bodies[data["link"]] = content
+            if limit and len(bodies) >= limit:
+                break
+    return bodies
+
+
+def make_fake_page(url):
+    """
+    A generated article page (when there are no saved articles to replay).
+    """
+    paragraph = (
+        "Tourism in Portugal keeps growing, with record numbers of visitors in Lisbon, "
+        "Porto and the Algarve. Airlines added new routes and hotels report high occupancy. "
+    )
+    return f"# Article from {url}\n\n" + "\n\n".join([paragraph * 3] * 8)
+
+
+def get_body(url):
+    """
+    The page to send back for a URL (the real one if we have it).
+    """
+    if url in STATE["bodies"]:
+        return STATE["bodies"][url]
+    if STATE["body_list"]:
+        # Same URL -> same page, so repeated runs are comparable
+        index = int(hashlib.md5(url.encode("utf-8")).hexdigest(), 16) % len(STATE["body_list"])
+        return STATE["body_list"][index]
+    return make_fake_page(url)
+
+
+def draw_latency(render_js):
+    """
+    Draw the time one request takes from the configured distribution.
+    """
+    settings = STATE["settings"]
+    median = settings["latency_median"]
+    spread = settings["latency_spread"]
+
+    if settings["latency"] == "fixed":
+        latency = median
+    elif settings["latency"] == "uniform":
+        latency = random.uniform(median * (1 - spread), median * (1 + spread))
+    else:
+        latency = random.lognormvariate(math.log(median), spread)
+
+    if render_js:
+        latency *= settings["js_factor"]
+    return max(0.0, latency)
+
+
+def answer_request(query):
+    """
+    Decide the answer to one API request.
+
+    RETURNS:
+    - A tuple (status_code, headers, body_text, latency_seconds)
+    """
+    settings = STATE["settings"]
+    url = (query.get("url") or [""])[0]
+    render_js = (query.get("render_js") or ["true"])[0].lower() == "true"
+
+    if not url:
+        return 400, {}, "Missing url parameter", 0.0
+
+    # Over the plan's concurrent-request limit: answered right away with 429
+    if settings["max_concurrent"] and STATE["in_flight"] > settings["max_concurrent"]:
+        return 429, {"Retry-After": str(settings["retry_after"])}, "Too many concurrent requests", 0.05
+
+    roll = random.random()
+    if roll < settings["rate_429"]:
+        return 429, {"Retry-After": str(settings["retry_after"])}, "Rate limited", 0.05
+    if roll < settings["rate_429"] + settings["rate_500"]:
+        return 500, {}, "Internal error", draw_latency(render_js)
+
+    headers = {
+        "Spb-cost": "5" if render_js else "1",
+        "Spb-resolved-url": url,
+        "Content-Type": "text/markdown; charset=utf-8",
+    }
+    return 200, headers, get_body(url), draw_latency(render_js)
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """
+    http.server needs a handler class; all the logic is in answer_request().
+    """
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+    def do_GET(self):
+        with STATE["lock"]:
+            STATE["in_flight"] += 1
+        start = time.time()
+        query = {}
+        status = 500
+
+        try:
+            query = parse_qs(urlparse(self.path).query)
+            status, headers, body, latency = answer_request(query)
+            time.sleep(latency)
+
+            data = body.encode("utf-8")
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with STATE["lock"]:
+                STATE["in_flight"] -= 1
+                stats = STATE["stats"]
+                stats["requests"] += 1
+                stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
+                stats["latencies"].append(time.time() - start)
+                if (query.get("render_js") or ["true"])[0].lower() == "true":
+                    stats["js"] += 1
+                else:
+                    stats["static"] += 1
+
+    def log_message(self, format, *args):
+        # One line per request would drown the scraper's own output
+        if STATE["settings"].get("verbose"):
+            super().log_message(format, *args)
+
+
+def reset_stats():
+    """
+    Start counting from zero (the benchmark calls this before every run).
+    """
+    with STATE["lock"]:
+        STATE["stats"] = new_stats()
+
+
+def get_stats():
+    """
+    A copy of the request counters.
+    """
+    with STATE["lock"]:
+        stats = dict(STATE["stats"])
+        stats["by_status"] = dict(stats["by_status"])
+        stats["latencies"] = list(stats["latencies"])
+    return stats
+
+
+def start_server(settings, port=0, articles_dir=ARTICLES_DIR, body_limit=None):
+    """
+    Start the stand-in server in a background thread.
+
+    PARAMETERS:
+    - settings: Dictionary with latency, latency_median, latency_spread,
+      js_factor, rate_429, rate_500, max_concurrent, retry_after
+    - port: Port to listen on (0 = any free port)
+    - articles_dir: Where to find pages to replay
+    - body_limit: Load at most this many pages (None = all)
+
+    RETURNS:
+    - The server (server.server_address[1] is the port)
+    """
+    STATE["settings"] = settings
+    STATE["bodies"] = load_bodies(articles_dir, limit=body_limit)
+    STATE["body_list"] = list(STATE["bodies"].values())
+    reset_stats()
+
+    if STATE["body_list"]:
+        print(f"[INFO] Replaying {len(STATE['body_list'])} saved pages from {articles_dir}")
+    else:
+        print("[INFO] No saved articles found, answering with generated pages")
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), StandinHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def add_settings_arguments(parser):
+    """
+    Command line options for the simulated behaviour (shared with the benchmark).
+    """
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default=DEFAULT_LATENCY,
+                        help=f"Latency distribution (default: {DEFAULT_LATENCY})")
+    parser.add_argument("--latency-median", type=float, default=DEFAULT_LATENCY_MEDIAN,
+                        help=f"Median seconds per static request (default: {DEFAULT_LATENCY_MEDIAN})")
+    parser.add_argument("--latency-spread", type=float, default=DEFAULT_LATENCY_SPREAD,
+                        help=f"lognormal sigma / uniform +-share (default: {DEFAULT_LATENCY_SPREAD})")
+    parser.add_argument("--js-factor", type=float, default=DEFAULT_JS_FACTOR,
+                        help=f"render_js=true is this many times slower (default: {DEFAULT_JS_FACTOR})")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of requests answered 429 (e.g. 0.05)")
+    parser.add_argument("--rate-500", type=float, default=0.0, help="Share of requests answered 500 (e.g. 0.02)")
+    parser.add_argument("--max-concurrent", type=int, default=0,
+                        help="Plan limit: requests above this many in flight get 429 (0 = no limit)")
+    parser.add_argument("--retry-after", type=int, default=DEFAULT_RETRY_AFTER,
+                        help=f"Retry-After seconds sent with 429 (default: {DEFAULT_RETRY_AFTER})")
+
+
+def settings_from_args(args):
+    """
+    Turn the parsed command line options into a settings dictionary.
+    """
+    return {
+        "latency": args.latency,
+        "latency_median": args.latency_median,
+        "latency_spread": args.latency_spread,
+        "js_factor": args.js_factor,
+        "rate_429": args.rate_429,
+        "rate_500": args.rate_500,
+        "max_concurrent": args.max_concurrent,
+        "retry_after": args.retry_after,
+        "verbose": getattr(args, "verbose", False),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the ScrapingBee API")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument("--articles-dir", type=str, default=str(ARTICLES_DIR), help="Saved articles to replay")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_server(settings_from_args(args), args.port, args.articles_dir)
+    print(f"[INFO] ScrapingBee stand-in listening on http://127.0.0.1:{server.server_address[1]}/api/v1")
+    print("[INFO] Press Ctrl+C to stop")
+
+    try:
+        while True:
+            time.sleep(10)
+            stats = get_stats()
+            print(f"[INFO] {stats['requests']} requests so far, by status: {stats['by_status']}")
+    except KeyboardInterrupt:
+        server.shutdown()
+        print("\n[INFO] Stopped")
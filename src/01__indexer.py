@@ -14,6 +14,60 @@ WHAT IT DOES:
 HOW TO RUN:
     python 01__indexer.py
 
+    # Download all feeds at the same time (much faster)
+    python 01__indexer.py --async
+
+    # Tune the async mode
+    python 01__indexer.py --async --max-concurrency 20 --per-host-limit 2 --timeout 15
+
+    # Ignore the feed cache and download every feed in full
+    python 01__indexer.py --no-cache
+
+    # Save every entry, even the ones we already saved in an earlier run
+    python 01__indexer.py --emit-all
+
+    # Keep running and poll each feed as often as it actually publishes
+    python 01__indexer.py --daemon
+
+    # Store every feed field in the JSONL files (old behaviour)
+    python 01__indexer.py --projection full
+
+FEED CACHE:
+    data/state/feed_cache.json remembers the ETag, Last-Modified and a hash
+    of each feed's XML. Next time we send a conditional request; if the
+    server answers "304 Not Modified" (or sends the exact same XML) we skip
+    parsing and do NOT write a new JSONL file for that feed.
+
+LINK INDEX:
+    data/state/link_index.sqlite remembers every link each feed already saved
+    (see link_index.py). Each run only writes NEW entries, plus entries
+    whose "updated" field changed (marked with "is_update": true). A link
+    found by two overlapping feeds is saved once per feed.
+
+LEAN RECORDS (--projection lean, the default):
+    The JSONL files only keep a compact core record per entry: source, title,
+    link, dates (including "published_ts", a Unix timestamp, and
+    "published_date", YYYY-MM-DD, resolved once here), a short plain-text
+    summary, author, normalized tags and the fingerprint. The bulky feed fields
+    (media_content, media_thumbnail, content, authors and the full summary
+    HTML) go to a side table in data/link_store/<SOURCE>.sqlite, which is only
+    read when a cleaner or report actually needs them (link_store.load_payload).
+
+DAEMON MODE:
+    Instead of polling every feed once, --daemon keeps running. For each feed
+    it learns how often new entries appear (from the entries' publication
+    dates) and schedules the next poll accordingly: a busy feed like
+    RTP_NOTICIAS every few minutes, a weekly trade magazine a few times a day.
+    Quiet feeds and failing feeds back off; a little random jitter keeps
+    feeds on the same website from being polled at the same moment.
+    The schedule is saved in data/state/feed_schedule.json.
+
+RUN LOG:
+    Every poll of every feed appends one line to data/state/indexer_runs.jsonl
+    with its timings (DNS, connect + server wait, download, parse), bytes,
+    entries seen / new / stale and the error class if it failed.
+    See which feeds are slow or broken with:  python src/feed_stats.py
+
 OUTPUT:
     data/links/20260101_150700_PUBLICO.jsonl
     data/links/20260101_150700_EXPRESSO.jsonl
@@ -26,16 +80,34 @@ OUTPUT:
 # We import the libraries we need at the top of the file
 
 import feedparser  # Library to parse RSS feeds (pip install feedparser)
+import requests    # Library to make HTTP requests (pip install requests)
+import asyncio     # Built-in library to run many downloads at the same time
+import html        # Built-in library to decode HTML entities (&amp; etc.)
+import re          # Built-in library for regular expressions
+import calendar    # Built-in library to convert feed dates to timestamps
 import hashlib     # Built-in library to create unique fingerprints (hashes)
 import json        # Built-in library to work with JSON data
 import os          # Built-in library to work with files and folders
+import random      # Built-in library for the daemon's jitter
+import socket      # Built-in library, used to time the DNS lookup
+import time        # Built-in library to measure how long things take
+from concurrent.futures import ThreadPoolExecutor  # Runs blocking downloads in the background
 from datetime import datetime  # Built-in library to work with dates and times
+from urllib.parse import urlparse  # Built-in library to split URLs into parts
 
 import argparse    # Built-in library for command line arguments
+import sys         # Built-in library to adjust the import path
 
 # Import our feed configuration from Step 0
 from importlib.machinery import SourceFileLoader
 
+# Make sure we can import our helper modules from src/
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import link_index  # Cross-run index of links we already saved (link_index.py)
+import link_store  # Per-source store, also holds the heavy feed payloads (link_store.py)
+import date_utils  # Shared, cached date parser (date_utils.py)
+import feed_stats  # Per-feed timing / health run log (feed_stats.py)
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -43,6 +115,47 @@ from importlib.machinery import SourceFileLoader
 # Where to save the output files
 OUTPUT_DIR = "data/links"
 
+# Async mode settings (used with --async)
+# - ASYNC_MAX_CONCURRENCY: how many feeds we download at the same time
+# - ASYNC_PER_HOST_LIMIT: how many downloads we allow against the SAME website
+#   (several feeds live on feeds.feedburner.com, we don't want to hammer it)
+# - FEED_TIMEOUT_SECONDS: give up on a single feed after this many seconds
+ASYNC_MAX_CONCURRENCY = 16
+ASYNC_PER_HOST_LIMIT = 2
+FEED_TIMEOUT_SECONDS = 20
+
+# Which fields we keep in the JSONL files
+# - "lean": compact core record, heavy fields go to the link store side table
+# - "full": every field from the feed (old behaviour)
+PROJECTION = "lean"
+
+# Lean records keep this many characters of plain-text summary
+SUMMARY_MAX_CHARS = 300
+
+# Fields that only live in the side table in lean mode
+HEAVY_FIELDS = ["summary", "authors", "media_content", "media_thumbnail", "content"]
+
+# Where we remember ETag / Last-Modified / body hash of every feed
+FEED_CACHE_FILE = "data/state/feed_cache.json"
+
+# Daemon mode settings (used with --daemon)
+# - Poll a feed at most every DAEMON_MIN_INTERVAL and at least every DAEMON_MAX_INTERVAL
+# - We aim for POLLS_PER_NEW_ENTRY polls per expected new entry (2 = poll twice
+#   as often as the feed publishes, so a new entry waits half a gap on average)
+# - Quiet polls (nothing new) stretch the interval by DAEMON_QUIET_BACKOFF
+# - Failed polls double the wait, up to DAEMON_MAX_INTERVAL
+# - DAEMON_JITTER spreads polls by +/- 10% so they don't line up
+SCHEDULE_FILE = "data/state/feed_schedule.json"
+DAEMON_MIN_INTERVAL = 5 * 60          # 5 minutes
+DAEMON_MAX_INTERVAL = 12 * 60 * 60    # 12 hours
+DAEMON_START_INTERVAL = 30 * 60       # 30 minutes for feeds we know nothing about
+POLLS_PER_NEW_ENTRY = 2
+DAEMON_QUIET_BACKOFF = 1.25
+DAEMON_JITTER = 0.10
+
+# Some feeds block the default "python-requests" user agent
+USER_AGENT = "Mozilla/5.0 (compatible; TourismRAGIndexer/1.0; +https://feedparser.readthedocs.io)"
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -94,36 +207,48 @@ def create_fingerprint(title, link, published):
     return fingerprint
 
 
-def is_article_fresh(published_parsed, max_age_days=90):
+def is_article_fresh(published_ts, max_age_days=90):
     """
     Check if an article is fresh enough to be indexed.
     
     PARAMETERS:
-    - published_parsed: time.struct_time object from feedparser
+    - published_ts: Publication time as a Unix timestamp (or None)
     - max_age_days: Maximum age in days (default: 90)
     
     RETURNS:
     - True if fresh (or no date), False if too old
     """
-    if not published_parsed:
+    if published_ts is None:
         return True # Keep if no date allowed (or assume fresh)
-        
-    # Convert struct_time to datetime
-    try:
-        dt_pub = datetime(*published_parsed[:6])
-        dt_now = datetime.now()
-        delta = dt_now - dt_pub
-        
-        if delta.days > max_age_days:
-            return False
-            
-        return True
-    except Exception as e:
-        print(f"[WARNING] Date parsing error: {e}. Defaulting to 'fresh'.")
-        return True # Fallback: keep on error
+    
+    # A plain integer comparison - the date was parsed once already
+    return published_ts >= date_utils.days_ago_epoch(max_age_days)
 
 
-def parse_feed(feed_name, feed_url, max_age_days=90):
+def get_entry_epoch(entry):
+    """
+    Resolve the publication time of a feed entry ONCE, as a Unix timestamp (UTC).
+    
+    1. feedparser usually parsed the date already ("published_parsed", UTC)
+    2. Otherwise we try the raw strings with the shared parser in date_utils.py
+    
+    RETURNS:
+    - An integer epoch, or None if the entry has no usable date
+    """
+    parsed_date = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed_date:
+        try:
+            return calendar.timegm(parsed_date)
+        except Exception:
+            pass
+    
+    epoch = date_utils.parse_date_to_epoch(entry.get("published"))
+    if epoch is None:
+        epoch = date_utils.parse_date_to_epoch(entry.get("updated"))
+    return epoch
+
+
+def parse_feed(feed_name, feed_url, max_age_days=90, feed_cache=None, stats=None):
     """
     Download and parse an RSS feed.
     
@@ -131,32 +256,111 @@ def parse_feed(feed_name, feed_url, max_age_days=90):
     - feed_name: The name of the feed (e.g., "PUBLICO")
     - feed_url: The URL of the RSS feed
     - max_age_days: Skip articles older than this (default: 90)
+    - feed_cache: The cache from load_feed_cache() (optional).
+      If given, we send a conditional request and skip unchanged feeds.
+    - stats: This feed's run log record from feed_stats.new_feed_stats() (optional)
     
     RETURNS:
     - A list of dictionaries, each containing article data
+    - None if the feed has not changed since the last run
     """
     print(f"[INFO] Parsing feed: {feed_name}")
     print(f"[INFO]   URL: {feed_url}")
     
-    # Step 1: Download and parse the RSS feed
+    # Step 1: Download the RSS feed
+    # (a conditional request if we know the feed from a previous run)
+    cache_entry = None
+    if feed_cache is not None:
+        cache_entry = feed_cache.get(feed_name)
+    
+    response = download_feed(feed_url, cache_entry=cache_entry)
+    record_download_stats(stats, response)
+    
+    if response["status_code"] >= 400:
+        raise Exception(f"HTTP {response['status_code']}")
+    
+    # Step 2: Skip unchanged feeds, otherwise parse the XML
     # feedparser does all the hard work for us!
-    feed = feedparser.parse(feed_url)
+    return process_downloaded_feed(feed_name, response, max_age_days, feed_cache, stats)
+
+
+def process_downloaded_feed(feed_name, response, max_age_days, feed_cache, stats=None):
+    """
+    Parse a downloaded feed, unless the feed cache says it has not changed.
+    
+    Shared by the normal mode and the async mode.
+    
+    PARAMETERS:
+    - feed_name: The name of the feed (e.g., "PUBLICO")
+    - response: The dictionary returned by download_feed()
+    - max_age_days: Skip articles older than this
+    - feed_cache: The cache from load_feed_cache(), or None to disable it
+    - stats: This feed's run log record (optional)
+    
+    RETURNS:
+    - A list of article dictionaries, or None if the feed is unchanged
+    """
+    # Step 1: Check the cache
+    if feed_cache is not None:
+        if is_feed_unchanged(feed_name, response, feed_cache):
+            if stats is not None:
+                stats["status"] = "unchanged"
+            return None
+        update_feed_cache(feed_name, response, feed_cache)
+    
+    # Step 2: Parse the XML we downloaded
+    parse_start = time.time()
+    feed = feedparser.parse(response["body"])
+    articles = extract_articles(feed_name, feed, max_age_days, stats)
+    
+    if stats is not None:
+        stats["parse_seconds"] = round(time.time() - parse_start, 4)
+        # A 200 answer that is not a feed (e.g. an HTML error page)
+        if feed.bozo and not feed.entries:
+            stats["status"] = "error"
+            stats["error_class"] = "parse"
+            stats["error"] = str(feed.get("bozo_exception", "Not a valid feed"))
+    
+    return articles
+
+
+def extract_articles(feed_name, feed, max_age_days=90, stats=None):
+    """
+    Turn a parsed feed (from feedparser) into a list of article dictionaries.
+    
+    This is shared by the normal (one feed at a time) mode and the async mode,
+    which downloads the XML itself and only asks feedparser to parse the bytes.
+    
+    PARAMETERS:
+    - feed_name: The name of the feed (e.g., "PUBLICO")
+    - feed: The object returned by feedparser.parse()
+    - max_age_days: Skip articles older than this (default: 90)
+    - stats: This feed's run log record (optional), gets the entry counts
+    
+    RETURNS:
+    - A list of dictionaries, each containing article data
+    """
+    if stats is not None:
+        stats["entries_seen"] = len(feed.entries)
     
-    # Step 2: Check if the feed has any entries
+    # Step 1: Check if the feed has any entries
     if not feed.entries:
         print(f"[WARNING] No entries found in feed: {feed_name}")
         return []
     
     print(f"[INFO]   Found {len(feed.entries)} entries")
     
-    # Step 3: Extract ALL available data from each entry
+    # Step 2: Extract ALL available data from each entry
     # Different feeds have different fields, so we capture everything!
     articles = []
     skipped_count = 0
     
     for entry in feed.entries:
+        # Resolve the publication time once (canonical UTC epoch)
+        published_ts = get_entry_epoch(entry)
+        
         # Check freshness first
-        if not is_article_fresh(entry.get("published_parsed"), max_age_days):
+        if not is_article_fresh(published_ts, max_age_days):
             skipped_count += 1
             continue
 
@@ -201,6 +405,8 @@ def parse_feed(feed_name, feed_url, max_age_days=90):
             "title": title,
             "link": link,
             "published": published,
+            "published_ts": published_ts,
+            "published_date": date_utils.epoch_to_iso_date(published_ts),
             "summary": summary,
             "author": author,
             "authors": authors,
@@ -216,12 +422,522 @@ def parse_feed(feed_name, feed_url, max_age_days=90):
         
         articles.append(article)
     
+    if stats is not None:
+        stats["entries_stale"] = skipped_count
+    
     if skipped_count > 0:
         print(f"[INFO]   Skipped {skipped_count} stale articles (> {max_age_days} days old)")
         
     return articles
 
 
+def download_feed(feed_url, timeout=FEED_TIMEOUT_SECONDS, cache_entry=None):
+    """
+    Download the raw RSS/Atom XML of a feed (blocking).
+    
+    We download the bytes ourselves (instead of letting feedparser do it)
+    so the async mode can run many downloads in parallel and so we can send
+    conditional requests (If-None-Match / If-Modified-Since).
+    
+    PARAMETERS:
+    - feed_url: The URL of the RSS feed
+    - timeout: Seconds to wait for the server before giving up
+    - cache_entry: This feed's entry from the feed cache (optional)
+    
+    RETURNS:
+    - A dictionary with "status_code", "body" (bytes), "etag", "last_modified"
+      and the timings "dns_seconds" (None if the lookup failed),
+      "headers_seconds", "download_seconds"
+    """
+    headers = {"User-Agent": USER_AGENT}
+    
+    # Ask the server to answer "304 Not Modified" if nothing changed
+    if cache_entry:
+        if cache_entry.get("etag"):
+            headers["If-None-Match"] = cache_entry["etag"]
+        if cache_entry.get("last_modified"):
+            headers["If-Modified-Since"] = cache_entry["last_modified"]
+    
+    # Time the DNS lookup on its own (the system caches the answer,
+    # so requests does not look it up a second time). This is only for the
+    # run log: if it fails we record None and let requests try (and report
+    # the real error) itself.
+    url_parts = urlparse(feed_url)
+    default_port = 443 if url_parts.scheme == "https" else 80
+    dns_seconds = None
+    try:
+        dns_start = time.time()
+        socket.getaddrinfo(url_parts.hostname, url_parts.port or default_port)
+        dns_seconds = time.time() - dns_start
+    except (OSError, UnicodeError, ValueError):
+        pass
+    
+    # stream=True returns as soon as the headers arrive, so we can time
+    # "connect + server wait" and "download the body" separately
+    request_start = time.time()
+    response = requests.get(feed_url, headers=headers, timeout=timeout, stream=True)
+    headers_seconds = time.time() - request_start
+    
+    body = response.content
+    download_seconds = time.time() - request_start - headers_seconds
+    
+    return {
+        "status_code": response.status_code,
+        "body": body,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "dns_seconds": dns_seconds,
+        "headers_seconds": headers_seconds,
+        "download_seconds": download_seconds,
+    }
+
+
+def record_download_stats(stats, response):
+    """
+    Copy the HTTP status, size and timings of a download into a run log record.
+    """
+    if stats is None:
+        return
+    stats["http_status"] = response["status_code"]
+    stats["bytes"] = len(response["body"])
+    if response["dns_seconds"] is not None:
+        stats["dns_seconds"] = round(response["dns_seconds"], 4)
+    stats["headers_seconds"] = round(response["headers_seconds"], 4)
+    stats["download_seconds"] = round(response["download_seconds"], 4)
+
+
+def record_feed_error(stats, error):
+    """
+    Mark a run log record as failed, with the class of the error.
+    """
+    if stats is None:
+        return
+    stats["status"] = "error"
+    stats["error_class"] = feed_stats.classify_error(error, stats["http_status"])
+    stats["error"] = str(error)
+
+
+def finish_feed_stats(stats, seconds):
+    """
+    Set the total time of a run log record and its final status.
+    
+    Status is one of: new, nothing_new, unchanged, error
+    """
+    if stats is None:
+        return
+    stats["total_seconds"] = round(seconds, 4)
+    if stats["status"] is None:
+        if stats["entries_new"] or stats["entries_updated"]:
+            stats["status"] = "new"
+        else:
+            stats["status"] = "nothing_new"
+
+
+def load_feed_cache(cache_file=FEED_CACHE_FILE):
+    """
+    Load the feed cache (ETag, Last-Modified and body hash per feed).
+    
+    RETURNS:
+    - A dictionary { feed_name: { "etag": ..., "last_modified": ..., "body_hash": ... } }
+      (empty if the file does not exist yet)
+    """
+    if not os.path.exists(cache_file):
+        print(f"[INFO] No feed cache yet ({cache_file}), downloading every feed in full")
+        return {}
+    
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        print(f"[INFO] Loaded feed cache for {len(cache)} feeds")
+        return cache
+    except Exception as e:
+        print(f"[WARNING] Could not read feed cache ({e}), starting fresh")
+        return {}
+
+
+def save_feed_cache(cache, cache_file=FEED_CACHE_FILE):
+    """
+    Save the feed cache to disk.
+    
+    We write to a temporary file first and then rename it, so a crash in
+    the middle of writing never leaves a broken cache behind.
+    """
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    
+    temp_file = cache_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+    os.replace(temp_file, cache_file)
+    
+    print(f"[INFO] Saved feed cache for {len(cache)} feeds to {cache_file}")
+
+
+def is_feed_unchanged(feed_name, response, feed_cache):
+    """
+    Decide if a downloaded feed is the same as last time.
+    
+    A feed is unchanged if:
+    - The server answered 304 Not Modified, or
+    - The XML body has exactly the same SHA-256 hash as last time
+      (many servers ignore conditional headers)
+    
+    RETURNS:
+    - True if unchanged (skip parsing and saving), False otherwise
+    """
+    cache_entry = feed_cache.get(feed_name)
+    
+    if response["status_code"] == 304:
+        print(f"[INFO]   Not modified (304), skipping")
+        if cache_entry:
+            cache_entry["checked_at"] = datetime.now().isoformat()
+        return True
+    
+    if not cache_entry:
+        return False
+    
+    body_hash = hashlib.sha256(response["body"]).hexdigest()
+    if body_hash == cache_entry.get("body_hash"):
+        print(f"[INFO]   Same content as last run, skipping")
+        # Keep the validators the server sent THIS time: some servers rotate
+        # the ETag / Last-Modified and only answer 304 to the newest ones
+        cache_entry["etag"] = response.get("etag")
+        cache_entry["last_modified"] = response.get("last_modified")
+        cache_entry["checked_at"] = datetime.now().isoformat()
+        return True
+    
+    return False
+
+
+def forget_feed(feed_name, feed_cache):
+    """
+    Drop a feed from the cache after a failure.
+    
+    If parsing or saving failed AFTER we stored the new validators, the next
+    run would think the feed is unchanged and we would lose its articles.
+    Forgetting the feed simply means a full download next time.
+    """
+    if feed_cache is not None and feed_name in feed_cache:
+        del feed_cache[feed_name]
+
+
+def update_feed_cache(feed_name, response, feed_cache):
+    """
+    Remember the validators of a feed we just downloaded in full.
+    """
+    now = datetime.now().isoformat()
+    feed_cache[feed_name] = {
+        "etag": response.get("etag"),
+        "last_modified": response.get("last_modified"),
+        "body_hash": hashlib.sha256(response["body"]).hexdigest(),
+        "checked_at": now,
+        "changed_at": now,
+    }
+
+
+async def fetch_feed_async(feed, executor, global_limit, host_limits, timeout, cache_entry=None, stats=None):
+    """
+    Download one feed without blocking the other downloads.
+    
+    HOW THE LIMITS WORK:
+    - host_limits[host] allows only a few downloads per website at a time
+    - global_limit caps the total number of downloads in flight
+    - asyncio.wait_for() gives up on the feed after "timeout" seconds
+    
+    We wait for the per-host slot FIRST, so a feed that is queued behind
+    its own website does not sit on one of the global slots.
+    
+    PARAMETERS:
+    - feed: Dictionary with "name" and "url"
+    - executor: ThreadPoolExecutor that runs the blocking requests.get()
+    - global_limit: asyncio.Semaphore for the whole run
+    - host_limits: Dictionary { host: asyncio.Semaphore }
+    - timeout: Seconds before the feed is abandoned
+    - cache_entry: This feed's entry from the feed cache (optional)
+    - stats: This feed's run log record (optional)
+    
+    RETURNS:
+    - A dictionary with the feed, the download_feed() response (or None) and timing
+    """
+    feed_name = feed["name"]
+    feed_url = feed["url"]
+    host = urlparse(feed_url).netloc.lower()
+    
+    result = {
+        "feed": feed,
+        "response": None,
+        "error": None,
+        "seconds": 0.0,
+        "stats": stats,
+    }
+    
+    async with host_limits[host]:
+        async with global_limit:
+            loop = asyncio.get_running_loop()
+            start = time.time()
+            
+            try:
+                # Run the blocking download in a background thread
+                download = loop.run_in_executor(executor, download_feed, feed_url, timeout, cache_entry)
+                response = await asyncio.wait_for(download, timeout=timeout)
+                record_download_stats(stats, response)
+                
+                if response["status_code"] >= 400:
+                    result["error"] = f"HTTP {response['status_code']}"
+                    record_feed_error(stats, result["error"])
+                else:
+                    result["response"] = response
+                    
+            except asyncio.TimeoutError:
+                result["error"] = f"Timed out after {timeout}s"
+                record_feed_error(stats, asyncio.TimeoutError(result["error"]))
+            except Exception as e:
+                result["error"] = str(e)
+                record_feed_error(stats, e)
+            
+            result["seconds"] = time.time() - start
+    
+    if result["error"]:
+        print(f"[WARNING] {feed_name}: download failed ({result['error']})")
+    else:
+        print(f"[INFO] {feed_name}: HTTP {result['response']['status_code']}, "
+              f"{len(result['response']['body'])} bytes in {result['seconds']:.1f}s")
+    
+    return result
+
+
+async def index_feeds_async(feeds, max_age_days, max_concurrency, per_host_limit, timeout, feed_cache=None, index_db=None, run_stats=None):
+    """
+    Download all feeds concurrently, then parse and save each one as soon
+    as its download finishes.
+    
+    WHY:
+    - In the normal mode one slow feed holds up every feed after it
+    - Here the total time is roughly the time of the SLOWEST feed,
+      not the sum of all feeds
+    
+    PARAMETERS:
+    - feeds: List of feed dictionaries from 00__rss_feeds.py
+    - max_age_days: Skip articles older than this
+    - max_concurrency: Maximum downloads in flight
+    - per_host_limit: Maximum downloads in flight per website
+    - timeout: Seconds before a single feed is abandoned
+    - feed_cache: The cache from load_feed_cache(), or None to disable it
+    - index_db: The link index from link_index.open_link_index(), or None
+    - run_stats: List that receives one run log record per feed (optional)
+    
+    RETURNS:
+    - A tuple (saved_files, total_articles, failed_feeds, unchanged_feeds)
+    """
+    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Step 1: Create the limits
+    global_limit = asyncio.Semaphore(max_concurrency)
+    host_limits = {}
+    for feed in feeds:
+        host = urlparse(feed["url"]).netloc.lower()
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(per_host_limit)
+    
+    print(f"[INFO] Async mode: {max_concurrency} downloads at once, "
+          f"{per_host_limit} per host, {timeout}s timeout per feed")
+    print(f"[INFO] {len(feeds)} feeds across {len(host_limits)} hosts")
+    print()
+    
+    saved_files = []
+    total_articles = 0
+    failed_feeds = []
+    unchanged_feeds = []
+    
+    # Step 2: Start every download and handle them in the order they finish
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        tasks = []
+        for feed in feeds:
+            cache_entry = None
+            if feed_cache is not None:
+                cache_entry = feed_cache.get(feed["name"])
+            stats = None
+            if run_stats is not None:
+                stats = feed_stats.new_feed_stats(feed, run_id, "async")
+            tasks.append(fetch_feed_async(feed, executor, global_limit, host_limits, timeout, cache_entry, stats))
+        
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            feed_name = result["feed"]["name"]
+            stats = result["stats"]
+            
+            if result["error"]:
+                failed_feeds.append(feed_name)
+                finish_feed_stats(stats, result["seconds"])
+                if stats is not None:
+                    run_stats.append(stats)
+                continue
+            
+            # Step 3: Parse the downloaded bytes and save the articles
+            process_start = time.time()
+            try:
+                print(f"[INFO] Parsing feed: {feed_name}")
+                articles = process_downloaded_feed(feed_name, result["response"], max_age_days, feed_cache, stats)
+                
+                if articles is None:
+                    unchanged_feeds.append(feed_name)
+                elif articles:
+                    filepath, saved_count = save_feed_articles(articles, feed_name, index_db, stats)
+                    if filepath:
+                        saved_files.append(filepath)
+                        total_articles += saved_count
+                print()
+                
+            except Exception as e:
+                print(f"[ERROR] Failed to process {feed_name}: {e}")
+                print()
+                failed_feeds.append(feed_name)
+                forget_feed(feed_name, feed_cache)
+                record_feed_error(stats, e)
+            
+            finish_feed_stats(stats, result["seconds"] + time.time() - process_start)
+            if stats is not None:
+                run_stats.append(stats)
+    finally:
+        # Don't wait for abandoned (timed out) downloads to finish
+        executor.shutdown(wait=False)
+    
+    return saved_files, total_articles, failed_feeds, unchanged_feeds
+
+
+def strip_html(text):
+    """
+    Turn a bit of feed HTML into plain text ("<p>Hello &amp; bye</p>" -> "Hello & bye").
+    """
+    if not text:
+        return ""
+    text = re.sub(r"<[^>]+>", " ", str(text))
+    text = html.unescape(text)
+    return " ".join(text.split())
+
+
+def normalize_tags(tags):
+    """
+    Clean a list of tags: strip spaces, drop empty ones and duplicates (keeping order).
+    """
+    normalized = []
+    for tag in tags or []:
+        tag = " ".join(str(tag).split())
+        if tag and tag not in normalized:
+            normalized.append(tag)
+    return normalized
+
+
+def project_article(article, projection):
+    """
+    Split an article into the record we save in the JSONL file and the
+    heavy payload we keep on the side.
+    
+    PARAMETERS:
+    - article: The full article dictionary from extract_articles()
+    - projection: "lean" or "full"
+    
+    RETURNS:
+    - A tuple (record, payload)
+      payload is None in "full" mode or if there was nothing heavy to keep
+    """
+    if projection == "full":
+        return article, None
+    
+    # Step 1: Collect the heavy fields
+    payload = {}
+    for field in HEAVY_FIELDS:
+        if article.get(field):
+            payload[field] = article[field]
+    
+    # Step 2: Build the compact core record
+    summary = strip_html(article.get("summary"))
+    if len(summary) > SUMMARY_MAX_CHARS:
+        summary = summary[:SUMMARY_MAX_CHARS].rsplit(" ", 1)[0] + "..."
+    
+    record = {
+        "source": article["source"],
+        "title": article["title"],
+        "link": article["link"],
+        "published": article["published"],
+        "published_ts": article["published_ts"],
+        "published_date": article["published_date"],
+        "updated": article["updated"],
+        "summary": summary,
+        "author": article["author"],
+        "tags": normalize_tags(article["tags"]),
+        "feed_id": article["feed_id"],
+        "fingerprint": article["fingerprint"],
+        "indexed_at": article["indexed_at"],
+        "has_payload": bool(payload),
+    }
+    
+    # Keep the link-index flag for updated entries
+    if article.get("is_update"):
+        record["is_update"] = True
+    
+    if not payload:
+        return record, None
+    return record, payload
+
+
+def save_feed_articles(articles, feed_name, index_db, stats=None):
+    """
+    Save only the articles we have not saved before.
+    
+    The link index tells us which entries are new, which were updated in
+    the feed (their "updated" field changed) and which we already have.
+    Only new + updated entries go into the JSONL file.
+    
+    PARAMETERS:
+    - articles: List of article dictionaries from the feed
+    - feed_name: Name of the feed
+    - index_db: The link index, or None to save everything (--emit-all)
+    - stats: This feed's run log record (optional), gets the new/updated counts
+    
+    RETURNS:
+    - A tuple (filepath or None, number of articles saved)
+    """
+    # Step 1: Keep only unseen (or updated) entries
+    if index_db is not None:
+        new_articles, updated_articles, seen_articles = link_index.split_new_articles(index_db, articles)
+        print(f"[INFO]   New: {len(new_articles)}, updated: {len(updated_articles)}, already seen: {len(seen_articles)}")
+        articles = new_articles + updated_articles
+        if stats is not None:
+            stats["entries_new"] = len(new_articles)
+            stats["entries_updated"] = len(updated_articles)
+    elif stats is not None:
+        stats["entries_new"] = len(articles)
+    
+    if not articles:
+        print(f"[INFO]   Nothing new to save")
+        if index_db is not None:
+            link_index.touch_articles(index_db, seen_articles)
+        return None, 0
+    
+    # Step 2: Project to lean records, keeping the heavy fields on the side
+    records = []
+    payloads = []
+    for article in articles:
+        record, payload = project_article(article, PROJECTION)
+        records.append(record)
+        if payload:
+            payloads.append((article["link"], payload))
+    
+    if payloads:
+        link_store.save_payloads(feed_name, payloads)
+    
+    # Step 3: Write the JSONL file
+    filepath = save_to_jsonl(records, feed_name, OUTPUT_DIR)
+    
+    # Step 4: Only now remember them (a crash before this re-emits, never loses)
+    if index_db is not None:
+        link_index.remember_articles(index_db, articles)
+        link_index.touch_articles(index_db, seen_articles)
+    
+    return filepath, len(articles)
+
+
 def save_to_jsonl(articles, feed_name, output_dir):
     """
     Save articles to a JSONL file.
@@ -254,20 +970,288 @@ def save_to_jsonl(articles, feed_name, output_dir):
     filepath = os.path.join(source_dir, filename)
     
     # Step 3: Write each article as a JSON line
+    # (to a temporary file first, then renamed: link_store.py compacts and
+    # deletes *.jsonl files, possibly while the daemon is running, so it
+    # must never see a half-written one)
     print(f"[INFO]   Saving to: {filepath}")
     
-    with open(filepath, "w", encoding="utf-8") as f:
+    temp_path = filepath + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
         for article in articles:
             # Convert the dictionary to a JSON string
             json_line = json.dumps(article, ensure_ascii=False)
             # Write the line followed by a newline character
             f.write(json_line + "\n")
+    os.replace(temp_path, filepath)
     
     print(f"[INFO]   Saved {len(articles)} articles")
     
     return filepath
 
 
+# =============================================================================
+# DAEMON MODE (adaptive polling)
+# =============================================================================
+
+def load_schedule(schedule_file=SCHEDULE_FILE):
+    """
+    Load the per-feed polling schedule.
+    
+    RETURNS:
+    - A dictionary { feed_name: { "interval": seconds, "next_poll_at": epoch, ... } }
+    """
+    if not os.path.exists(schedule_file):
+        return {}
+    
+    try:
+        with open(schedule_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARNING] Could not read schedule ({e}), starting fresh")
+        return {}
+
+
+def save_schedule(schedule, schedule_file=SCHEDULE_FILE):
+    """
+    Save the per-feed polling schedule (temp file + rename, crash-safe).
+    """
+    os.makedirs(os.path.dirname(schedule_file), exist_ok=True)
+    
+    temp_file = schedule_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(schedule, f, indent=2)
+    os.replace(temp_file, schedule_file)
+
+
+def get_entry_timestamps(feed):
+    """
+    Get the publication time (Unix epoch, UTC) of every entry in a parsed feed.
+    
+    RETURNS:
+    - A list of integers (entries without a date are skipped)
+    """
+    timestamps = []
+    for entry in feed.entries:
+        epoch = get_entry_epoch(entry)
+        if epoch is not None:
+            timestamps.append(epoch)
+    return timestamps
+
+
+def estimate_publication_gap(timestamps):
+    """
+    Estimate how many seconds usually pass between two new entries of a feed.
+    
+    We sort the entry timestamps and take the MEDIAN gap between neighbours.
+    The median ignores the odd burst (10 entries at midnight) or the odd
+    weekend pause better than the average would.
+    
+    RETURNS:
+    - The typical gap in seconds, or None if there are fewer than 2 dated entries
+    """
+    unique = sorted(set(timestamps))
+    if len(unique) < 2:
+        return None
+    
+    gaps = []
+    for i in range(1, len(unique)):
+        gaps.append(unique[i] - unique[i - 1])
+    
+    gaps.sort()
+    return gaps[len(gaps) // 2]
+
+
+def clamp_interval(seconds, min_interval, max_interval):
+    """
+    Keep an interval between the minimum and maximum allowed values.
+    """
+    if seconds < min_interval:
+        return min_interval
+    if seconds > max_interval:
+        return max_interval
+    return seconds
+
+
+def update_feed_schedule(entry, poll, now, min_interval, max_interval):
+    """
+    Decide when to poll a feed next, based on what the last poll found.
+    
+    RULES:
+    1. Failed poll: keep the learned interval, but wait 2^failures times it
+    2. Dated entries: move the interval halfway towards gap / POLLS_PER_NEW_ENTRY
+       (halfway = smoothing, so one odd poll doesn't swing the schedule)
+    3. Nothing new: stretch the interval by DAEMON_QUIET_BACKOFF
+    4. Add +/- DAEMON_JITTER random jitter
+    
+    PARAMETERS:
+    - entry: This feed's schedule entry (updated in place)
+    - poll: The result from poll_feed_once()
+    - now: Current time (epoch seconds)
+    - min_interval / max_interval: Allowed range in seconds
+    """
+    interval = entry.get("interval", DAEMON_START_INTERVAL)
+    entry["last_poll_at"] = now
+    
+    if poll["status"] == "error":
+        entry["failures"] = entry.get("failures", 0) + 1
+        wait = interval * (2 ** entry["failures"])
+    else:
+        entry["failures"] = 0
+        
+        gap = estimate_publication_gap(poll["timestamps"])
+        if gap is not None:
+            entry["publication_gap"] = gap
+            target = clamp_interval(gap / POLLS_PER_NEW_ENTRY, min_interval, max_interval)
+            interval = (interval + target) / 2
+        
+        if poll["new_count"] == 0:
+            interval = interval * DAEMON_QUIET_BACKOFF
+        else:
+            entry["last_new_at"] = now
+        
+        interval = clamp_interval(interval, min_interval, max_interval)
+        wait = interval
+    
+    wait = clamp_interval(wait, min_interval, max_interval)
+    wait = wait * (1 + random.uniform(-DAEMON_JITTER, DAEMON_JITTER))
+    
+    entry["interval"] = interval
+    entry["next_poll_at"] = now + wait
+
+
+def poll_feed_once(feed, max_age_days, feed_cache, index_db, stats=None):
+    """
+    Poll one feed: download, skip if unchanged, parse, save new entries.
+    
+    "stats" is this poll's run log record (optional).
+    
+    RETURNS:
+    - A dictionary with:
+      "status": "new", "unchanged" or "error"
+      "new_count": number of entries saved
+      "timestamps": publication times of the entries in the feed
+    """
+    feed_name = feed["name"]
+    poll = {"status": "unchanged", "new_count": 0, "timestamps": []}
+    
+    try:
+        # Step 1: Download (conditional request if we have validators)
+        cache_entry = None
+        if feed_cache is not None:
+            cache_entry = feed_cache.get(feed_name)
+        response = download_feed(feed["url"], cache_entry=cache_entry)
+        record_download_stats(stats, response)
+        
+        if response["status_code"] >= 400:
+            raise Exception(f"HTTP {response['status_code']}")
+        
+        # Step 2: Skip unchanged feeds
+        if feed_cache is not None:
+            if is_feed_unchanged(feed_name, response, feed_cache):
+                if stats is not None:
+                    stats["status"] = "unchanged"
+                return poll
+            update_feed_cache(feed_name, response, feed_cache)
+        
+        # Step 3: Parse, learn the publication rate, save new entries
+        parse_start = time.time()
+        parsed = feedparser.parse(response["body"])
+        poll["timestamps"] = get_entry_timestamps(parsed)
+        
+        articles = extract_articles(feed_name, parsed, max_age_days, stats)
+        if stats is not None:
+            stats["parse_seconds"] = round(time.time() - parse_start, 4)
+        if articles:
+            filepath, saved_count = save_feed_articles(articles, feed_name, index_db, stats)
+            poll["new_count"] = saved_count
+            if saved_count:
+                poll["status"] = "new"
+    
+    except Exception as e:
+        print(f"[ERROR] Failed to poll {feed_name}: {e}")
+        forget_feed(feed_name, feed_cache)
+        record_feed_error(stats, e)
+        poll["status"] = "error"
+    
+    return poll
+
+
+def run_daemon(feeds, max_age_days, feed_cache, index_db, min_interval, max_interval):
+    """
+    Keep polling feeds forever, each on its own learned schedule.
+    
+    Stop with Ctrl+C; the schedule and feed cache are saved after every
+    round of polls, so a restart continues where we left off.
+    """
+    schedule = load_schedule()
+    now = time.time()
+    
+    # Step 1: New feeds get a random first poll within the next minute,
+    # so we don't start with a burst of 79 downloads
+    for feed in feeds:
+        if feed["name"] not in schedule:
+            schedule[feed["name"]] = {
+                "interval": DAEMON_START_INTERVAL,
+                "next_poll_at": now + random.uniform(0, 60),
+                "failures": 0,
+            }
+    
+    print(f"[INFO] Daemon mode: {len(feeds)} feeds, polling every "
+          f"{min_interval // 60}-{max_interval // 60} minutes depending on the feed")
+    print("[INFO] Press Ctrl+C to stop")
+    print()
+    
+    try:
+        while True:
+            # Step 2: Poll every feed that is due
+            now = time.time()
+            due_feeds = []
+            for feed in feeds:
+                if schedule[feed["name"]]["next_poll_at"] <= now:
+                    due_feeds.append(feed)
+            
+            run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            run_stats = []
+            for feed in due_feeds:
+                feed_name = feed["name"]
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Polling {feed_name}")
+                stats = feed_stats.new_feed_stats(feed, run_id, "daemon")
+                poll_start = time.time()
+                poll = poll_feed_once(feed, max_age_days, feed_cache, index_db, stats)
+                finish_feed_stats(stats, time.time() - poll_start)
+                run_stats.append(stats)
+                
+                entry = schedule[feed_name]
+                update_feed_schedule(entry, poll, time.time(), min_interval, max_interval)
+                print(f"[INFO]   {poll['status']}, {poll['new_count']} new -> "
+                      f"next poll in {(entry['next_poll_at'] - time.time()) / 60:.1f} min")
+            
+            if due_feeds:
+                feed_stats.append_run_log(run_stats)
+                save_schedule(schedule)
+                if feed_cache is not None:
+                    save_feed_cache(feed_cache)
+                print()
+            
+            # Step 3: Sleep until the next feed is due (check at least every minute,
+            # so feeds added to the schedule file by hand are picked up)
+            next_due = None
+            for feed in feeds:
+                due_at = schedule[feed["name"]]["next_poll_at"]
+                if next_due is None or due_at < next_due:
+                    next_due = due_at
+            
+            sleep_seconds = clamp_interval(next_due - time.time(), 1, 60)
+            time.sleep(sleep_seconds)
+    
+    except KeyboardInterrupt:
+        print()
+        print("[INFO] Stopping daemon, saving schedule...")
+        save_schedule(schedule)
+        if feed_cache is not None:
+            save_feed_cache(feed_cache)
+
+
 # =============================================================================
 # MAIN FUNCTION
 # =============================================================================
@@ -281,46 +1265,118 @@ def main():
     2. Parses each feed
     3. Saves the results to JSONL files
     """
+    global PROJECTION
+    
     parser = argparse.ArgumentParser(description="RSS Feed Indexer")
     parser.add_argument("--max-age-days", type=int, default=90, help="Skip articles older than X days (default: 90)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Download all feeds concurrently")
+    parser.add_argument("--max-concurrency", type=int, default=ASYNC_MAX_CONCURRENCY, help=f"Async mode: downloads in flight (default: {ASYNC_MAX_CONCURRENCY})")
+    parser.add_argument("--per-host-limit", type=int, default=ASYNC_PER_HOST_LIMIT, help=f"Async mode: downloads in flight per website (default: {ASYNC_PER_HOST_LIMIT})")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the feed cache and download every feed in full")
+    parser.add_argument("--emit-all", action="store_true", help="Save every entry, even links we already saved in an earlier run")
+    parser.add_argument("--projection", choices=["lean", "full"], default=PROJECTION, help=f"Fields to keep in the JSONL files (default: {PROJECTION})")
+    parser.add_argument("--daemon", action="store_true", help="Keep running and poll each feed on its own learned schedule")
+    parser.add_argument("--min-interval", type=int, default=DAEMON_MIN_INTERVAL, help=f"Daemon mode: shortest poll interval in seconds (default: {DAEMON_MIN_INTERVAL})")
+    parser.add_argument("--max-interval", type=int, default=DAEMON_MAX_INTERVAL, help=f"Daemon mode: longest poll interval in seconds (default: {DAEMON_MAX_INTERVAL})")
+    parser.add_argument("--timeout", type=int, default=FEED_TIMEOUT_SECONDS, help=f"Async mode: seconds before a feed is abandoned (default: {FEED_TIMEOUT_SECONDS})")
     args = parser.parse_args()
     
+    PROJECTION = args.projection
+    
     print("=" * 60)
     print(f"RSS FEED INDEXER - Starting (Max Age: {args.max_age_days} days)")
     print("=" * 60)
     print()
     
-    # Step 1: Load the feeds
+    # Step 1: Load the feeds (and the cache of what we saw last time)
     feeds = load_feeds()
     
+    feed_cache = None
+    if not args.no_cache:
+        feed_cache = load_feed_cache()
+    
+    index_db = None
+    if not args.emit_all:
+        index_db = link_index.open_link_index(seed_dir=OUTPUT_DIR)
+    
     print()
     print("-" * 60)
     print()
     
+    # Daemon mode runs until Ctrl+C and has its own logging
+    if args.daemon:
+        run_daemon(feeds, args.max_age_days, feed_cache, index_db, args.min_interval, args.max_interval)
+        if index_db is not None:
+            index_db.close()
+        return
+    
     # Step 2: Process each feed
     total_articles = 0
     saved_files = []
+    failed_feeds = []
+    unchanged_feeds = []
+    run_stats = []
+    run_start = time.time()
     
-    for feed in feeds:
-        feed_name = feed["name"]
-        feed_url = feed["url"]
-        
-        try:
-            # Parse the feed with max_age filtering
-            articles = parse_feed(feed_name, feed_url, max_age_days=args.max_age_days)
+    if args.use_async:
+        # All feeds at the same time
+        saved_files, total_articles, failed_feeds, unchanged_feeds = asyncio.run(
+            index_feeds_async(
+                feeds,
+                args.max_age_days,
+                args.max_concurrency,
+                args.per_host_limit,
+                args.timeout,
+                feed_cache,
+                index_db,
+                run_stats,
+            )
+        )
+    else:
+        # One feed after the other
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        for feed in feeds:
+            feed_name = feed["name"]
+            feed_url = feed["url"]
+            stats = feed_stats.new_feed_stats(feed, run_id, "sequential")
+            feed_start = time.time()
             
-            # Save to JSONL file (only if we have articles)
-            if articles:
-                filepath = save_to_jsonl(articles, feed_name, OUTPUT_DIR)
-                saved_files.append(filepath)
-                total_articles += len(articles)
+            try:
+                # Parse the feed with max_age filtering
+                articles = parse_feed(feed_name, feed_url, max_age_days=args.max_age_days, feed_cache=feed_cache, stats=stats)
+                
+                # Save to JSONL file (only if the feed changed and we have articles)
+                if articles is None:
+                    unchanged_feeds.append(feed_name)
+                elif articles:
+                    filepath, saved_count = save_feed_articles(articles, feed_name, index_db, stats)
+                    if filepath:
+                        saved_files.append(filepath)
+                        total_articles += saved_count
+                
+                print()
+                
+            except Exception as e:
+                # If something goes wrong, print the error and continue
+                print(f"[ERROR] Failed to process {feed_name}: {e}")
+                print()
+                failed_feeds.append(feed_name)
+                forget_feed(feed_name, feed_cache)
+                record_feed_error(stats, e)
             
-            print()
-            
-        except Exception as e:
-            # If something goes wrong, print the error and continue
-            print(f"[ERROR] Failed to process {feed_name}: {e}")
-            print()
+            finish_feed_stats(stats, time.time() - feed_start)
+            run_stats.append(stats)
+    
+    # Per-feed timings and health for feed_stats.py
+    feed_stats.append_run_log(run_stats)
+    
+    # Remember the validators for the next run
+    if feed_cache is not None:
+        save_feed_cache(feed_cache)
+        print()
+    
+    if index_db is not None:
+        index_db.close()
     
     # Step 3: Print summary
     print("-" * 60)
@@ -331,9 +1387,14 @@ def main():
     print()
     print(f"Total feeds processed: {len(feeds)}")
     print(f"Total files saved: {len(saved_files)}")
-    print(f"Total articles indexed: {total_articles}")
+    print(f"Unchanged feeds (skipped): {len(unchanged_feeds)}")
+    print(f"Total articles indexed (new or updated): {total_articles}")
+    print(f"Total time: {time.time() - run_start:.1f}s")
+    if failed_feeds:
+        print(f"Failed feeds ({len(failed_feeds)}): {', '.join(failed_feeds)}")
     print()
     print("Output directory:", OUTPUT_DIR)
+    print(f"Run log: {feed_stats.RUN_LOG_FILE} (summary: python src/feed_stats.py)")
     print()
 
 
@@ -5,7 +5,8 @@
 This script reads the JSONL files from Step 1 and scrapes the full article content.
 
 WHAT IT DOES:
-1. Reads the JSONL files from data/links/
+1. Streams the indexed links from data/link_store/ (compacted, see
+   link_store.py) and any newer JSONL files in data/links/
 2. For each article link, calls ScrapingBee API to get the content
 3. Saves each article as a JSON file
 
@@ -25,6 +26,97 @@ HOW TO RUN:
     # Re-scrape articles even if they already exist
     python 02__scraper.py --per-source 2 --no-skip-existing
 
+    # Match the concurrent-request limit of your ScrapingBee plan
+    python 02__scraper.py --concurrency 25
+
+    # Load-test against a local stand-in server instead of ScrapingBee
+    python 02__scraper.py --base-url http://127.0.0.1:8000/api/v1
+
+HOW THE DOWNLOADS RUN:
+    All requests go through ONE shared HTTP session whose connection pool
+    keeps connections to ScrapingBee open (keep-alive), so we don't pay a
+    new TCP + TLS handshake for every article. An asyncio loop keeps up to
+    --concurrency requests in flight at once (the plan's concurrent-request
+    limit), so throughput grows with the plan instead of staying at 5.
+
+ADAPTIVE CONCURRENCY (AIMD):
+    We don't start at --concurrency. We start low and add requests in flight
+    while answers come back fast and steady ("additive increase"). When
+    ScrapingBee says "slow down" (429 / 503) or requests time out, we halve
+    the number in flight ("multiplicative decrease"), wait as long as its
+    Retry-After header asks, and retry the article right away (with
+    exponential backoff) instead of saving it as failed for --retry-failed.
+    The run settles at the fastest rate ScrapingBee accepts.
+    Use --no-adaptive to always keep --concurrency requests in flight.
+
+JAVASCRIPT RENDERING (--render auto, the default):
+    render_js=true runs a headless browser: slow, and 5 credits instead of 1.
+    We first fetch a page WITHOUT rendering and check it (not a consent
+    wall, enough text left after the source's cleaner). If it is not good
+    enough, the same article is fetched again WITH rendering. What works is
+    remembered per source in data/state/render_strategy.json (see
+    render_strategy.py), so sources that need a browser get one right away.
+    Use --render js for the old behaviour (always render).
+
+WHICH ARTICLE GOES FIRST (SCHEDULER):
+    Articles are not scraped in source order. Each source has a priority
+    queue, ordered by recency x source weight (SOURCE_WEIGHTS: tourism trade
+    press first, then travel sections), and the free slots always go to the
+    best article overall. Each source also has a token bucket (a few at
+    once, then --source-rate articles per minute), so one big outlet can't
+    take every slot and fresh tourism news is saved within the first minutes.
+    --limit keeps the highest-priority articles too.
+
+ARTICLE MANIFEST:
+    data/state/article_manifest.sqlite has one row per article file (id,
+    source, status, scraped_at, content hash, cleaner version), written right
+    after the file is saved (see article_manifest.py). "Already scraped?",
+    --retry-failed and --source are answered from it, without touching the
+    thousands of files in data/articles.
+
+DUPLICATES:
+    Article IDs are the hash of the CANONICAL link (url_utils.py: no
+    tracking parameters, no "www.", no trailing "/"), so the same article
+    under a different link is not scraped again. A page whose raw content
+    we already have (e.g. the same wire story from two outlets) is saved
+    with a "duplicate_of" field and is not cleaned, embedded or reported.
+
+RAW PAGE STORAGE (--storage blob, the default):
+    The raw ScrapingBee page is stored gzip-compressed in data/blobs/ under
+    its SHA-256 hash (see blob_store.py); the article file only keeps the
+    hash and a few ScrapingBee headers. Use --storage inline to keep the
+    page inside the article file (old behaviour).
+
+RESUMING AN INTERRUPTED RUN:
+    Every run keeps a journal of its plan and progress in
+    data/state/scrape_journal/ (see scrape_journal.py). If the scraper is
+    killed, continue exactly where it stopped with:
+
+    python 02__scraper.py --resume
+
+    Articles whose response we already received are never scraped (and
+    paid for) again. Article files are written to a temporary file and then
+    renamed, so data/articles never contains half-written JSON.
+
+STREAMING MODE (--stream):
+    Normally an article is saved raw here, then re-read and rewritten by
+    03__cleaner.py, then re-read by 10__embedder.py - hours of batch steps.
+    With --stream each finished scrape goes through in-process queues:
+    
+        scrape -> clean (03__cleaner.py) -> embedding batcher (10__embedder.py)
+    
+    The raw page is saved (and logged "done" in the journal) as soon as the
+    scrape returns, like in normal mode, so Ctrl+C or a hanging embedding
+    call never makes --resume pay for it again. After cleaning and
+    embedding, the file is saved again with "text" and an "embedding" field
+    ({"status": "embedded", "chunks": 4, ...}); an article that never got
+    that far is simply cleaned and embedded by the batch steps later.
+    The batcher sends up to
+    EMBED_BATCH_CHUNKS chunks per embedding request and never holds an
+    article back longer than STREAM_BATCH_SECONDS, so a new article is
+    searchable seconds after it was scraped. Needs the embedder's
+    libraries and credentials (see 10__embedder.py).
+
 OUTPUT:
     data/articles/<fingerprint>.json
 """
@@ -34,13 +126,32 @@ OUTPUT:
 # =============================================================================
 
 import argparse    # Built-in library to parse command line arguments
+import asyncio     # Built-in library to keep many requests in flight at once
 import hashlib     # Built-in library for creating hashes
+import heapq       # Built-in priority queue (the scheduler picks the best article first)
 import json        # Built-in library to work with JSON data
 import os          # Built-in library to work with files and folders
-import time        # Built-in library to add delays between requests
+import random      # Built-in library for the backoff jitter
+import time        # Built-in library to measure how long the run takes
+import sys         # Built-in library to adjust the import path
 import requests    # Library to make HTTP requests (pip install requests)
+from requests.adapters import HTTPAdapter  # Connection pool settings for a requests session
+from concurrent.futures import ThreadPoolExecutor  # Runs the blocking requests in the background
 from datetime import datetime  # Built-in library to work with dates and times
-from pathlib import Path       # Built-in library for file path handling
+from importlib.machinery import SourceFileLoader  # Loads 03__cleaner.py / 10__embedder.py for --stream
+
+# Make sure we can import our helper modules from src/
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import link_store  # Compacted per-source link store (link_store.py)
+import date_utils  # Shared date parser, used for HTTP-date Retry-After headers
+import article_manifest  # Index of the files in data/articles (article_manifest.py)
+import scrape_journal    # Crash-safe journal of the run's plan and progress (scrape_journal.py)
+import blob_store        # Compressed store for the raw pages (blob_store.py)
+import source_rules      # Compiled include/exclude rules per source (source_rules.py)
+import render_strategy   # Learned per-source JavaScript rendering decisions (render_strategy.py)
+import url_utils         # Canonical article links (url_utils.py)
+import near_duplicates   # MinHash/LSH near-duplicate clusters (near_duplicates.py)
+import keyword_matcher   # Shared "any of these keywords" matcher (keyword_matcher.py)
 
 # =============================================================================
 # CONFIGURATION
@@ -49,14 +160,86 @@ from pathlib import Path       # Built-in library for file path handling
 # Directory containing the JSONL files from Step 1
 INPUT_DIR = "data/links"
 
+# Directory containing the compacted link stores (python src/link_store.py)
+LINK_STORE_DIR = "data/link_store"
+
 # Directory where we'll save the scraped articles
 OUTPUT_DIR = "data/articles"
 
 # ScrapingBee API endpoint
-SCRAPINGBEE_URL = "https://app.scrapingbee.com/api/v1"
+# Override it (env var or --base-url) to point at a local stand-in server
+SCRAPINGBEE_URL = os.environ.get("SCRAPINGBEE_URL", "https://app.scrapingbee.com/api/v1")
+
+# How many requests we keep in flight at once.
+# Set this to the concurrent-request limit of your ScrapingBee plan.
+SCRAPE_CONCURRENCY = int(os.environ.get("SCRAPINGBEE_CONCURRENCY", "10"))
+
+# Seconds to wait for ScrapingBee before giving up on one article
+REQUEST_TIMEOUT = 30
+
+# JavaScript rendering: "auto" (learned per source, see render_strategy.py),
+# "js" (always render, old behaviour) or "static" (never render).
+# Can be changed with --render.
+RENDER_MODE = "auto"
+
+# Where the raw page goes: "blob" (compressed, in data/blobs) or "inline"
+# (inside the article JSON). Can be changed with --storage.
+STORAGE_MODE = "blob"
+
+# Adaptive concurrency (AIMD) settings
+ADAPTIVE_START_CONCURRENCY = 2   # Requests in flight when a run starts
+ADAPTIVE_DECREASE_FACTOR = 0.5   # Multiply the limit by this on 429/503/timeout
+LATENCY_TOLERANCE = 1.5          # Stop growing when latency is 1.5x the usual
+LATENCY_SMOOTHING = 0.2          # Weight of the newest latency in the average
+
+# Status codes that mean "you are sending too much, slow down"
+THROTTLE_STATUS_CODES = [429, 503]
+
+# Inline retries of throttled articles
+THROTTLE_MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# --stream mode: chunks per embedding request, and the longest an article
+# waits for its batch to fill up
+EMBED_BATCH_CHUNKS = 64
+STREAM_BATCH_SECONDS = 2.0
+
+# Scheduling: which article is scraped next?
+# Priority = source weight x recency (the recency part halves every
+# RECENCY_HALF_LIFE_HOURS of age), so fresh tourism news goes first.
+RECENCY_HALF_LIFE_HOURS = 24
+UNDATED_AGE_HOURS = 24 * 7       # Articles without a date count as a week old
+FRESH_HOURS = 24                 # "Breaking news" in the summary: published in the last 24h
+
+# Source weights (default 1.0). Tourism trade press counts most, then
+# travel sections, then general news. Only ACTIVE feeds of 00__rss_feeds.py
+# belong here (PUBLITURIS, UNWTO, IATA, ICAO and ANA_AEROPORTOS are paused).
+DEFAULT_SOURCE_WEIGHT = 1.0
+SOURCE_WEIGHTS = {
+    "AMBITUR": 3.0,
+    "HOSTELTUR": 3.0,
+    "SKIFT": 3.0,
+    "TOURMAG": 3.0,
+    "LECHO_TOURISTIQUE": 3.0,
+    "TOURISTIK_AKTUELL": 3.0,
+    "FVW": 3.0,
+    "BREAKING_TRAVEL_NEWS": 2.5,
+    "TRAVELPULSE": 2.5,
+    "ETURBONEWS": 2.5,
+    "SIMPLE_FLYING": 2.0,
+    "AIR_CURRENT": 2.0,
+}
+# Sources whose name contains one of these are travel sections (weight 2.0)
+TRAVEL_SECTION_KEYWORDS = ["TRAVEL", "VIAJERO", "VIAGENS", "VOYAGES", "REISE", "VIAGGI", "TIME_OUT"]
+TRAVEL_SECTION_MATCHER = keyword_matcher.compile_keywords(TRAVEL_SECTION_KEYWORDS)
+TRAVEL_SECTION_WEIGHT = 2.0
 
-# Delay between requests (in seconds) to avoid hitting rate limits
-DELAY_BETWEEN_REQUESTS = 1.0
+# Politeness: every source has a token bucket, so no single outlet can fill
+# the pipeline. A source may start SOURCE_BURST articles at once, then
+# SOURCE_RATE_PER_MINUTE per minute. Can be changed with --source-rate (0 = off).
+SOURCE_RATE_PER_MINUTE = 30
+SOURCE_BURST = 5
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -94,77 +277,59 @@ def get_api_key():
     return api_key
 
 
-def find_latest_jsonl_files(input_dir):
+def create_article_id(link):
     """
-    Find all JSONL files in the input directory (including subfolders).
+    Create a unique ID for an article based on its link.
     
-    The indexer saves files in source-specific subfolders:
-    - data/links/PUBLICO/20260101_152601.jsonl
-    - data/links/EXPRESSO/20260101_152602.jsonl
+    We use SHA-256 hash of the CANONICAL link (url_utils.canonicalize_url)
+    to create a unique filename, so the same article linked with tracking
+    parameters, "www." or a trailing "/" gets the same ID.
     
     PARAMETERS:
-    - input_dir: Base directory to search for JSONL files
+    - link: The article URL
     
     RETURNS:
-    - A list of file paths
+    - A 64-character hexadecimal string
     """
-    print(f"[INFO] Looking for JSONL files in: {input_dir}")
-    
-    # Check if the directory exists
-    if not os.path.exists(input_dir):
-        print(f"[WARNING] Directory does not exist: {input_dir}")
-        return []
-    
-    # Find all .jsonl files recursively (using **/ to search subfolders)
-    jsonl_files = list(Path(input_dir).glob("**/*.jsonl"))
-    
-    print(f"[INFO] Found {len(jsonl_files)} JSONL files")
-    
-    return jsonl_files
+    return hashlib.sha256(url_utils.canonicalize_url(link).encode("utf-8")).hexdigest()
 
 
-def load_articles_from_jsonl(jsonl_path):
+def create_legacy_article_id(link):
     """
-    Load articles from a JSONL file.
-    
-    PARAMETERS:
-    - jsonl_path: Path to the JSONL file
+    The ID older runs gave an article (hash of the link exactly as found).
     
-    RETURNS:
-    - A list of article dictionaries
+    Articles scraped before we used canonical links are saved under this ID;
+    we check it too, so they are not scraped again.
     """
-    print(f"[INFO] Loading articles from: {jsonl_path}")
-    
-    articles = []
-    
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:  # Skip empty lines
-                article = json.loads(line)
-                articles.append(article)
-    
-    print(f"[INFO]   Loaded {len(articles)} articles")
-    
-    return articles
+    return hashlib.sha256(link.encode("utf-8")).hexdigest()
 
 
-def create_article_id(link):
+def create_http_session(concurrency):
     """
-    Create a unique ID for an article based on its link.
+    Create ONE requests session that all downloads share.
     
-    We use SHA-256 hash of the link to create a unique filename.
+    WHY A SESSION?
+    - A bare requests.get() opens a new connection (TCP + TLS handshake)
+      for every article and closes it again
+    - A session keeps the connections open (keep-alive) and reuses them
+    
+    The connection pool holds as many connections as requests we keep in
+    flight, so no request ever waits for (or throws away) a connection.
     
     PARAMETERS:
-    - link: The article URL
+    - concurrency: Maximum requests in flight
     
     RETURNS:
-    - A 64-character hexadecimal string
+    - A requests.Session
     """
-    return hashlib.sha256(link.encode("utf-8")).hexdigest()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=concurrency, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
-def scrape_article(api_key, url):
+def scrape_article(api_key, url, session=None, base_url=None, render_js=True):
     """
     Scrape an article using ScrapingBee API.
     
@@ -176,23 +341,34 @@ def scrape_article(api_key, url):
     PARAMETERS:
     - api_key: Your ScrapingBee API key
     - url: The URL to scrape
+    - session: Shared requests session (optional, see create_http_session)
+    - base_url: ScrapingBee endpoint (default: SCRAPINGBEE_URL)
+    - render_js: Render JavaScript in a headless browser (needed for some
+      sites, but slower and 5x the credits)
     
     RETURNS:
     - A dictionary with the scraping result
     """
-    print(f"[INFO]   Scraping: {url[:80]}...")
+    if render_js:
+        print(f"[INFO]   Scraping (JS): {url[:80]}...")
+    else:
+        print(f"[INFO]   Scraping (static): {url[:80]}...")
     
     # Build the request parameters
     params = {
         "api_key": api_key,
         "url": url,
-        "render_js": "true",  # Render JavaScript (required for some sites, slower)
+        "render_js": "true" if render_js else "false",
         "return_page_markdown": "true",  # Return content as markdown
     }
     
     try:
-        # Make the request to ScrapingBee
-        response = requests.get(SCRAPINGBEE_URL, params=params, timeout=30)
+        # Make the request to ScrapingBee (reusing a pooled connection if we can)
+        if session is None:
+            session = requests
+        if base_url is None:
+            base_url = SCRAPINGBEE_URL
+        response = session.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
         
         # Build the result dictionary
         result = {
@@ -200,6 +376,7 @@ def scrape_article(api_key, url):
             "status_code": response.status_code,
             "content": response.text,
             "headers": dict(response.headers),
+            "render_js": render_js,
         }
         
         if response.ok:
@@ -214,6 +391,8 @@ def scrape_article(api_key, url):
         return {
             "success": False,
             "error": str(e),
+            "timed_out": isinstance(e, requests.Timeout),
+            "render_js": render_js,
         }
 
 
@@ -221,6 +400,10 @@ def save_article(article_data, output_dir):
     """
     Save the scraped article to a JSON file.
     
+    We write to a temporary file first and then rename it, so the file is
+    either complete or not there at all (the manifest never points at a
+    half-written file).
+    
     PARAMETERS:
     - article_data: Dictionary containing the article data
     - output_dir: Directory to save the file
@@ -237,56 +420,38 @@ def save_article(article_data, output_dir):
     filepath = os.path.join(output_dir, filename)
     
     # Save to JSON file
-    with open(filepath, "w", encoding="utf-8") as f:
+    temp_path = filepath + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
         json.dump(article_data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, filepath)
     
     return filepath
 
 
-def article_already_scraped(article_id, output_dir):
+def load_failed_articles(output_dir, failed_rows):
     """
-    Check if an article has already been scraped.
+    Read the saved files of previously failed scrapes.
     
-    This helps us avoid re-scraping the same articles.
-    
-    PARAMETERS:
-    - article_id: The article's unique ID
-    - output_dir: Directory where scraped articles are saved
-    
-    RETURNS:
-    - True if the article already exists, False otherwise
-    """
-    filepath = os.path.join(output_dir, f"{article_id}.json")
-    return os.path.exists(filepath)
-
-
-def find_failed_articles(output_dir):
-    """
-    Scan the articles directory for previously failed scrapes.
-    
-    These are articles where scrapingbee.success == false (e.g. timeouts).
+    The manifest tells us WHICH articles failed, so we only open those files
+    (we need their metadata to scrape them again).
     
     PARAMETERS:
     - output_dir: Directory where scraped articles are saved
+    - failed_rows: List of (article_id, source) from article_manifest.list_failed()
     
     RETURNS:
     - A list of tuples: (filepath, article_data) for each failed article
     """
     failed = []
-    articles_dir = Path(output_dir)
-    
-    if not articles_dir.exists():
-        return failed
     
-    for filepath in articles_dir.glob("*.json"):
+    for article_id, source in failed_rows:
+        filepath = os.path.join(output_dir, f"{article_id}.json")
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            
-            sb = data.get("scrapingbee", {})
-            if sb.get("success") == False:
-                failed.append((str(filepath), data))
-        except Exception:
+            failed.append((filepath, data))
+        except Exception as e:
+            print(f"[WARNING] Could not read {filepath}: {e} (run: python src/article_manifest.py --rebuild)")
             continue
     
     return failed
@@ -302,6 +467,9 @@ def should_scrape(article):
     - Include specific 'Allowed Tags' + 'Mapped Tags' for Expresso.
     - Exclude videos/podcasts.
     
+    The rules themselves live in source_rules.py (a table that is compiled
+    once), so this check is cheap even across the whole link history.
+    
     PARAMETERS:
     - article: Dictionary containing article metadata (link, tags, source)
     
@@ -312,132 +480,970 @@ def should_scrape(article):
     link = article.get("link", "")
     tags = [t.strip() for t in (article.get("tags") or [])]
     
-    # 1. GLOBAL VIDEO/PODCAST EXCLUSION
-    # ---------------------------------
-    # Check for video/podcast keywords in tags (case-insensitive)
-    if tags and any(x in t.lower() for t in tags for x in ['vídeo', 'videos', 'podcast', 'multimédia', 'galeria']):
-        return False
-        
-    # Check for video URL patterns
-    video_patterns = ['/video/', '/videos/', '/cmtv/', 'www.nytimes.com/video', '/podcasts/', 'multimedia']
-    if any(pat in link for pat in video_patterns):
-        return False
+    return source_rules.check_scrape_rules(source, link, tags)
+
+
+# =============================================================================
+# SCHEDULING (PRIORITY QUEUE + PER-SOURCE TOKEN BUCKETS)
+# =============================================================================
+
+# Cache: source name -> weight (worked out once per name)
+_SOURCE_WEIGHT_CACHE = {}
+
+
+def get_source_weight(source):
+    """
+    How valuable is an article from this source? (see SOURCE_WEIGHTS)
+    """
+    if source not in _SOURCE_WEIGHT_CACHE:
+        name = (source or "").upper()
+        weight = SOURCE_WEIGHTS.get(name)
+        if weight is None:
+            weight = DEFAULT_SOURCE_WEIGHT
+            if keyword_matcher.contains_any(TRAVEL_SECTION_MATCHER, name):
+                weight = TRAVEL_SECTION_WEIGHT
+        _SOURCE_WEIGHT_CACHE[source] = weight
+    return _SOURCE_WEIGHT_CACHE[source]
+
+
+def get_article_age_hours(article, now):
+    """
+    Hours since the article was published (UNDATED_AGE_HOURS if we don't know).
+    """
+    published = date_utils.get_meta_epoch(article)
+    if published is None:
+        return UNDATED_AGE_HOURS
+    # Dates in the future (time zones, bad feeds) count as "just published"
+    return max(0.0, (now - published) / 3600)
+
+
+def get_priority(article, source, now):
+    """
+    Scheduling priority of an article: higher is scraped first.
+    
+    priority = source weight x 0.5 ^ (age / RECENCY_HALF_LIFE_HOURS)
+    
+    So a 1-day-old trade-press article (3.0 x 0.5 = 1.5) still goes before
+    a brand-new general news article (1.0), but not before a fresh one (3.0).
+    """
+    age_hours = get_article_age_hours(article, now)
+    return get_source_weight(source) * 0.5 ** (age_hours / RECENCY_HALF_LIFE_HOURS)
+
+
+def sort_by_priority(articles_to_scrape):
+    """
+    Sort (article, article_id, source) tuples from highest to lowest priority.
+    
+    Used before --limit, so a limited run takes the freshest, most valuable
+    articles instead of the first sources in the list.
+    """
+    now = time.time()
+    
+    def item_priority(item):
+        article, _, source = item
+        return get_priority(article, source, now)
+    
+    return sorted(articles_to_scrape, key=item_priority, reverse=True)
+
+
+def create_token_bucket(now):
+    """
+    Create a full token bucket for one source (a plain dictionary).
+    """
+    return {"tokens": float(SOURCE_BURST), "updated_at": now}
+
+
+def refill_token_bucket(bucket, rate_per_second, now):
+    """
+    Add the tokens earned since the last refill (never more than SOURCE_BURST).
+    """
+    elapsed = now - bucket["updated_at"]
+    bucket["tokens"] = min(float(SOURCE_BURST), bucket["tokens"] + elapsed * rate_per_second)
+    bucket["updated_at"] = now
+
+
+def create_scheduler(articles_to_scrape, source_rate_per_minute):
+    """
+    Put the articles in one priority queue per source.
+    
+    PARAMETERS:
+    - articles_to_scrape: List of (article, article_id, source) tuples
+    - source_rate_per_minute: Articles per minute per source (0 = no limit)
     
+    RETURNS:
+    - A scheduler dictionary for next_article()
+    """
+    now = time.time()
+    queues = {}
+    buckets = {}
     
-    # 2. EXPRESSO SPECIFIC FILTERING
-    # ---------------------------------
-    if 'EXPRESSO' in source:
-        # A. Strict Allowlist & Meaningful Mapping (Mirrors clean_expresso.py logic)
+    for position, (article, article_id, source) in enumerate(articles_to_scrape):
+        if source not in queues:
+            queues[source] = []
+            buckets[source] = create_token_bucket(now)
+        # heapq pops the SMALLEST item, so we store minus the priority.
+        # "position" breaks ties (and means the dictionaries are never compared).
+        priority = get_priority(article, source, now)
+        heapq.heappush(queues[source], (-priority, position, article, article_id))
+    
+    return {
+        "queues": queues,
+        "buckets": buckets,
+        "rate_per_second": source_rate_per_minute / 60,
+        "pending": len(articles_to_scrape),
+    }
+
+
+def next_article(scheduler, now):
+    """
+    Take the highest-priority article whose source still has a token.
+    
+    RETURNS:
+    - A tuple (item, wait_seconds):
+      item is (article, article_id, source), or None if every source with
+      articles left is out of tokens; then wait_seconds says when the next
+      token arrives
+    """
+    rate = scheduler["rate_per_second"]
+    best_source = None
+    wait_seconds = None
+    
+    for source, queue in scheduler["queues"].items():
+        if rate > 0:
+            bucket = scheduler["buckets"][source]
+            refill_token_bucket(bucket, rate, now)
+            if bucket["tokens"] < 1:
+                seconds = (1 - bucket["tokens"]) / rate
+                if wait_seconds is None or seconds < wait_seconds:
+                    wait_seconds = seconds
+                continue
+        # Compare the best article of each source (smallest = highest priority)
+        if best_source is None or queue[0] < scheduler["queues"][best_source][0]:
+            best_source = source
+    
+    if best_source is None:
+        return None, wait_seconds
+    
+    if rate > 0:
+        scheduler["buckets"][best_source]["tokens"] -= 1
+    
+    queue = scheduler["queues"][best_source]
+    _, _, article, article_id = heapq.heappop(queue)
+    if not queue:
+        del scheduler["queues"][best_source]
+    scheduler["pending"] -= 1
+    
+    return (article, article_id, best_source), 0.0
+
+
+# =============================================================================
+# ASYNC SCRAPING ENGINE
+# =============================================================================
+
+def create_controller(max_concurrency, adaptive=True):
+    """
+    Create the adaptive concurrency controller (a plain dictionary).
+    
+    KEYS:
+    - limit: How many requests may be in flight right now (a float, we use int(limit))
+    - in_flight: How many requests are in flight
+    - slow_start: True until the first slow-down; the limit grows by one per
+      success (doubles every round) instead of by one per round
+    - latency_avg / latency_usual: Smoothed latency of successful requests,
+      and the "normal" level it is compared against
+    - paused_until: Retry-After from ScrapingBee, no new requests before this time
+    - last_cut_at: When we last halved the limit (once per round is enough)
+    
+    PARAMETERS:
+    - max_concurrency: Our ScrapingBee plan's concurrent-request limit
+    - adaptive: False to always keep max_concurrency requests in flight
+    """
+    if adaptive:
+        start = min(ADAPTIVE_START_CONCURRENCY, max_concurrency)
+    else:
+        start = max_concurrency
+    
+    return {
+        "adaptive": adaptive,
+        "limit": float(start),
+        "min_limit": 1,
+        "max_limit": max_concurrency,
+        "in_flight": 0,
+        "slow_start": adaptive,
+        "latency_avg": None,
+        "latency_usual": None,
+        "paused_until": 0.0,
+        "last_cut_at": 0.0,
+        "peak_limit": start,
+        "changed": asyncio.Condition(),
+    }
+
+
+def record_success(controller, latency):
+    """
+    Additive increase: a fast, steady answer lets us add a little to the limit.
+    
+    In slow start we add 1 per success (the limit doubles every round);
+    after that we add 1/limit per success (the limit grows by 1 per round).
+    If latency climbs well above its usual level, ScrapingBee is getting busy,
+    so we stop growing.
+    """
+    # Step 1: Update the smoothed latency
+    if controller["latency_avg"] is None:
+        controller["latency_avg"] = latency
+        controller["latency_usual"] = latency
+    else:
+        controller["latency_avg"] = (1 - LATENCY_SMOOTHING) * controller["latency_avg"] + LATENCY_SMOOTHING * latency
+        # The "usual" level follows the average slowly
+        controller["latency_usual"] += 0.05 * (controller["latency_avg"] - controller["latency_usual"])
+    
+    if not controller["adaptive"]:
+        return
+    
+    # Step 2: Latency rising -> hold the limit where it is
+    if controller["latency_avg"] > controller["latency_usual"] * LATENCY_TOLERANCE:
+        controller["slow_start"] = False
+        return
+    
+    # Step 3: Grow
+    if controller["slow_start"]:
+        controller["limit"] += 1
+    else:
+        controller["limit"] += 1 / controller["limit"]
+    
+    controller["limit"] = min(controller["limit"], controller["max_limit"])
+    controller["peak_limit"] = max(controller["peak_limit"], int(controller["limit"]))
+
+
+def record_throttle(controller, retry_after):
+    """
+    Multiplicative decrease: halve the limit on 429 / 503 / timeout.
+    
+    Many requests that were in flight together get throttled together, so we
+    only cut once per round (one average latency), not once per request.
+    
+    PARAMETERS:
+    - retry_after: Seconds ScrapingBee asked us to wait (or None)
+    """
+    now = time.time()
+    
+    if retry_after:
+        controller["paused_until"] = max(controller["paused_until"], now + retry_after)
+    
+    if not controller["adaptive"]:
+        return
+    
+    round_seconds = controller["latency_avg"] or 1.0
+    if now - controller["last_cut_at"] < round_seconds:
+        return
+    
+    controller["limit"] = max(controller["min_limit"], controller["limit"] * ADAPTIVE_DECREASE_FACTOR)
+    controller["slow_start"] = False
+    controller["last_cut_at"] = now
+    print(f"[WARNING] Throttled by ScrapingBee -> {int(controller['limit'])} requests in flight")
+
+
+async def acquire_slot(controller):
+    """
+    Wait until we may send one more request (respecting limit and Retry-After).
+    """
+    def has_free_slot():
+        return controller["in_flight"] < int(controller["limit"])
+    
+    while True:
+        pause = controller["paused_until"] - time.time()
+        if pause > 0:
+            await asyncio.sleep(pause)
         
-        target_categories = {
-            "Política",
-            "Sociedade", 
-            "Internacional",
-            "Boa Cama Boa Mesa"
+        async with controller["changed"]:
+            await controller["changed"].wait_for(has_free_slot)
+            # A Retry-After may have arrived while we were waiting
+            if controller["paused_until"] <= time.time():
+                controller["in_flight"] += 1
+                return
+
+
+async def release_slot(controller):
+    """
+    Give a slot back and wake up the requests waiting for one.
+    """
+    async with controller["changed"]:
+        controller["in_flight"] -= 1
+        controller["changed"].notify_all()
+
+
+def is_throttled(scrape_result):
+    """
+    Does this result mean "slow down" (429, 503 or a timeout)?
+    """
+    if scrape_result.get("timed_out"):
+        return True
+    return scrape_result.get("status_code") in THROTTLE_STATUS_CODES
+
+
+def get_retry_after(scrape_result):
+    """
+    Read the Retry-After header ("120" or an HTTP date) in seconds, or None.
+    """
+    headers = scrape_result.get("headers") or {}
+    value = None
+    for name, header_value in headers.items():
+        if name.lower() == "retry-after":
+            value = str(header_value).strip()
+    
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    
+    retry_at = date_utils.parse_date_to_epoch(value)
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at - time.time())
+
+
+def get_backoff_seconds(attempt, retry_after):
+    """
+    How long to wait before retrying a throttled article.
+    
+    Exponential backoff (2s, 4s, 8s, ...) with random jitter, but never
+    less than what Retry-After asked for.
+    """
+    backoff = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+    backoff = backoff * random.uniform(1.0, 1.25)
+    if retry_after:
+        backoff = max(backoff, retry_after)
+    return backoff
+
+
+def build_article_data(article, article_id, source, scrape_result):
+    """
+    Build the dictionary we save for one scraped article.
+    
+    In blob storage mode the raw page is moved to the blob store here.
+    """
+    article_data = {
+        "id": article_id,
+        "link": article["link"],
+        "canonical_link": url_utils.canonicalize_url(article["link"]),
+        "source": source,
+        "metadata": article,
+        "scraped_at": datetime.now().isoformat(),
+        "scrapingbee": scrape_result,
+        # We NO LONGER clean here. 
+        # "text" field is omitted or can be raw content if needed for downstream compatibility mostly
+        # But the new cleaner will generate the "text" field.
+        # For now, let's just save the raw structure.
+        # (Except in --stream mode, which adds "text" and "embedding" and saves again.)
+    }
+    
+    # Keep the raw page in the compressed blob store, not in the JSON file
+    if STORAGE_MODE == "blob":
+        blob_store.move_content_to_blob(scrape_result)
+    
+    return article_data
+
+
+def mark_content_duplicate(article_data, run_stats, manifest):
+    """
+    Is the raw page the same as one of an article we already have (a
+    syndicated wire story, or the same page under another link)?
+    
+    Then the article is still saved, but gets a "duplicate_of" field, so it
+    is not cleaned, embedded or put into a report a second time.
+    
+    RETURNS:
+    - The ID of the original article, or None
+    """
+    scrape_result = article_data["scrapingbee"]
+    if not scrape_result.get("success"):
+        return None
+    
+    # In blob storage mode the blob name IS the content hash
+    content_hash = scrape_result.get("content_blob") or article_manifest.get_content_hash(scrape_result.get("content"))
+    original_id = article_manifest.find_duplicate(manifest, article_data["id"], content_hash=content_hash)
+    if original_id:
+        article_data["duplicate_of"] = original_id
+        run_stats["duplicates"] += 1
+    return original_id
+
+
+def finish_article(article_data, run_stats, manifest, journal=None):
+    """
+    Save one article, record it in the manifest and update the run counters.
+    
+    PARAMETERS:
+    - article_data: The dictionary from build_article_data()
+    - run_stats: Dictionary with "done", "total", "scraped", "errors", "by_source"
+    - manifest: Open article manifest (article_manifest.open_manifest())
+    - journal: This run's journal (scrape_journal.py), or None
+    """
+    run_stats["done"] += 1
+    progress = f"[{run_stats['done']}/{run_stats['total']}]"
+    source = article_data["source"]
+    scrape_result = article_data["scrapingbee"]
+    
+    # Track results by source
+    if source not in run_stats["by_source"]:
+        run_stats["by_source"][source] = {"success": 0, "error": 0}
+    
+    if "duplicate_of" not in article_data:
+        mark_content_duplicate(article_data, run_stats, manifest)
+    
+    # Save the article, THEN record it (a crash in between only means
+    # the article is scraped again next run)
+    save_article(article_data, OUTPUT_DIR)
+    article_manifest.record_scrape(manifest, article_data)
+    if article_data.get("cleaner_version"):
+        article_manifest.record_cleaned(manifest, [(article_data["id"], article_data["cleaner_version"], article_data["scraped_at"],
+                                                    article_manifest.get_text_hash(article_data.get("text")))])
+    if scrape_result.get("success"):
+        scrape_journal.log_event(journal, "done", article_data["id"], "success")
+    else:
+        scrape_journal.log_event(journal, "done", article_data["id"], "failed")
+    
+    if scrape_result.get("success") and article_data.get("duplicate_of"):
+        print(f"{progress} [DUPLICATE] {source}: {article_data['link'][:60]}...")
+        run_stats["scraped"] += 1
+        run_stats["by_source"][source]["success"] += 1
+    elif scrape_result.get("success"):
+        print(f"{progress} [SUCCESS] {source}: {article_data['link'][:60]}...")
+        run_stats["scraped"] += 1
+        run_stats["by_source"][source]["success"] += 1
+    else:
+        print(f"{progress} [ERROR] {source}: {article_data['link'][:60]}...")
+        run_stats["errors"] += 1
+        run_stats["by_source"][source]["error"] += 1
+
+
+def handle_scrape_result(article, article_id, source, scrape_result, run_stats, manifest, journal=None):
+    """
+    Save one scraped article, record it in the manifest and update the run counters.
+    
+    Failed scrapes are saved too (with "success": false), so --retry-failed
+    can find them later.
+    
+    PARAMETERS:
+    - article: The link record from the indexer
+    - article_id: The article's unique ID
+    - source: Source name
+    - scrape_result: The dictionary returned by scrape_article()
+    - run_stats: Dictionary with "done", "total", "scraped", "errors", "by_source"
+    - manifest: Open article manifest (article_manifest.open_manifest())
+    - journal: This run's journal (scrape_journal.py), or None
+    """
+    article_data = build_article_data(article, article_id, source, scrape_result)
+    finish_article(article_data, run_stats, manifest, journal)
+
+
+# =============================================================================
+# STREAMING MODE (--stream): scrape (saved raw) -> clean -> embed (saved again)
+# =============================================================================
+
+def load_numbered_script(name, filename):
+    """
+    Load one of our numbered pipeline scripts (e.g. 03__cleaner.py) as a module.
+    
+    We use SourceFileLoader because the file name starts with a number,
+    which makes it tricky to import normally (same as 01__indexer.py does
+    for 00__rss_feeds.py).
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    loader = SourceFileLoader(name, os.path.join(script_dir, filename))
+    return loader.load_module()
+
+
+def create_stream_pipeline(manifest):
+    """
+    Set up the cleaner and the embedder for --stream mode.
+    
+    PARAMETERS:
+    - manifest: Open article manifest (the near-duplicate index lives in it)
+    
+    The embedder needs chromadb, openai and the embedding credentials
+    (see 10__embedder.py); we check all of that BEFORE spending credits.
+    
+    RETURNS:
+    - A pipeline dictionary, or None if the embedder can't be set up
+    """
+    cleaner = load_numbered_script("cleaner", "03__cleaner.py")
+    
+    try:
+        embedder = load_numbered_script("embedder", "10__embedder.py")
+    except ImportError as e:
+        print(f"[ERROR] --stream needs the embedder's libraries: {e}")
+        print("[ERROR] Install them with: pip install -r requirements.txt")
+        return None
+    
+    # Same provider/model choice as "python src/10__embedder.py"
+    embedder.PROVIDER = embedder.resolve_provider(None)
+    embedder.EMBEDDING_MODEL = embedder.get_embedding_model(embedder.PROVIDER)
+    client = embedder.get_openai_client(embedder.PROVIDER)
+    collection = embedder.setup_chromadb(reset=False)
+    near_duplicates.ensure_index(manifest)
+    
+    return {
+        "cleaner": cleaner,
+        "embedder": embedder,
+        "client": client,
+        "collection": collection,
+        # One worker thread: cleaning and embedding must not wait behind
+        # the scraping threads, which are busy waiting for ScrapingBee
+        "executor": ThreadPoolExecutor(max_workers=1),
+    }
+
+
+def clean_for_stream(pipeline, article_data, raw_text):
+    """
+    Clean an article, split it into chunks and compute its MinHash
+    signature (runs in the pipeline's thread).
+    
+    RETURNS:
+    - A tuple (document, chunks, signature); document is None if nothing is
+      left to embed
+    """
+    pipeline["cleaner"].clean_article_data(article_data, raw_text)
+    document = pipeline["embedder"].build_news_document(article_data)
+    
+    if document is None:
+        article_data["embedding"] = {"status": "skipped", "reason": "no text after cleaning"}
+        return None, [], None
+    if len(document["content"]) > pipeline["embedder"].MAX_CONTENT_LENGTH:
+        article_data["embedding"] = {"status": "skipped", "reason": "too large"}
+        return None, [], None
+    
+    signature = near_duplicates.compute_signature(article_data["text"])
+    return document, pipeline["embedder"].split_document(document), signature
+
+
+def embed_batch(pipeline, batch):
+    """
+    Embed the chunks of several articles at once and store them in ChromaDB
+    (runs in the pipeline's thread).
+    
+    PARAMETERS:
+    - batch: List of items {"article_data", "document", "chunks"}
+    
+    Each article gets an "embedding" field: "embedded", or "failed" (then
+    "python src/10__embedder.py" embeds it later, like any other article).
+    """
+    embedder = pipeline["embedder"]
+    ids = []
+    texts = []
+    metadatas = []
+    for item in batch:
+        document = item["document"]
+        for j, chunk in enumerate(item["chunks"]):
+            ids.append(f"{document['id']}_chunk_{j}")
+            texts.append(chunk)
+            metadatas.append(embedder.build_chunk_metadata(document, j, len(item["chunks"])))
+    
+    try:
+        embeddings = []
+        for start in range(0, len(texts), EMBED_BATCH_CHUNKS):
+            embeddings.extend(embedder.create_embeddings(pipeline["client"], texts[start:start + EMBED_BATCH_CHUNKS]))
+        # upsert: a re-scraped article replaces its old chunks
+        pipeline["collection"].upsert(ids=ids, embeddings=embeddings, documents=texts, metadatas=metadatas)
+        status = "embedded"
+        error = None
+    except Exception as e:
+        print(f"[ERROR] Embedding {len(batch)} articles failed: {e}")
+        status = "failed"
+        error = str(e)
+    
+    for item in batch:
+        item["article_data"]["embedding"] = {
+            "status": status,
+            "chunks": len(item["chunks"]),
+            "model": embedder.EMBEDDING_MODEL,
+            "collection": embedder.COLLECTION_NAME,
+            "embedded_at": datetime.now().isoformat(),
         }
+        if error:
+            item["article_data"]["embedding"]["error"] = error
+    return status
+
+
+def record_stream_latency(run_stats, article_data):
+    """
+    Remember how long after indexing an article became searchable.
+    """
+    indexed_at = article_data["metadata"].get("indexed_at")
+    if not indexed_at or (article_data.get("embedding") or {}).get("status") != "embedded":
+        return
+    try:
+        seconds = time.time() - datetime.fromisoformat(indexed_at).timestamp()
+    except ValueError:
+        return
+    run_stats["searchable_seconds"].append(seconds)
 
-        # Tag Mapping (Specific -> Target)
-        tag_map = {
-            # Politics
-            "Presidenciais 2026": "Política",
-            "Governo": "Política",
-            "Parlamento": "Política",
-            "Partidos": "Política",
-            "Justiça": "Política",
+
+def save_for_stream(clean_queue, article, article_id, source, scrape_result, run_stats, manifest, journal):
+    """
+    Stage 1 of --stream: save the raw page and log it "done" right away
+    (exactly like normal mode), then hand it to the cleaner.
+    
+    Failed scrapes and raw duplicates stop here.
+    """
+    raw_text = scrape_result.get("content")
+    article_data = build_article_data(article, article_id, source, scrape_result)
+    finish_article(article_data, run_stats, manifest, journal)
+    
+    if scrape_result.get("success") and not article_data.get("duplicate_of"):
+        clean_queue.put_nowait((article_data, raw_text))
+
+
+def update_stream_article(article_data, manifest):
+    """
+    Save a --stream article again, now with its "text" (and "embedding"),
+    and record its cleaner version, duplicate and cluster in the manifest.
+    """
+    save_article(article_data, OUTPUT_DIR)
+    article_manifest.record_scrape(manifest, article_data)
+    if article_data.get("cleaner_version"):
+        article_manifest.record_cleaned(manifest, [(article_data["id"], article_data["cleaner_version"], article_data["scraped_at"],
+                                                    article_manifest.get_text_hash(article_data.get("text")))])
+
+
+async def clean_worker(clean_queue, embed_queue, pipeline, run_stats, manifest):
+    """
+    Stage 2 of --stream: clean each saved article as soon as it arrives.
+    
+    Articles with text go on to the embedding batcher; duplicates and
+    articles with nothing left after cleaning are saved again right away.
+    """
+    loop = asyncio.get_running_loop()
+    
+    # Cleaned-text hash -> ID, for the articles of this run that are still
+    # waiting to be embedded (they are not in the manifest yet)
+    pending_texts = {}
+    
+    while True:
+        item = await clean_queue.get()
+        if item is None:
+            await embed_queue.put(None)
+            return
+        
+        article_data, raw_text = item
+        article_id = article_data["id"]
+        source = article_data["source"]
+        
+        # One bad article must not stop the worker: the scraper keeps
+        # sending articles, and this is the only reader of the queue
+        try:
+            document, chunks, signature = await loop.run_in_executor(
+                pipeline["executor"], clean_for_stream, pipeline, article_data, raw_text
+            )
             
-            # International
-            "Venezuela": "Internacional",
-            "Guerra na Ucrânia": "Internacional",
-            "Médio Oriente": "Internacional",
-            "América Latina": "Internacional",
-            "União Europeia": "Internacional",
-            "EUA": "Internacional",
-            "Brasil": "Internacional",
-            "Espanha": "Internacional",
-            "França": "Internacional",
-            "Reino Unido": "Internacional",
-            "Mundo": "Internacional",
-            "Europa": "Internacional",
-            "Guerra Fria": "Internacional",
+            # Same story as an article we already have, under another link or
+            # from another outlet: don't embed it twice
+            text_hash = article_manifest.get_text_hash(article_data.get("text"))
+            if document is not None and text_hash:
+                original_id = pending_texts.get(text_hash) or article_manifest.find_duplicate(manifest, article_id, text_hash=text_hash)
+                if original_id:
+                    print(f"[DUPLICATE] {source}: same text as {original_id}")
+                    article_data["duplicate_of"] = original_id
+                    run_stats["duplicates"] += 1
+                    document, chunks = None, []
+                else:
+                    pending_texts[text_hash] = article_id
             
-            # Society
-            "Saúde": "Sociedade",
-            "Transportes": "Sociedade",
-            "Meteorologia": "Sociedade",
-            "Segurança": "Sociedade",
-            "Imobiliário": "Sociedade",
-            "Habitação": "Sociedade",
-            "Lisboa": "Sociedade",
-            # Explicitly Excluded: "Obituário", "Religião" (will fail default check)
-        }
+            # Near-duplicate cluster, stored with the article and its chunks
+            if document is not None:
+                cluster_id = near_duplicates.add_article(manifest, article_id, signature)
+                manifest.commit()
+                article_data["cluster_id"] = cluster_id
+                document["cluster_id"] = cluster_id
+            
+            if document is None:
+                update_stream_article(article_data, manifest)
+            else:
+                await embed_queue.put({"article_data": article_data, "document": document, "chunks": chunks})
+        except Exception as e:
+            # The raw page is saved already; 03__cleaner.py cleans it later
+            print(f"[ERROR] Stream cleaning failed for {source} ({article_id}): {e}")
+
+
+async def embed_batcher(embed_queue, pipeline, run_stats, manifest):
+    """
+    Stage 3 of --stream: collect cleaned articles and embed them in batches.
+    
+    A batch is sent when it has EMBED_BATCH_CHUNKS chunks, or when its first
+    article has waited STREAM_BATCH_SECONDS (so a quiet moment never holds
+    an article back). Each article is saved again after it was embedded.
+    """
+    loop = asyncio.get_running_loop()
+    finished = False
+    
+    while not finished:
+        item = await embed_queue.get()
+        if item is None:
+            return
         
-        is_allowed = False
-        effective_tags = set()
+        batch = [item]
+        chunk_count = len(item["chunks"])
+        deadline = loop.time() + STREAM_BATCH_SECONDS
         
-        for t in tags:
-            t_clean = t.strip()
-            effective_tags.add(t) # Add original
-            if t_clean in tag_map:
-                effective_tags.add(tag_map[t_clean]) # Add mapped
-                
-        # Check intersection with Target Categories
-        # (Using case-insensitive check for robustness)
-        for et in effective_tags:
-            if any(tc.lower() == et.lower() for tc in target_categories):
-                is_allowed = True
+        # Fill the batch until it is full, the deadline passes, or the run ends
+        while chunk_count < EMBED_BATCH_CHUNKS:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(embed_queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                finished = True
                 break
+            batch.append(item)
+            chunk_count += len(item["chunks"])
         
-        if not is_allowed:
-            # print(f"[SKIP] Expresso (Not Allowed): {tags} -> {link}")
-            return False
-    
-    # 3. OBSERVADOR SPECIFIC FILTERING
-    # ---------------------------------
-    if 'OBSERVADOR' in source:
-        # Filter out podcasts, radio shows, lab content, and newsletters
-        exclude_tags = ['Rádio Observador', 'Observador Lab', 'Newsletter']
-        if any(et in t for t in tags for et in exclude_tags):
-            return False
-
-    # 4. SAPO_VIAGENS SPECIFIC FILTERING
-    # ----------------------------------
-    if source == 'SAPO_VIAGENS':
-        # User Request: "exclusively keep the travel section"
-        # We allow both 'viagens.sapo.pt' (main portal) and 'travelmagg.sapo.pt' (new focused feed)
-        if 'viagens.sapo.pt' not in link and 'travelmagg.sapo.pt' not in link:
-            return False
-
-    # 5. ECO_SAPO SPECIFIC FILTERING (Tourism Business Only)
-    # -----------------------------------------------------
-    if source == 'ECO_SAPO':
-        # We only want business news related to Tourism, Aviation, and Hospitality.
-        # We check the Link URL (which usually contains the slug)
-        keywords = [
-            'turismo', 'hotel', 'aviacao', 'aeroporto', 'tap', 'ryanair', 'easyjet',
-            'alojamento', 'viajar', 'hospedagem', 'companhia-aerea', 'voos',
-            'greve', 'sata', 'ana-aeroportos', 'nave',
-        ]
-        # Normalize link for checking
-        link_lower = link.lower()
+        # Errors stay inside this batch: the raw pages are saved already,
+        # and "python src/10__embedder.py" embeds them later like any other
+        try:
+            status = await loop.run_in_executor(pipeline["executor"], embed_batch, pipeline, batch)
+            print(f"[INFO] Embedded {len(batch)} articles ({chunk_count} chunks): {status}")
+        except Exception as e:
+            print(f"[ERROR] Embedding {len(batch)} articles failed: {e}")
+            for item in batch:
+                item["article_data"]["embedding"] = {"status": "failed", "error": str(e)}
         
-        if not any(k in link_lower for k in keywords):
-            # If link doesn't match, check tags if available
-            if not tags or not any(k in t.lower() for t in tags for k in keywords):
-                return False
+        for item in batch:
+            try:
+                update_stream_article(item["article_data"], manifest)
+                record_stream_latency(run_stats, item["article_data"])
+            except Exception as e:
+                print(f"[ERROR] Could not save the cleaned article {item['article_data']['id']}: {e}")
 
-    # 6. TELEGRAPH SPECIFIC FILTERING (DEPRECATED)
-    # -----------------------------------------------------------
-    if source == 'TELEGRAPH':
-        # Decision 2026-01-20: Source dropped due to low relevance and high noise.
-        # See project_documentation/telegraph_deprecation_report.md
-        return False
 
-    return True
+async def fetch_with_retries(api_key, article, article_id, session, executor, controller, base_url, run_stats, journal, render_js):
+    """
+    Send one ScrapingBee request for an article, retrying it while throttled.
+    
+    The controller decides how many requests may be in flight. Throttled
+    attempts (429 / 503 / timeout) are retried here with backoff, so they
+    don't end up as failures on disk.
+    
+    RETURNS:
+    - The scrape_result dictionary (with "attempts")
+    """
+    loop = asyncio.get_running_loop()
+    
+    for attempt in range(THROTTLE_MAX_RETRIES + 1):
+        await acquire_slot(controller)
+        if attempt == 0:
+            scrape_journal.log_event(journal, "start", article_id)
+        start = time.time()
+        try:
+            scrape_result = await loop.run_in_executor(
+                executor, scrape_article, api_key, article["link"], session, base_url, render_js
+            )
+        finally:
+            latency = time.time() - start
+            await release_slot(controller)
+        
+        if not is_throttled(scrape_result):
+            # Count what we pay for (a throttled request costs nothing)
+            if render_js:
+                run_stats["requests_js"] += 1
+            else:
+                run_stats["requests_static"] += 1
+            # Only successful answers tell us something about ScrapingBee's speed
+            if scrape_result.get("success"):
+                record_success(controller, latency)
+            break
+        
+        # Throttled: slow down everyone, then retry this article
+        run_stats["throttled"] += 1
+        retry_after = get_retry_after(scrape_result)
+        record_throttle(controller, retry_after)
+        
+        if attempt < THROTTLE_MAX_RETRIES:
+            wait_seconds = get_backoff_seconds(attempt, retry_after)
+            print(f"[INFO]   Throttled ({scrape_result.get('status_code') or 'timeout'}), "
+                  f"retrying in {wait_seconds:.1f}s: {article['link'][:60]}")
+            run_stats["retries"] += 1
+            await asyncio.sleep(wait_seconds)
+    
+    scrape_result["attempts"] = attempt + 1
+    return scrape_result
+
+
+async def scrape_one_async(api_key, article, article_id, source, session, executor, controller, base_url, run_stats, journal=None, strategy=None, render_mode=RENDER_MODE):
+    """
+    Scrape one article without blocking the others.
+    
+    With render_mode "auto", the article is first fetched WITHOUT JavaScript
+    rendering (unless its source is known to need it). If that page fails the
+    quality check (render_strategy.is_good_static_page), the article is
+    fetched again WITH rendering, and the source's strategy learns from it.
+    
+    PARAMETERS:
+    - strategy: The loaded render strategy (render_strategy.load_strategy())
+    - render_mode: "auto", "js" or "static"
+    
+    RETURNS:
+    - A tuple (article, article_id, source, scrape_result)
+    """
+    if render_mode == "js":
+        render_js = True
+    elif render_mode == "static":
+        render_js = False
+    else:
+        render_js = render_strategy.should_render_js(strategy, source)
+    
+    scrape_result = await fetch_with_retries(api_key, article, article_id, session, executor, controller, base_url, run_stats, journal, render_js)
+    
+    # Only a static page that came back in "auto" mode needs checking.
+    # A failed fetch (dead link, target 5xx, connection error) is returned as
+    # it is: rendering can't fix it, and it says nothing about the source.
+    if render_mode != "auto" or render_js or not scrape_result.get("success"):
+        return article, article_id, source, scrape_result
+    
+    # The cleaners are CPU work: run them in the background, not in the loop
+    loop = asyncio.get_running_loop()
+    good, reason = await loop.run_in_executor(
+        executor, render_strategy.is_good_static_page, scrape_result.get("content"), article
+    )
+    # None = the page could not be judged: render it, but don't learn from it
+    if good is not None:
+        render_strategy.record_static_check(strategy, source, good)
+    
+    if good:
+        return article, article_id, source, scrape_result
+    
+    # Escalate: fetch the same article again, with rendering
+    print(f"[INFO]   Static page not good enough ({reason}), rendering JavaScript: {article['link'][:60]}")
+    run_stats["escalated"] += 1
+    static_attempts = scrape_result.get("attempts", 1)
+    scrape_result = await fetch_with_retries(api_key, article, article_id, session, executor, controller, base_url, run_stats, None, True)
+    scrape_result["attempts"] += static_attempts
+    scrape_result["escalated_from_static"] = reason
+    return article, article_id, source, scrape_result
+
+
+async def scrape_articles_async(api_key, articles_to_scrape, concurrency, base_url, manifest, journal=None, adaptive=True, source_rate=SOURCE_RATE_PER_MINUTE, render_mode=RENDER_MODE, pipeline=None):
+    """
+    Scrape all articles, keeping up to "concurrency" requests in flight,
+    and save each one as soon as it finishes.
+    
+    Articles are NOT started in list order: the scheduler always starts the
+    highest-priority article (fresh, valuable source) whose source still has
+    a token, so fresh tourism news is available first and one big source
+    can't take every slot.
+    
+    PARAMETERS:
+    - api_key: Your ScrapingBee API key
+    - articles_to_scrape: List of (article, article_id, source) tuples
+    - concurrency: Maximum requests in flight (your plan's limit)
+    - base_url: ScrapingBee endpoint (or a local stand-in server)
+    - manifest: Open article manifest
+    - journal: This run's journal (scrape_journal.py), or None
+    - adaptive: Let the AIMD controller find the sustainable rate
+    - source_rate: Articles per minute per source (0 = no per-source limit)
+    - render_mode: "auto" (learned per source), "js" or "static"
+    - pipeline: From create_stream_pipeline() for --stream mode, or None
+    
+    RETURNS:
+    - A dictionary with the run counters (see handle_scrape_result)
+    """
+    run_stats = {
+        "done": 0,
+        "total": len(articles_to_scrape),
+        "scraped": 0,
+        "errors": 0,
+        "throttled": 0,
+        "retries": 0,
+        "requests_static": 0,
+        "requests_js": 0,
+        "escalated": 0,
+        "duplicates": 0,
+        "by_source": {},
+        "fresh_seconds": [],
+        "searchable_seconds": [],
+    }
+    
+    controller = create_controller(concurrency, adaptive)
+    session = create_http_session(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    scheduler = create_scheduler(articles_to_scrape, source_rate)
+    strategy = render_strategy.load_strategy()
+    run_start = time.time()
+    
+    # --stream: finished scrapes are saved raw, then flow through in-process
+    # queues: clean_worker -> embed_batcher -> saved again
+    if pipeline is not None:
+        clean_queue = asyncio.Queue()
+        embed_queue = asyncio.Queue()
+        stream_tasks = [
+            asyncio.ensure_future(clean_worker(clean_queue, embed_queue, pipeline, run_stats, manifest)),
+            asyncio.ensure_future(embed_batcher(embed_queue, pipeline, run_stats, manifest)),
+        ]
+    
+    try:
+        running = set()
+        
+        while scheduler["pending"] or running:
+            # Step 1: Start the best articles while the controller allows more
+            # in flight (tasks waiting for a retry count too)
+            wait_seconds = None
+            while scheduler["pending"] and len(running) < max(1, int(controller["limit"])):
+                item, wait_seconds = next_article(scheduler, time.time())
+                if item is None:
+                    break
+                article, article_id, source = item
+                running.add(asyncio.ensure_future(
+                    scrape_one_async(api_key, article, article_id, source, session, executor, controller, base_url, run_stats, journal,
+                                     strategy, render_mode)
+                ))
+                wait_seconds = None
+            
+            if not running:
+                # Every source with articles left is out of tokens
+                await asyncio.sleep(wait_seconds)
+                continue
+            
+            # Step 2: Wait until an article finishes (or a source gets a token back)
+            finished, running = await asyncio.wait(running, timeout=wait_seconds, return_when=asyncio.FIRST_COMPLETED)
+            
+            # Step 3: Save the finished articles
+            for task in finished:
+                try:
+                    article, article_id, source, scrape_result = task.result()
+                    if pipeline is not None:
+                        save_for_stream(clean_queue, article, article_id, source, scrape_result, run_stats, manifest, journal)
+                    else:
+                        handle_scrape_result(article, article_id, source, scrape_result, run_stats, manifest, journal)
+                    if get_article_age_hours(article, run_start) < FRESH_HOURS:
+                        run_stats["fresh_seconds"].append(time.time() - run_start)
+                except Exception as exc:
+                    run_stats["done"] += 1
+                    print(f"[{run_stats['done']}/{run_stats['total']}] [EXCEPTION] {exc}")
+                    run_stats["errors"] += 1
+        
+        # Let the last articles through the cleaner and the embedder
+        if pipeline is not None:
+            await clean_queue.put(None)
+            await asyncio.gather(*stream_tasks)
+    finally:
+        executor.shutdown(wait=True)
+        session.close()
+        # Keep what we learned about the sources, even after Ctrl+C
+        if render_mode == "auto":
+            render_strategy.save_strategy(strategy)
+    
+    run_stats["final_limit"] = int(controller["limit"])
+    run_stats["peak_limit"] = controller["peak_limit"]
+    return run_stats
+
 
 def main():
     """
     Main function that runs the scraper.
     """
+    global STORAGE_MODE
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Scrape articles using ScrapingBee")
     parser.add_argument(
@@ -476,10 +1482,59 @@ def main():
         default=False,
         help="Re-scrape only articles that previously failed (e.g. timeouts)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=SCRAPE_CONCURRENCY,
+        help=f"Requests in flight at once, set to your ScrapingBee plan's limit (default: {SCRAPE_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--base-url",
+        type=str,
+        default=SCRAPINGBEE_URL,
+        help="ScrapingBee endpoint, e.g. a local stand-in server for load tests"
+    )
+    parser.add_argument(
+        "--storage",
+        choices=["blob", "inline"],
+        default=STORAGE_MODE,
+        help=f"Where to keep the raw page: compressed blob store or inside the article file (default: {STORAGE_MODE})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="Continue the last interrupted run exactly where it stopped"
+    )
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        default=False,
+        help="Always keep --concurrency requests in flight (no AIMD controller)"
+    )
+    parser.add_argument(
+        "--render",
+        choices=["auto", "js", "static"],
+        default=RENDER_MODE,
+        help=f"JavaScript rendering: learned per source, always, or never (default: {RENDER_MODE})"
+    )
+    parser.add_argument(
+        "--source-rate",
+        type=float,
+        default=SOURCE_RATE_PER_MINUTE,
+        help=f"Maximum articles per minute from one source, 0 = no limit (default: {SOURCE_RATE_PER_MINUTE})"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="Clean and embed every article right after scraping (needs the embedder's credentials)"
+    )
     args = parser.parse_args()
     
     # Handle skip-existing flags
     skip_existing = not args.no_skip_existing
+    STORAGE_MODE = args.storage
     
     print("=" * 60)
     print("ARTICLE SCRAPER - Starting")
@@ -487,7 +1542,9 @@ def main():
     print()
     
     # Show what options are active
-    if args.retry_failed:
+    if args.resume:
+        print("[INFO] Mode: RESUME - Continuing the last interrupted run")
+    elif args.retry_failed:
         print("[INFO] Mode: RETRY FAILED - Re-scraping previously failed articles")
     elif args.per_source:
         print(f"[INFO] Mode: Scrape up to {args.per_source} articles PER SOURCE")
@@ -502,34 +1559,69 @@ def main():
     print("[INFO] ScrapingBee API key loaded")
     print()
     
+    # Open the article manifest (built from data/articles on the first run)
+    manifest = article_manifest.open_manifest(articles_dir=OUTPUT_DIR)
+    
+    # A crash during an atomic write can leave a temporary file behind
+    removed = scrape_journal.remove_temp_files(OUTPUT_DIR)
+    if removed:
+        print(f"[INFO] Removed {removed} temporary files left by an interrupted run")
+    
+    unfinished_journal = scrape_journal.find_unfinished_journal()
+    journal = None
+    
     # =========================================================================
-    # RETRY-FAILED MODE: scan existing articles for failed scrapes
+    # RESUME MODE: continue the plan of the last interrupted run
     # =========================================================================
-    if args.retry_failed:
-        failed_articles = find_failed_articles(OUTPUT_DIR)
+    if args.resume:
+        if unfinished_journal is None:
+            print("[INFO] No interrupted run found. Nothing to resume!")
+            manifest.close()
+            return
         
-        # Optionally filter by source
-        if args.source:
-            source_upper = args.source.upper()
-            failed_articles = [(fp, d) for fp, d in failed_articles if d.get("source", "").upper() == source_upper]
+        articles_to_scrape, done_count, saved_ids = scrape_journal.load_remaining_plan(unfinished_journal, OUTPUT_DIR)
+        print(f"[INFO] Resuming {unfinished_journal}")
+        print(f"[INFO]   Already done: {done_count}, saved right before the crash: {len(saved_ids)}")
+        print(f"[INFO]   Still to scrape: {len(articles_to_scrape)}")
+        
+        # Files saved right before the crash may be missing from the manifest
+        for article_id in saved_ids:
+            with open(os.path.join(OUTPUT_DIR, f"{article_id}.json"), "r", encoding="utf-8") as f:
+                article_manifest.record_scrape(manifest, json.load(f))
         
-        print(f"[INFO] Found {len(failed_articles)} failed articles to retry")
+        journal = scrape_journal.reopen_journal(unfinished_journal)
         
-        if not failed_articles:
+        if args.limit and len(articles_to_scrape) > args.limit:
+            articles_to_scrape = sort_by_priority(articles_to_scrape)[:args.limit]
+            print(f"[INFO] Limited to: {len(articles_to_scrape)} articles")
+    
+    # =========================================================================
+    # RETRY-FAILED MODE: look up failed scrapes in the manifest
+    # =========================================================================
+    elif args.retry_failed:
+        # Optionally filter by source (done by the manifest query)
+        failed_rows = article_manifest.list_failed(manifest, args.source)
+        
+        print(f"[INFO] Found {len(failed_rows)} failed articles to retry")
+        
+        if not failed_rows:
             print("[INFO] No failed articles found. Nothing to retry!")
+            manifest.close()
             return
         
         # Show breakdown by source
         from collections import Counter
-        source_counts = Counter(d.get("source", "UNKNOWN") for _, d in failed_articles)
+        source_counts = Counter(source or "UNKNOWN" for _, source in failed_rows)
         for src, cnt in source_counts.most_common():
             print(f"[INFO]   - {src}: {cnt} failed")
         print()
         
-        # Apply limit if specified
-        if args.limit and len(failed_articles) > args.limit:
-            failed_articles = failed_articles[:args.limit]
-            print(f"[INFO] Limited to: {len(failed_articles)} articles")
+        # Apply limit if specified (before reading any file)
+        if args.limit and len(failed_rows) > args.limit:
+            failed_rows = failed_rows[:args.limit]
+            print(f"[INFO] Limited to: {len(failed_rows)} articles")
+        
+        failed_articles = load_failed_articles(OUTPUT_DIR, failed_rows)
         
         # Build articles_to_scrape from failed articles
         # We reconstruct the article metadata from the saved JSON
@@ -546,50 +1638,48 @@ def main():
     # NORMAL MODE: discover articles from JSONL files
     # =========================================================================
     else:
-        # Step 2: Find all JSONL files
-        jsonl_files = find_latest_jsonl_files(INPUT_DIR)
+        # Step 2: Find all sources (compacted stores + new JSONL files)
+        print(f"[INFO] Looking for indexed links in: {LINK_STORE_DIR} and {INPUT_DIR}")
+        sources = link_store.list_sources(INPUT_DIR, LINK_STORE_DIR)
         
-        if not jsonl_files:
-            print("[ERROR] No JSONL files found. Run 01__indexer.py first!")
+        if not sources:
+            print("[ERROR] No indexed links found. Run 01__indexer.py first!")
             return
         
-        print()
-        
-        # Step 3: Load articles and organize by source
-        # We'll use a dictionary: { "PUBLICO": [article1, article2, ...], ... }
-        articles_by_source = {}
-        
-        for jsonl_path in jsonl_files:
-            articles = load_articles_from_jsonl(jsonl_path)
-            for article in articles:
-                source = article.get("source", "UNKNOWN")
-                if source not in articles_by_source:
-                    articles_by_source[source] = []
-                articles_by_source[source].append(article)
-        
-        print()
-        print(f"[INFO] Found {len(articles_by_source)} sources:")
-        for source, articles in articles_by_source.items():
-            print(f"[INFO]   - {source}: {len(articles)} articles")
+        print(f"[INFO] Found {len(sources)} sources")
         print()
         
         # Filter to specific source if --source is given
         if args.source:
             source_upper = args.source.upper()
-            if source_upper not in articles_by_source:
-                print(f"[ERROR] Source '{args.source}' not found. Available: {', '.join(sorted(articles_by_source.keys()))}")
+            if source_upper not in sources:
+                print(f"[ERROR] Source '{args.source}' not found. Available: {', '.join(sources)}")
                 return
-            articles_by_source = {source_upper: articles_by_source[source_upper]}
-            print(f"[INFO] Filtered to source: {source_upper} ({len(articles_by_source[source_upper])} articles)")
+            sources = [source_upper]
+            print(f"[INFO] Filtered to source: {source_upper}")
             print()
         
-        # Step 4: Build list of articles to scrape, respecting per-source limit
+        # Step 3: Stream each source's links and build the list to scrape
+        # We never load the whole link history: link_store yields one article
+        # at a time and each link only once.
         articles_to_scrape = []
         
-        for source, articles in articles_by_source.items():
+        # Everything we already have a file for (one query instead of one
+        # os.path.exists per candidate)
+        scraped_ids = set()
+        if skip_existing:
+            scraped_ids = article_manifest.get_article_ids(manifest)
+        
+        # IDs picked in this run: the same article can be in several feeds,
+        # or twice with different tracking parameters
+        selected_ids = set()
+        
+        for source in sources:
             source_count = 0
+            scanned_count = 0
             
-            for article in articles:
+            for article in link_store.iter_source_articles(source, INPUT_DIR, LINK_STORE_DIR):
+                scanned_count += 1
                 link = article.get("link")
                 if not link:
                     continue
@@ -600,98 +1690,115 @@ def main():
                     continue
                 
                 article_id = create_article_id(link)
+                if article_id in selected_ids:
+                    continue
                 
-                # Skip if already scraped (unless --no-skip-existing)
-                if skip_existing and article_already_scraped(article_id, OUTPUT_DIR):
+                # Skip if already scraped (unless --no-skip-existing),
+                # also when it was saved under its old, non-canonical ID
+                if skip_existing and (article_id in scraped_ids or create_legacy_article_id(link) in scraped_ids):
                     continue
                 
                 # Check per-source limit
                 if args.per_source and source_count >= args.per_source:
                     break
                 
-                articles_to_scrape.append((article, article_id, source))
+                articles_to_scrape.append((article, article_id, article.get("source", source)))
+                selected_ids.add(article_id)
                 source_count += 1
             
             if args.per_source:
-                print(f"[INFO] {source}: selected {source_count} articles (limit: {args.per_source})")
+                print(f"[INFO]   - {source}: {scanned_count} links scanned, selected {source_count} (limit: {args.per_source})")
+            else:
+                print(f"[INFO]   - {source}: {scanned_count} links scanned, selected {source_count}")
         
         print()
         print(f"[INFO] Total articles to scrape: {len(articles_to_scrape)}")
         
-        # Apply global limit if specified
+        # Apply global limit if specified (keeping the highest-priority articles)
         if args.limit and len(articles_to_scrape) > args.limit:
-            articles_to_scrape = articles_to_scrape[:args.limit]
-            print(f"[INFO] Limited to: {len(articles_to_scrape)} articles (global limit)")
+            articles_to_scrape = sort_by_priority(articles_to_scrape)[:args.limit]
+            print(f"[INFO] Limited to: {len(articles_to_scrape)} articles (global limit, freshest first)")
     
     if len(articles_to_scrape) == 0:
         print("[INFO] No new articles to scrape!")
+        if journal is not None:
+            scrape_journal.finish_journal(journal)
+        manifest.close()
         return
     
+    # --stream: set up the cleaner and the embedder before spending credits,
+    # and before writing the plan (a run that never starts leaves no journal)
+    pipeline = None
+    if args.stream:
+        print("[INFO] Streaming mode: each article is cleaned and embedded right after scraping")
+        pipeline = create_stream_pipeline(manifest)
+        if pipeline is None:
+            if journal is not None:
+                scrape_journal.close_journal(journal)  # A resumed run stays resumable
+            manifest.close()
+            return
+    
+    # Write the plan before spending any credits
+    if journal is None:
+        if unfinished_journal:
+            print(f"[WARNING] An interrupted run was found ({unfinished_journal}).")
+            print("[WARNING] Use --resume to continue it; starting a new run now.")
+        journal = scrape_journal.start_journal(articles_to_scrape)
+    
     print()
     print("-" * 60)
     print()
     
-    # Step 5: Scrape articles in parallel
-    print(f"[INFO] Starting parallel scraping with 5 workers...")
-    print(f"[INFO] JavaScript rendering: ENABLED (slower)")
-    print()
-
-    scraped_count = 0
-    error_count = 0
-    results_by_source = {}  # Track success/failure by source
+    # Step 5: Scrape articles concurrently
+    if args.no_adaptive:
+        print(f"[INFO] Starting async scraping with {args.concurrency} requests in flight...")
+    else:
+        print(f"[INFO] Starting async scraping, adaptive concurrency up to {args.concurrency} requests in flight...")
+    print(f"[INFO] Endpoint: {args.base_url}")
+    if args.source_rate > 0:
+        print(f"[INFO] Order: freshest / most valuable first, at most {args.source_rate:g} articles per minute per source")
+    else:
+        print("[INFO] Order: freshest / most valuable first, no per-source limit")
+    if args.render == "auto":
+        print("[INFO] JavaScript rendering: learned per source (static first, see render_strategy.py)")
+    elif args.render == "js":
+        print("[INFO] JavaScript rendering: ENABLED (slower)")
+    else:
+        print("[INFO] JavaScript rendering: DISABLED")
     
-    # We use ThreadPoolExecutor to run multiple requests at the same time
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    print()
 
     # Cleaning logic removed - moved to 03__cleaner.py 
+    # (except in --stream mode, which calls the cleaner in-process)
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit all tasks to the executor
-        future_to_article = {
-            executor.submit(scrape_article, api_key, article["link"]): (article, article_id, source)
-            for article, article_id, source in articles_to_scrape
-        }
-        
-        # Process results as they complete
-        for i, future in enumerate(as_completed(future_to_article), start=1):
-            article, article_id, source = future_to_article[future]
-            
-            try:
-                scrape_result = future.result()
-                
-                # Build the full article data
-                article_data = {
-                    "id": article_id,
-                    "link": article["link"],
-                    "source": source,
-                    "metadata": article,
-                    "scraped_at": datetime.now().isoformat(),
-                    "scrapingbee": scrape_result,
-                    # We NO LONGER clean here. 
-                    # "text" field is omitted or can be raw content if needed for downstream compatibility mostly
-                    # But the new cleaner will generate the "text" field.
-                    # For now, let's just save the raw structure.
-                }
-                
-                # Track results by source
-                if source not in results_by_source:
-                    results_by_source[source] = {"success": 0, "error": 0}
-                
-                # Save the article
-                if scrape_result.get("success"):
-                    filepath = save_article(article_data, OUTPUT_DIR)
-                    print(f"[{i}/{len(articles_to_scrape)}] [SUCCESS] {source}: {article['link'][:60]}...")
-                    scraped_count += 1
-                    results_by_source[source]["success"] += 1
-                else:
-                    filepath = save_article(article_data, OUTPUT_DIR)
-                    print(f"[{i}/{len(articles_to_scrape)}] [ERROR] {source}: {article['link'][:60]}...")
-                    error_count += 1
-                    results_by_source[source]["error"] += 1
-
-            except Exception as exc:
-                print(f"[{i}/{len(articles_to_scrape)}] [EXCEPTION] {source}: {exc}")
-                error_count += 1
+    scrape_start = time.time()
+    try:
+        run_stats = asyncio.run(
+            scrape_articles_async(api_key, articles_to_scrape, args.concurrency, args.base_url, manifest, journal,
+                                  not args.no_adaptive, args.source_rate, args.render, pipeline)
+        )
+    except KeyboardInterrupt:
+        print()
+        print("[WARNING] Interrupted! Continue later with: python src/02__scraper.py --resume")
+        scrape_journal.close_journal(journal)
+        manifest.close()
+        return
+    finally:
+        if pipeline is not None:
+            pipeline["executor"].shutdown(wait=True)
+    
+    # With --limit on a resumed run, part of the plan may still be left
+    if args.resume and scrape_journal.load_remaining_plan(journal["path"], OUTPUT_DIR)[0]:
+        scrape_journal.close_journal(journal)
+        print("[INFO] Part of the interrupted run is still left (run --resume again)")
+    else:
+        scrape_journal.finish_journal(journal)
+    manifest.close()
+    scrape_seconds = time.time() - scrape_start
+    
+    scraped_count = run_stats["scraped"]
+    error_count = run_stats["errors"]
+    results_by_source = run_stats["by_source"]
 
     
     # Step 6: Print summary
@@ -704,6 +1811,23 @@ def main():
     print(f"Total articles processed: {scraped_count + error_count}")
     print(f"  Successful: {scraped_count}")
     print(f"  Errors: {error_count}")
+    print(f"Time: {scrape_seconds:.1f}s ({(scraped_count + error_count) / max(scrape_seconds, 0.001):.2f} articles/s)")
+    print(f"Throttled answers: {run_stats['throttled']} ({run_stats['retries']} retried inline)")
+    credits = (run_stats["requests_static"] * render_strategy.CREDITS_STATIC
+               + run_stats["requests_js"] * render_strategy.CREDITS_JS)
+    print(f"Requests: {run_stats['requests_static']} static, {run_stats['requests_js']} with JavaScript "
+          f"({run_stats['escalated']} escalated), about {credits} credits")
+    if run_stats["duplicates"]:
+        print(f"Duplicates: {run_stats['duplicates']} (same page or text as an article we already had, not cleaned/embedded again)")
+    print(f"Requests in flight: peak {run_stats['peak_limit']}, final {run_stats['final_limit']} (max {args.concurrency})")
+    fresh_seconds = sorted(run_stats["fresh_seconds"])
+    if fresh_seconds:
+        print(f"Fresh articles (< {FRESH_HOURS}h old): {len(fresh_seconds)}, "
+              f"half saved after {fresh_seconds[len(fresh_seconds) // 2]:.1f}s, all after {fresh_seconds[-1]:.1f}s")
+    searchable_seconds = sorted(run_stats["searchable_seconds"])
+    if searchable_seconds:
+        print(f"Streamed to the vector database: {len(searchable_seconds)} articles, searchable "
+              f"{searchable_seconds[len(searchable_seconds) // 2]:.0f}s (median) after indexing")
     print()
     print("Results by source:")
     for source, counts in sorted(results_by_source.items()):
@@ -20,31 +20,133 @@ HOW TO RUN:
 
     # Force re-clean all articles (overwrite existing "text" field)
     python 03__cleaner.py --force
+
+    # Use 4 worker processes (default: one per CPU core)
+    python 03__cleaner.py --workers 4
+
+    # Old behaviour: 10 threads in one process
+    python 03__cleaner.py --threads
+
+WHY PROCESSES:
+Cleaning is CPU work (the regex passes of the cleaners, JSON decode and
+encode). In one process, Python's GIL lets only one thread run that at a
+time, so 10 threads were hardly faster than one. Each worker process has
+its own interpreter, so a full "--force" re-clean scales with the number of
+cores. The files are handed out in chunks (fewer round trips between the
+processes), every worker imports only the cleaners of the sources it
+meets (see LAZY LOADING in cleaners/dispatcher.py), and a worker only
+sends back a small result tuple - the cleaned article
+itself is written to disk by the worker.
+
+Articles scraped with "02__scraper.py --stream" are already cleaned (and
+embedded) when they are saved, so this step skips them.
+
+DUPLICATES:
+Articles the scraper marked as duplicates (same raw page as an article we
+already have) are not cleaned. After cleaning, articles whose cleaned text
+is the same as another article's (the same wire story from two outlets)
+are marked too, so the embedder and the report generator skip them
+(see article_manifest.py).
+
+Every cleaned article is also added to the near-duplicate index
+(near_duplicates.py), which puts lightly edited copies of the same story
+in one cluster.
 """
 
 import argparse
 import json
 import os
+import signal
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 # Add current directory to path so we can import 'cleaners'
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from cleaners import clean_and_enrich_text
+    from cleaners import clean_and_enrich_text, find_cleaner_module, CLEANER_VERSION
 except ImportError:
     print("[ERROR] Could not import 'cleaners' package. Make sure you are running from the project root.")
     sys.exit(1)
 
+import article_manifest  # Index of the files in data/articles (article_manifest.py)
+import blob_store        # Compressed store for the raw pages (blob_store.py)
+import near_duplicates   # MinHash/LSH near-duplicate clusters (near_duplicates.py)
+
 # Configuration
 INPUT_DIR = "data/articles"
 
+# Worker processes (default: one per CPU core; change with --workers)
+CLEAN_WORKERS = os.cpu_count() or 1
+
+# Threads for --threads mode (the old behaviour)
+THREAD_WORKERS = 10
+
+# Files per task sent to a worker process: about CHUNKS_PER_WORKER chunks
+# per worker (so a slow chunk doesn't leave the others idle at the end),
+# but never more than MAX_CHUNKSIZE files at once
+CHUNKS_PER_WORKER = 4
+MAX_CHUNKSIZE = 64
+
+# Options of this worker process (set by init_worker)
+WORKER_OPTIONS = {"force": False}
+
+def clean_article_data(data, raw_text=None):
+    """
+    Clean one article dictionary in memory (adds "text", "is_valid_article"
+    and "cleaner_version"). Used by process_article() below and by the
+    scraper's --stream mode, which cleans an article before it is ever saved.
+    
+    PARAMETERS:
+    - data: The article dictionary (as saved by 02__scraper.py)
+    - raw_text: The raw page, if the caller already has it (else it is loaded)
+    
+    RETURNS:
+    - "CLEANED", "FILTERED" (nothing left after cleaning) or "ERROR" (no content)
+    """
+    # Extract raw content
+    # Blob mode keeps 'scrapingbee.content_blob' (compressed, in data/blobs)
+    # Scraper v2 inline mode saves 'scrapingbee' object with 'content'
+    # Archive files use 'scrapingbee.body' instead
+    if raw_text is None:
+        raw_text = blob_store.load_raw_content(data)
+    if raw_text is None:
+        return "ERROR"
+
+    # Apply Cleaning
+    metadata = data.get("metadata", {})
+    # Ensure metadata has tags and source if missing (backfill)
+    if "tags" not in metadata: metadata["tags"] = []
+    # Add scraped_at to metadata for cleaners that need it (e.g., Skift)
+    if "scraped_at" in data:
+        metadata["scraped_at"] = data["scraped_at"]
+    
+    cleaned_text = clean_and_enrich_text(raw_text, metadata)
+    
+    # Check for empty result (filtered)
+    if not cleaned_text.strip():
+        # semantic decision: keep the file but text is empty?
+        # Or mark as invalid?
+        data["is_valid_article"] = False
+        data["text"] = "" 
+        # We save it anyway so we know we processed it
+        status = "FILTERED"
+    else:
+        data["is_valid_article"] = True
+        data["text"] = cleaned_text
+        status = "CLEANED"
+    
+    data["cleaner_version"] = CLEANER_VERSION
+    return status
+
+
 def process_article(filepath, force=False):
     """
     Load, clean, and save a single article.
-    Returns: (status, source, title)
+    Returns: (status, source, filepath, text_hash, signature)
     """
     try:
         with open(filepath, "r", encoding="utf-8") as f:
@@ -52,58 +154,68 @@ def process_article(filepath, force=False):
         
         # Check if already cleaned
         if not force and "text" in data and data["text"]:
-            return "SKIPPED", data.get("source", "UNKNOWN"), filepath
-            
-        # Extract raw content
-        # Scraper v2 saves 'scrapingbee' object with 'content'
-        # Archive files use 'scrapingbee.body' instead
-        if "scrapingbee" in data and "content" in data["scrapingbee"]:
-            raw_text = data["scrapingbee"]["content"]
-        elif "scrapingbee" in data and "body" in data["scrapingbee"]:
-            raw_text = data["scrapingbee"]["body"]
-        elif "content" in data: # Fallback for older format if exists
-            raw_text = data["content"]
-        else:
-            print(f"[WARNING] No content found in {filepath}")
-            return "ERROR", "UNKNOWN", filepath
-
-        # Apply Cleaning
-        metadata = data.get("metadata", {})
-        # Ensure metadata has tags and source if missing (backfill)
-        if "tags" not in metadata: metadata["tags"] = []
-        # Add scraped_at to metadata for cleaners that need it (e.g., Skift)
-        if "scraped_at" in data:
-            metadata["scraped_at"] = data["scraped_at"]
+            return "SKIPPED", data.get("source", "UNKNOWN"), filepath, None, None
         
-        cleaned_text = clean_and_enrich_text(raw_text, metadata)
-        
-        # Check for empty result (filtered)
-        if not cleaned_text.strip():
-            # semantic decision: keep the file but text is empty?
-            # Or mark as invalid?
-            data["is_valid_article"] = False
-            data["text"] = "" 
-            # We save it anyway so we know we processed it
-            status = "FILTERED"
-        else:
-            data["is_valid_article"] = True
-            data["text"] = cleaned_text
-            status = "CLEANED"
+        status = clean_article_data(data)
+        if status == "ERROR":
+            print(f"[WARNING] No content found in {filepath}")
+            return "ERROR", "UNKNOWN", filepath, None, None
             
-        # Save back to file
-        with open(filepath, "w", encoding="utf-8") as f:
+        # Save back to file (temporary file + rename, so a crash never
+        # leaves a half-written article behind)
+        temp_path = str(filepath) + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, filepath)
             
-        return status, data.get("source", "UNKNOWN"), filepath
+        # The fingerprints are computed here, in the worker thread
+        text_hash = article_manifest.get_text_hash(data["text"])
+        signature = near_duplicates.compute_signature(data["text"])
+        return status, data.get("source", "UNKNOWN"), filepath, text_hash, signature
 
     except Exception as e:
         print(f"[ERROR] Failed to process {filepath}: {e}")
-        return "ERROR", "UNKNOWN", filepath
+        return "ERROR", "UNKNOWN", filepath, None, None
+
+def init_worker(force):
+    """
+    Runs once in every worker process, before its first article.
+    
+    PARAMETERS:
+    - force: The --force option (so each task only needs the file path)
+    """
+    # Ctrl+C is handled by the main process, which stops the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    # Read the cleaner registry here, once per worker. A forked worker already
+    # has it; a spawned one (Windows, macOS) reads it now. The cleaner modules
+    # themselves are imported on first use.
+    import cleaners
+    WORKER_OPTIONS["force"] = force
+
+
+def process_article_in_worker(filepath):
+    """
+    process_article() with the worker's options (runs in a worker process).
+    """
+    return process_article(filepath, WORKER_OPTIONS["force"])
+
+
+def get_chunksize(file_count, workers):
+    """
+    How many files to send to a worker process at once.
+    """
+    return max(1, min(MAX_CHUNKSIZE, file_count // (workers * CHUNKS_PER_WORKER)))
+
 
 def main():
     parser = argparse.ArgumentParser(description="Clean raw articles")
     parser.add_argument("--source", help="Limit to specific source (e.g., PUBLICO)")
     parser.add_argument("--force", action="store_true", help="Re-clean even if 'text' exists")
+    parser.add_argument("--workers", type=int, default=CLEAN_WORKERS,
+                        help=f"Worker processes (default: {CLEAN_WORKERS}, one per CPU core)")
+    parser.add_argument("--threads", action="store_true",
+                        help=f"Use {THREAD_WORKERS} threads in one process instead of worker processes")
     args = parser.parse_args()
     
     print("="*60)
@@ -117,40 +229,90 @@ def main():
         print("[ERROR] No articles found in data/articles/")
         return
 
-    # Filter by source if requested
-    # We have to peek at the file or assume filename doesn't have source.
-    # Actually, we can't easily filter by source without opening the file, 
-    # unless we iterate all and check.
+    # The article manifest knows the source of every file (no need to open them)
+    manifest = article_manifest.open_manifest(articles_dir=INPUT_DIR)
     
-    files_to_process = all_files
-    print(f"[INFO] Found {len(files_to_process)} files total.")
+    # Filter by source if requested
+    if args.source:
+        source_ids = article_manifest.get_article_ids(manifest, args.source, partial=True)
+        files_to_process = [f for f in all_files if f.stem in source_ids]
+        print(f"[INFO] Found {len(all_files)} files total, {len(files_to_process)} from '{args.source}'.")
+    else:
+        files_to_process = all_files
+        print(f"[INFO] Found {len(files_to_process)} files total.")
     
     # Processing
-    stats = {"CLEANED": 0, "SKIPPED": 0, "FILTERED": 0, "ERROR": 0}
+    stats = {"CLEANED": 0, "SKIPPED": 0, "FILTERED": 0, "ERROR": 0, "DUPLICATE": 0}
+    cleaned_rows = []  # (article_id, cleaner_version, cleaned_at, text_hash) for the manifest
+    signatures = {}    # article_id -> MinHash signature, for the near-duplicate index
+    unknown_sources = {}  # source -> articles cleaned without a source cleaner
     
-    # We'll need to read files to check source if filtering
-    # Multi-threaded for speed (IO bound-ish, but json parsing is CPU)
+    # Don't clean pages we already have under another ID
+    duplicate_ids = article_manifest.get_duplicate_ids(manifest)
+    if duplicate_ids:
+        before = len(files_to_process)
+        files_to_process = [f for f in files_to_process if f.stem not in duplicate_ids]
+        stats["DUPLICATE"] = before - len(files_to_process)
+        print(f"[INFO] Skipping {stats['DUPLICATE']} duplicate articles.")
     
-    print(f"[INFO] Processing with 10 threads...")
+    # Cleaning is CPU work: worker processes, so it runs on every core
+    # (see WHY PROCESSES at the top). Results come back in file order.
+    clean_start = time.time()
+    if args.threads:
+        print(f"[INFO] Processing with {THREAD_WORKERS} threads...")
+        executor = ThreadPoolExecutor(max_workers=THREAD_WORKERS)
+        results = executor.map(process_article, files_to_process, [args.force] * len(files_to_process))
+    else:
+        workers = max(1, args.workers)
+        chunksize = get_chunksize(len(files_to_process), workers)
+        print(f"[INFO] Processing with {workers} worker processes ({chunksize} files per task)...")
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(args.force,))
+        results = executor.map(process_article_in_worker, files_to_process, chunksize=chunksize)
     
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {executor.submit(process_article, f, args.force): f for f in files_to_process}
-        
-        for i, future in enumerate(as_completed(futures), 1):
-            f = futures[future]
-            status, source, path = future.result()
+    with executor:
+        for i, (status, source, path, text_hash, signature) in enumerate(results, 1):
             
             # Source filtering check (post-processing check effectively)
             if args.source and args.source.upper() not in source.upper():
                 continue
                 
             stats[status] += 1
+            if status in ("CLEANED", "FILTERED"):
+                cleaned_rows.append((path.stem, CLEANER_VERSION, datetime.now().isoformat(), text_hash))
+                signatures[path.stem] = signature
+                # The workers count these too, but their counts stay in the workers
+                if find_cleaner_module(source) is None:
+                    unknown_sources[source] = unknown_sources.get(source, 0) + 1
             if status == "CLEANED":
                 print(f"[{i}/{len(files_to_process)}] [CLEANED] {source}: {path.name}")
             elif status == "FILTERED":
                 print(f"[{i}/{len(files_to_process)}] [FILTERED] {source}: {path.name} (Empty content)")
             elif status == "ERROR":
                 print(f"[{i}/{len(files_to_process)}] [ERROR] {path.name}")
+    clean_seconds = time.time() - clean_start
+            
+    # Remember which cleaner version produced each "text"
+    article_manifest.record_cleaned(manifest, cleaned_rows)
+    
+    # Mark articles with the same cleaned text (the earliest scraped one stays)
+    if cleaned_rows:
+        article_manifest.mark_all_duplicates(manifest)
+        all_duplicate_ids = article_manifest.get_duplicate_ids(manifest)
+        text_duplicates = len(all_duplicate_ids - duplicate_ids)
+    else:
+        all_duplicate_ids = duplicate_ids
+        text_duplicates = 0
+    
+    # Put the new texts in the near-duplicate index (one transaction)
+    near_duplicates.ensure_index(manifest)
+    clustered = 0
+    for article_id, signature in signatures.items():
+        if article_id in all_duplicate_ids:
+            continue
+        if near_duplicates.add_article(manifest, article_id, signature) != article_id:
+            clustered += 1
+    manifest.commit()
+    manifest.close()
             
     print("\n" + "="*60)
     print("SUMMARY")
@@ -158,7 +320,13 @@ def main():
     print(f"Cleaned:  {stats['CLEANED']}")
     print(f"Filtered: {stats['FILTERED']} (Empty/Invalid)")
     print(f"Skipped:  {stats['SKIPPED']} (Already done)")
+    print(f"Duplicates: {stats['DUPLICATE']} skipped, {text_duplicates} newly found (same text as another article)")
+    print(f"Near-duplicates: {clustered} joined the cluster of a similar article")
     print(f"Errors:   {stats['ERROR']}")
+    if unknown_sources:
+        counts = ", ".join(f"{source} ({count})" for source, count in sorted(unknown_sources.items()))
+        print(f"No source cleaner (generic cleaning): {sum(unknown_sources.values())} articles: {counts}")
+    print(f"Time:     {clean_seconds:.1f}s ({len(files_to_process) / max(clean_seconds, 0.001):.1f} files/s)")
 
 if __name__ == "__main__":
     main()
@@ -26,6 +26,12 @@ WHAT IS CHROMADB?
     - ChromaDB is a simple local vector database
     - It stores embeddings and lets us search for similar ones
     - No external server needed - everything is stored in a folder
+
+STREAMING MODE:
+    "02__scraper.py --stream" cleans and embeds each article right after it
+    is scraped (using build_news_document, split_document and
+    create_embeddings from this file). Articles embedded that way are
+    already in ChromaDB, so this script skips them.
 """
 
 # =============================================================================
@@ -37,6 +43,13 @@ import os          # Built-in library to work with files and folders
 from datetime import datetime  # Built-in library to work with dates and times
 from pathlib import Path       # Built-in library for file path handling
 import re
+import sys
+
+# Make sure we can import our helper modules from src/
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import date_utils              # Shared, cached date parser (date_utils.py)
+import article_manifest        # Which articles are duplicates (article_manifest.py)
+import near_duplicates         # Near-duplicate cluster of each article (near_duplicates.py)
 
 # External libraries (install with pip)
 import chromadb                # Vector database (pip install chromadb)
@@ -207,33 +220,67 @@ def normalize_tags_for_metadata(tags):
 def normalize_date_for_metadata(meta):
     """
     Pick a compact date (YYYY-MM-DD when possible) from article metadata.
+    
+    Uses the pre-parsed "published_ts" epoch from the indexer/cleaner when
+    present (no string parsing at all), otherwise the cleaner's "date" field,
+    and finally the shared cached parser in date_utils.py.
     """
-    candidates = [
-        meta.get("date"),
-        meta.get("published"),
-        meta.get("updated"),
-    ]
-    for raw in candidates:
-        if not raw:
-            continue
-        s = str(raw).strip()
-        if not s:
-            continue
-        # Fast path for ISO-like date prefix.
-        if re.match(r"^\d{4}-\d{2}-\d{2}", s):
-            return s[:10]
-        # RFC-like dates often contain day/month/year tokens.
-        # Try datetime parser for strings already normalized by Python.
-        try:
-            dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-            return dt.strftime("%Y-%m-%d")
-        except Exception:
-            pass
-        # Last fallback: return raw string so metadata is never empty if present.
-        return s
+    epoch = get_publication_epoch(meta)
+    if epoch is not None:
+        return date_utils.epoch_to_iso_date(epoch)
+    
+    # Last fallback: return raw string so metadata is never empty if present.
+    for raw in [meta.get("date"), meta.get("published"), meta.get("updated")]:
+        if raw and str(raw).strip() and str(raw).strip() != "Unknown Date":
+            return str(raw).strip()
     return ""
 
 
+def get_publication_epoch(meta):
+    """
+    Get the publication time of an article as a Unix timestamp (UTC), or None.
+    
+    Stored as "date_ts" in the chunk metadata so time-window queries can use
+    a simple integer filter, e.g. where={"date_ts": {"$gte": cutoff}}.
+    """
+    return date_utils.get_meta_epoch(meta, ["date", "published", "updated"])
+
+
+def build_news_document(doc):
+    """
+    Turn a saved (and cleaned) article into a document for embedding.
+    
+    Used by load_documents() and by the scraper's --stream mode.
+    
+    PARAMETERS:
+    - doc: The article dictionary from data/articles
+    
+    RETURNS:
+    - A document dictionary, or None if the article has no usable text
+    """
+    # ONLY use cleaned text from 03__cleaner.py - no fallback to raw
+    content = doc.get("text", "")
+    
+    if not content or len(content) <= 100:
+        return None
+    
+    meta = doc.get("metadata", {}) or {}
+    return {
+        "id": doc.get("id"),
+        "type": "news",
+        "source": doc.get("source"),
+        "title": meta.get("title", ""),
+        "url": doc.get("link"),
+        "content": content,
+        "date": normalize_date_for_metadata(meta),
+        "date_ts": get_publication_epoch(meta),
+        "tags": normalize_tags_for_metadata(meta.get("tags")),
+        # Near-duplicate cluster (near_duplicates.py); an article nobody
+        # copied is its own cluster
+        "cluster_id": doc.get("cluster_id") or doc.get("id"),
+    }
+
+
 def load_documents(source_filter=None):
     """
     Load all documents from our data directories.
@@ -251,7 +298,17 @@ def load_documents(source_filter=None):
         print(f"[INFO] Loading news articles from {NEWS_DIR}...")
         news_files = list(Path(NEWS_DIR).glob("*.json"))
         
+        # Articles with the same page/text as another one are embedded once
+        manifest = article_manifest.open_manifest(articles_dir=NEWS_DIR)
+        duplicate_ids = article_manifest.get_duplicate_ids(manifest)
+        cluster_ids = near_duplicates.get_cluster_ids(manifest)
+        manifest.close()
+        skipped_duplicates = 0
+        
         for filepath in news_files:
+            if filepath.stem in duplicate_ids:
+                skipped_duplicates += 1
+                continue
             try:
                 with open(filepath, "r", encoding="utf-8") as f:
                     doc = json.load(f)
@@ -261,26 +318,21 @@ def load_documents(source_filter=None):
                 if source_filter and doc_source != source_filter:
                     continue
                 
-                # Extract the content we need
-                # ONLY use cleaned text from 03__cleaner.py - no fallback to raw
-                content = doc.get("text", "")
+                if doc.get("duplicate_of"):
+                    skipped_duplicates += 1
+                    continue
                 
-                if content and len(content) > 100:
-                    meta = doc.get("metadata", {}) or {}
-                    documents.append({
-                        "id": doc.get("id"),
-                        "type": "news",
-                        "source": doc.get("source"),
-                        "title": doc.get("metadata", {}).get("title", ""),
-                        "url": doc.get("link"),
-                        "content": content,
-                        "date": normalize_date_for_metadata(meta),
-                        "tags": normalize_tags_for_metadata(meta.get("tags")),
-                    })
+                # Extract the content we need
+                doc["cluster_id"] = cluster_ids.get(doc.get("id"))
+                document = build_news_document(doc)
+                if document is not None:
+                    documents.append(document)
             except Exception as e:
                 print(f"[WARNING] Failed to load {filepath}: {e}")
         
         print(f"[INFO]   Loaded {len([d for d in documents if d['type'] == 'news'])} news articles")
+        if skipped_duplicates:
+            print(f"[INFO]   Skipped {skipped_duplicates} duplicate articles")
     
     # Load Wikipedia articles
     if os.path.exists(WIKI_DIR):
@@ -375,6 +427,48 @@ def chunk_text_recursive(text, chunk_size, overlap):
     return splitter.split_text(text)
 
 
+def split_document(doc, no_chunk=False, chunk_strategy="char"):
+    """
+    Split a document into the chunks we embed.
+    
+    PARAMETERS:
+    - doc: Document dictionary (see build_news_document)
+    - no_chunk: Embed the full article as one chunk
+    - chunk_strategy: "char" (fixed size) or "recursive" (natural boundaries)
+    
+    RETURNS:
+    - A list of text chunks
+    """
+    if no_chunk:
+        return [doc["content"]]  # Full article as single chunk
+    if chunk_strategy == "recursive":
+        return chunk_text_recursive(doc["content"], MAX_CHUNK_SIZE, CHUNK_OVERLAP)
+    return chunk_text(doc["content"], MAX_CHUNK_SIZE, CHUNK_OVERLAP)
+
+
+def build_chunk_metadata(doc, chunk_index, total_chunks):
+    """
+    The metadata stored with one chunk in ChromaDB.
+    """
+    chunk_metadata = {
+        "doc_id": doc["id"],
+        "type": doc["type"],
+        "source": doc["source"],
+        "date": doc.get("date", ""),
+        "tags": doc.get("tags", ""),
+        "title": doc["title"],
+        "url": doc["url"] or "",
+        "chunk_index": chunk_index,
+        "total_chunks": total_chunks,
+        # Retrieval keeps one article per cluster (near_duplicates.py)
+        "cluster_id": doc.get("cluster_id") or doc["id"],
+    }
+    # ChromaDB does not accept None values, so only add a known date_ts
+    if doc.get("date_ts") is not None:
+        chunk_metadata["date_ts"] = doc["date_ts"]
+    return chunk_metadata
+
+
 def create_embedding(client, text):
     """
     Create an embedding for a piece of text using OpenAI API.
@@ -397,6 +491,35 @@ def create_embedding(client, text):
     return response.data[0].embedding
 
 
+def create_embeddings(client, texts):
+    """
+    Create the embeddings of many texts with ONE API request.
+    
+    Sending a batch is much faster than one request per chunk (used by the
+    scraper's --stream mode, which embeds chunks of several articles together).
+    
+    PARAMETERS:
+    - client: OpenAI client
+    - texts: List of texts to embed
+    
+    RETURNS:
+    - A list of embedding vectors, in the same order as "texts"
+    """
+    kwargs = {
+        "model": EMBEDDING_MODEL,
+        "input": texts,
+    }
+    if EMBEDDING_DIMS is not None:
+        kwargs["dimensions"] = EMBEDDING_DIMS
+    response = client.embeddings.create(**kwargs)
+    
+    # The API returns one item per input, each with its position
+    embeddings = [None] * len(texts)
+    for item in response.data:
+        embeddings[item.index] = item.embedding
+    return embeddings
+
+
 def setup_chromadb(reset=False, source_filter=None):
     """
     Set up ChromaDB and create/get our collection.
@@ -610,14 +733,12 @@ def main():
             continue
         
         # Chunk the document (or use full article if --no-chunk)
+        chunks = split_document(doc, args.no_chunk, args.chunk_strategy)
         if args.no_chunk:
-            chunks = [doc["content"]]  # Full article as single chunk
             print(f"[INFO]   Using full article (no chunking)")
         elif args.chunk_strategy == "recursive":
-            chunks = chunk_text_recursive(doc["content"], MAX_CHUNK_SIZE, CHUNK_OVERLAP)
             print(f"[INFO]   Split into {len(chunks)} chunks (recursive)")
         else:
-            chunks = chunk_text(doc["content"], MAX_CHUNK_SIZE, CHUNK_OVERLAP)
             print(f"[INFO]   Split into {len(chunks)} chunks")
         
         # Process each chunk
@@ -629,22 +750,15 @@ def main():
                 # Create embedding
                 embedding = create_embedding(client, chunk)
                 
+                # Build the chunk metadata
+                chunk_metadata = build_chunk_metadata(doc, j, len(chunks))
+                
                 # Store in ChromaDB
                 collection.add(
                     ids=[chunk_id],
                     embeddings=[embedding],
                     documents=[chunk],
-                    metadatas=[{
-                        "doc_id": doc["id"],
-                        "type": doc["type"],
-                        "source": doc["source"],
-                        "date": doc.get("date", ""),
-                        "tags": doc.get("tags", ""),
-                        "title": doc["title"],
-                        "url": doc["url"] or "",
-                        "chunk_index": j,
-                        "total_chunks": len(chunks),
-                    }]
+                    metadatas=[chunk_metadata]
                 )
         except Exception as e:
             error_msg = str(e)
@@ -55,6 +55,8 @@ import traceback # Built-in library for stack traces
 import uuid      # Built-in library to generate request IDs
 from urllib.parse import urlparse  # Built-in library to parse URLs
 
+import near_duplicates  # Keep one article per near-duplicate cluster (src/near_duplicates.py)
+
 # External libraries (install with pip)
 import chromadb
 from flask import Flask, request, render_template_string
@@ -83,6 +85,11 @@ COLLECTION_NAME = "tourism_knowledge"
 # How many documents to retrieve
 TOP_K = 10
 
+# We ask ChromaDB for TOP_K x this many chunks, then keep one article per
+# near-duplicate cluster (the same wire story from five outlets would
+# otherwise take five of the TOP_K slots)
+CLUSTER_OVERFETCH = 3
+
 # =============================================================================
 # HTML TEMPLATE
 # =============================================================================
@@ -799,16 +806,16 @@ def search_documents(collection, client, question, top_k, request_id):
     question_embedding = response.data[0].embedding
     print(f"[REQ {request_id}] [INFO] Query embedding dimension: {len(question_embedding)}")
 
-    # Step 2: Search ChromaDB
+    # Step 2: Search ChromaDB (more than top_k, see CLUSTER_OVERFETCH)
     if USE_WIKIPEDIA:
         results = collection.query(
             query_embeddings=[question_embedding],
-            n_results=top_k,
+            n_results=top_k * CLUSTER_OVERFETCH,
         )
     else:
         results = collection.query(
             query_embeddings=[question_embedding],
-            n_results=top_k,
+            n_results=top_k * CLUSTER_OVERFETCH,
             where={"type": "news"},
         )
 
@@ -826,7 +833,11 @@ def search_documents(collection, client, question, top_k, request_id):
                 "metadata": metas[0][i],
             })
 
-    # Step 4: Log retrieval stats
+    # Step 4: One article per near-duplicate cluster, then the best top_k chunks
+    documents, dropped = near_duplicates.collapse_chunks(documents, top_k)
+    print(f"[REQ {request_id}] [INFO] Near-duplicate chunks dropped: {dropped}")
+
+    # Step 5: Log retrieval stats
     chunk_lengths = [len((doc.get("content") or "")) for doc in documents]
     unique_sources = set()
     for doc in documents:
@@ -53,6 +53,10 @@ from datetime import datetime, timedelta, timezone  # Built-in library for dates
 from pathlib import Path                             # Built-in library for paths
 from urllib.parse import urlparse                    # Built-in library to parse URLs
 
+import date_utils  # Shared, cached date parser (src/date_utils.py)
+import article_manifest  # Which articles are duplicates (src/article_manifest.py)
+import near_duplicates   # Near-duplicate clusters of the articles (src/near_duplicates.py)
+
 # External libraries (install with pip)
 import chromadb
 from flask import Flask, request, render_template_string, redirect, url_for
@@ -75,6 +79,10 @@ COLLECTION_NAME = "tourism_knowledge"
 # How many documents to retrieve per RAG query in ReAct mode
 REACT_TOP_K = 8
 
+# Chunks asked from ChromaDB per slot, before one article per near-duplicate
+# cluster is kept (same as the web app)
+CLUSTER_OVERFETCH = 3
+
 # Runtime configuration is stored here after startup
 APP_CONFIG = {}
 
@@ -451,12 +459,14 @@ def build_llm_client(provider):
 
 def parse_article_date(article):
     """
-    Extract a datetime from the article metadata.
+    Get the article time as a Unix timestamp (seconds since 1970, UTC).
 
-    Tries multiple date fields in priority order.
+    Tries multiple date fields in priority order. All parsing goes through
+    the shared, cached parser in date_utils.py, so the comparison against
+    the cutoff below is a plain integer comparison.
 
     RETURNS:
-    - A datetime object, or None if no date could be parsed
+    - An integer timestamp, or None if no date could be parsed
     """
     meta = article.get("metadata", {})
 
@@ -464,39 +474,12 @@ def parse_article_date(article):
     date_fields = ["scraped_at", "date", "published", "published_at", "indexed_at"]
 
     for field in date_fields:
-        value = meta.get(field)
-        if not value:
-            continue
+        epoch = date_utils.parse_date_to_epoch(meta.get(field))
+        if epoch is not None:
+            return epoch
 
-        # Try ISO format first (e.g. "2026-02-18T10:30:00.123456")
-        try:
-            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            # If no timezone info, assume UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
-            pass
-
-        # Try date-only format (e.g. "2026-02-18")
-        try:
-            dt = datetime.strptime(value, "%Y-%m-%d")
-            dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
-            pass
-
-        # Try RSS date format (e.g. "Sat, 07 Feb 2026 08:01:17 +0100")
-        try:
-            from email.utils import parsedate_to_datetime
-            dt = parsedate_to_datetime(value)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
-            pass
-
-    return None
+    # Fall back to the timestamp resolved by the indexer/cleaner
+    return date_utils.get_meta_epoch(meta, [])
 
 
 def load_recent_articles(hours=24):
@@ -518,6 +501,7 @@ def load_recent_articles(hours=24):
     # Calculate the cutoff time
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(hours=hours)
+    cutoff_ts = int(cutoff.timestamp())
     print(f"[INFO] Current time (UTC): {now.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"[INFO] Cutoff time (UTC):  {cutoff.strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -525,29 +509,43 @@ def load_recent_articles(hours=24):
     json_files = glob.glob(os.path.join(ARTICLES_DIR, "*.json"))
     print(f"[INFO] Found {len(json_files)} total article files")
 
+    # The same story from two outlets (or under two links) goes into the prompt once
+    manifest = article_manifest.open_manifest(articles_dir=ARTICLES_DIR)
+    duplicate_ids = article_manifest.get_duplicate_ids(manifest)
+    cluster_ids = near_duplicates.get_cluster_ids(manifest)
+    manifest.close()
+
     # Load and filter
     recent_articles = []
     skipped_no_date = 0
     skipped_too_old = 0
+    skipped_duplicates = 0
     errors = 0
 
     for filepath in json_files:
+        if Path(filepath).stem in duplicate_ids:
+            skipped_duplicates = skipped_duplicates + 1
+            continue
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 article = json.load(f)
 
-            article_date = parse_article_date(article)
+            if article.get("duplicate_of"):
+                skipped_duplicates = skipped_duplicates + 1
+                continue
+
+            article_ts = parse_article_date(article)
 
-            if article_date is None:
+            if article_ts is None:
                 skipped_no_date = skipped_no_date + 1
                 continue
 
-            if article_date < cutoff:
+            if article_ts < cutoff_ts:
                 skipped_too_old = skipped_too_old + 1
                 continue
 
             # Add the parsed date for sorting
-            article["_parsed_date"] = article_date
+            article["_parsed_ts"] = article_ts
             recent_articles.append(article)
 
         except Exception as e:
@@ -556,17 +554,51 @@ def load_recent_articles(hours=24):
                 print(f"[WARNING] Error reading {os.path.basename(filepath)}: {e}")
 
     # Sort by date, newest first
-    recent_articles.sort(key=lambda a: a["_parsed_date"], reverse=True)
+    recent_articles.sort(key=lambda a: a["_parsed_ts"], reverse=True)
+
+    # Lightly edited copies of the same story: keep the newest one
+    # (it remembers the other outlets in "_cluster_sources")
+    loaded_count = len(recent_articles)
+    recent_articles = near_duplicates.collapse_articles(recent_articles, cluster_ids)
 
     print(f"[INFO] Recent articles: {len(recent_articles)}")
+    print(f"[INFO] Collapsed (near-duplicates): {loaded_count - len(recent_articles)}")
     print(f"[INFO] Skipped (no date): {skipped_no_date}")
     print(f"[INFO] Skipped (too old): {skipped_too_old}")
+    print(f"[INFO] Skipped (duplicates): {skipped_duplicates}")
     if errors > 0:
         print(f"[WARNING] Errors reading files: {errors}")
 
     return recent_articles
 
 
+def load_feed_summary(meta):
+    """
+    Get the RSS summary of an article as plain text.
+
+    Lean link records (01__indexer.py --projection lean) only keep a short
+    summary. If the record says it has a side payload, we read the full
+    summary from the link store - only for the few articles that need it.
+
+    RETURNS:
+    - The summary text (may be empty)
+    """
+    summary = meta.get("summary", "") or ""
+
+    if meta.get("has_payload"):
+        try:
+            import link_store
+            payload = link_store.load_payload(meta.get("source"), meta.get("link"))
+            full_summary = payload.get("summary") or ""
+            if full_summary:
+                full_summary = re.sub(r"<[^>]+>", " ", full_summary)
+                summary = " ".join(full_summary.split())
+        except Exception as e:
+            print(f"[WARNING] Could not load feed payload: {e}")
+
+    return summary
+
+
 def format_articles_for_prompt(articles, max_chars_per_article=2000, start_index=1):
     """
     Format a list of articles into a text block for the LLM prompt.
@@ -594,12 +626,16 @@ def format_articles_for_prompt(articles, max_chars_per_article=2000, start_index
             content = article.get("content", "") or ""
         if not content:
             # Try to get summary from metadata
-            content = meta.get("summary", "") or "(no content available)"
+            content = load_feed_summary(meta) or "(no content available)"
 
         # Truncate if too long
         if len(content) > max_chars_per_article:
             content = content[:max_chars_per_article] + "...(truncated)"
 
+        # Outlets whose near-duplicate copies were collapsed into this one
+        if article.get("_cluster_sources"):
+            source = f"{source} (also reported by: {', '.join(article['_cluster_sources'])})"
+
         parts.append(
             f"[Source {i}: {title}]\n"
             f"Outlet: {source}\n"
@@ -888,10 +924,11 @@ def search_knowledge_base(collection, client, query, top_k, request_id):
     )
     question_embedding = response.data[0].embedding
 
-    # Step 2: Search ChromaDB (news articles only)
+    # Step 2: Search ChromaDB (news articles only, more than top_k so we
+    # can drop near-duplicate copies of the same story)
     results = collection.query(
         query_embeddings=[question_embedding],
-        n_results=top_k,
+        n_results=top_k * CLUSTER_OVERFETCH,
         where={"type": "news"},
     )
 
@@ -904,12 +941,14 @@ def search_knowledge_base(collection, client, query, top_k, request_id):
         print(f"[REQ {request_id}] [RAG] No results found")
         return "No relevant articles found in the knowledge base."
 
-    print(f"[REQ {request_id}] [RAG] Found {len(ids[0])} results")
+    found = [{"content": docs[0][i], "metadata": metas[0][i]} for i in range(len(ids[0]))]
+    found, dropped = near_duplicates.collapse_chunks(found, top_k)
+    print(f"[REQ {request_id}] [RAG] Found {len(ids[0])} results, kept {len(found)} ({dropped} near-duplicates dropped)")
 
     formatted_parts = []
-    for i in range(len(ids[0])):
-        meta = metas[0][i]
-        content = docs[0][i]
+    for result in found:
+        meta = result["metadata"]
+        content = result["content"]
         title = meta.get("title", "Untitled")
         source = meta.get("source", "Unknown")
         date = meta.get("date", "Unknown")
@@ -0,0 +1,402 @@
+"""
+article_manifest.py - Index of every article file in data/articles
+===================================================================
+
+The scraper used to ask the filesystem about every candidate link
+(os.path.exists) and, for --retry-failed, open and parse EVERY article
+file just to read "scrapingbee.success". Both get slower as data/articles
+grows into tens of thousands of files.
+
+This module keeps one SQLite table with a row per article file:
+
+    id | source | link | status | status_code | scraped_at | content_hash | cleaner_version | cleaned_at | text_hash | duplicate_of | cluster_id
+
+- status:          "success" or "failed" (the ScrapingBee result)
+- content_hash:    SHA-256 of the raw ScrapingBee content
+- cleaner_version: cleaners.CLEANER_VERSION that produced the "text" field
+                   (NULL until 03__cleaner.py has cleaned the article)
+- text_hash:       SHA-256 of the cleaned text (lower-case, spaces collapsed)
+- duplicate_of:    ID of the article with the same raw page or the same
+                   cleaned text that we had FIRST (NULL if this is the original)
+- cluster_id:      near-duplicate cluster of the article (see near_duplicates.py)
+
+DUPLICATES:
+The same wire story (AP, ANSA, euronews syndication) is published by several
+outlets, and one article can be linked with different tracking parameters.
+The scraper marks an article whose raw page we already have (content_hash);
+the cleaner marks one whose cleaned text we already have (text_hash).
+Duplicates are not cleaned, embedded or put into report prompts again
+(get_duplicate_ids). Recompute all marks with:
+
+    python src/article_manifest.py --dedup
+
+(A manifest from before text_hash existed needs --rebuild once, which also
+fills in the text hashes of the articles cleaned earlier.)
+
+The scraper writes the row right after it saved the article file, so skip
+checks, retry selection and --source filtering are index lookups.
+
+If the manifest is missing (first run, or you deleted data/state), it is
+rebuilt from the files on disk once. You can also rebuild it by hand, e.g.
+after deleting article files:
+
+    python src/article_manifest.py --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+# Where the manifest lives
+MANIFEST_FILE = "data/state/article_manifest.sqlite"
+
+# Where the scraper saves the articles
+ARTICLES_DIR = "data/articles"
+
+# Cleaned texts shorter than this are never marked as duplicates
+# (a short teaser or an empty page says nothing about the story)
+MIN_TEXT_HASH_CHARS = 200
+
+
+def open_manifest(manifest_file=MANIFEST_FILE, articles_dir=ARTICLES_DIR):
+    """
+    Open (or create) the manifest.
+
+    PARAMETERS:
+    - manifest_file: Path to the SQLite file
+    - articles_dir: If the manifest is brand new, we fill it from the article
+      files already in this folder (set to None to skip)
+
+    RETURNS:
+    - An open sqlite3 connection
+    """
+    os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+
+    conn = sqlite3.connect(manifest_file)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS articles ("
+        " id TEXT PRIMARY KEY,"
+        " source TEXT,"
+        " link TEXT,"
+        " status TEXT,"
+        " status_code INTEGER,"
+        " scraped_at TEXT,"
+        " content_hash TEXT,"
+        " cleaner_version TEXT,"
+        " cleaned_at TEXT)"
+    )
+    # Columns added later: add them to manifests created before
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(articles)")]
+    for column in ["text_hash", "duplicate_of", "cluster_id"]:
+        if column not in columns:
+            conn.execute(f"ALTER TABLE articles ADD COLUMN {column} TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_status ON articles (status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles (content_hash)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_text_hash ON articles (text_hash)")
+    conn.commit()
+
+    count = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+    if count == 0 and articles_dir and os.path.exists(articles_dir):
+        rebuild_from_disk(conn, articles_dir)
+
+    return conn
+
+
+def get_content_hash(content):
+    """
+    SHA-256 of the raw scraped content (or None if there is no content).
+    """
+    if not content:
+        return None
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def get_text_hash(text):
+    """
+    SHA-256 of a cleaned text, ignoring case and spacing (or None if the text
+    is too short to say that two articles are the same story).
+    """
+    if not text:
+        return None
+    normalized = " ".join(text.lower().split())
+    if len(normalized) < MIN_TEXT_HASH_CHARS:
+        return None
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def build_row(article_data):
+    """
+    Turn a saved article dictionary into a manifest row (without cleaner fields).
+    """
+    scrapingbee = article_data.get("scrapingbee") or {}
+
+    # A blob's name IS the SHA-256 of the content (see blob_store.py)
+    content_hash = scrapingbee.get("content_blob")
+    if not content_hash:
+        content = scrapingbee.get("content") or scrapingbee.get("body") or ""
+        content_hash = get_content_hash(content)
+
+    if scrapingbee.get("success") == False:
+        status = "failed"
+    else:
+        status = "success"
+
+    return (
+        article_data["id"],
+        article_data.get("source"),
+        article_data.get("link"),
+        status,
+        scrapingbee.get("status_code"),
+        article_data.get("scraped_at"),
+        content_hash,
+    )
+
+
+def record_scrape(conn, article_data):
+    """
+    Record a freshly saved article (call this AFTER the file was written).
+
+    A re-scrape replaces the scrape fields and clears the cleaner fields,
+    because the old "text" no longer matches the new raw content.
+    The "duplicate_of" field of the article (see find_duplicate) and the
+    "cluster_id" of an article cleaned in --stream mode are stored too.
+    """
+    conn.execute(
+        "INSERT INTO articles (id, source, link, status, status_code, scraped_at, content_hash, duplicate_of, cluster_id)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT(id) DO UPDATE SET"
+        " source = excluded.source,"
+        " link = excluded.link,"
+        " status = excluded.status,"
+        " status_code = excluded.status_code,"
+        " scraped_at = excluded.scraped_at,"
+        " content_hash = excluded.content_hash,"
+        " duplicate_of = excluded.duplicate_of,"
+        " cluster_id = excluded.cluster_id,"
+        " cleaner_version = NULL,"
+        " cleaned_at = NULL,"
+        " text_hash = NULL",
+        build_row(article_data) + (article_data.get("duplicate_of"), article_data.get("cluster_id")),
+    )
+    conn.commit()
+
+
+def record_cleaned(conn, cleaned):
+    """
+    Record which cleaner version produced the "text" of some articles.
+
+    PARAMETERS:
+    - conn: Open manifest
+    - cleaned: List of (article_id, cleaner_version, cleaned_at) or
+      (article_id, cleaner_version, cleaned_at, text_hash) tuples
+    """
+    if not cleaned:
+        return
+    rows = []
+    for row in cleaned:
+        article_id, version, cleaned_at = row[:3]
+        text_hash = row[3] if len(row) > 3 else None
+        rows.append((version, cleaned_at, text_hash, article_id))
+    conn.executemany(
+        "UPDATE articles SET cleaner_version = ?, cleaned_at = ?, text_hash = ? WHERE id = ?",
+        rows,
+    )
+    conn.commit()
+
+
+def find_duplicate(conn, article_id, content_hash=None, text_hash=None):
+    """
+    Is there ANOTHER original article with the same raw page or cleaned text?
+
+    PARAMETERS:
+    - conn: Open manifest
+    - article_id: The article we are checking (never its own duplicate)
+    - content_hash: Hash of its raw page (get_content_hash / blob hash)
+    - text_hash: Hash of its cleaned text (get_text_hash)
+
+    RETURNS:
+    - The ID of the first article we had with that content, or None
+    """
+    for column, value in [("content_hash", content_hash), ("text_hash", text_hash)]:
+        if not value:
+            continue
+        row = conn.execute(
+            f"SELECT id FROM articles WHERE {column} = ? AND id != ? AND status = 'success'"
+            " AND duplicate_of IS NULL ORDER BY scraped_at, id LIMIT 1",
+            (value, article_id),
+        ).fetchone()
+        if row:
+            return row[0]
+    return None
+
+
+def mark_duplicate(conn, article_id, original_id):
+    """
+    Mark one article as a duplicate of another.
+    """
+    conn.execute("UPDATE articles SET duplicate_of = ? WHERE id = ?", (original_id, article_id))
+    conn.commit()
+
+
+def get_duplicate_ids(conn):
+    """
+    The IDs of all articles marked as duplicates (skip these downstream).
+
+    RETURNS:
+    - A set of article IDs
+    """
+    rows = conn.execute("SELECT id FROM articles WHERE duplicate_of IS NOT NULL")
+    return set(row[0] for row in rows)
+
+
+def mark_all_duplicates(conn):
+    """
+    Recompute "duplicate_of" for the whole manifest from the two hashes.
+
+    In every group of articles with the same raw page (or the same cleaned
+    text), the one scraped first is the original; the others point to it.
+
+    RETURNS:
+    - The number of articles marked as duplicates
+    """
+    conn.execute("UPDATE articles SET duplicate_of = NULL")
+
+    marked = 0
+    for column in ["content_hash", "text_hash"]:
+        rows = conn.execute(
+            f"SELECT id, {column} FROM articles"
+            f" WHERE {column} IS NOT NULL AND status = 'success' AND duplicate_of IS NULL"
+            " ORDER BY scraped_at, id"
+        ).fetchall()
+
+        first_by_hash = {}
+        updates = []
+        for article_id, value in rows:
+            if value in first_by_hash:
+                updates.append((first_by_hash[value], article_id))
+            else:
+                first_by_hash[value] = article_id
+        conn.executemany("UPDATE articles SET duplicate_of = ? WHERE id = ?", updates)
+        marked += len(updates)
+
+    conn.commit()
+    return marked
+
+
+def get_article_ids(conn, source=None, partial=False):
+    """
+    The IDs of all articles we have a file for (optionally only one source).
+
+    PARAMETERS:
+    - conn: Open manifest
+    - source: Only this source (case-insensitive)
+    - partial: If True, "source" may be part of the name (e.g. "SAPO")
+
+    RETURNS:
+    - A set of article IDs (checking "id in the_set" is instant)
+    """
+    if source and partial:
+        rows = conn.execute("SELECT id FROM articles WHERE INSTR(UPPER(source), ?) > 0", (source.upper(),))
+    elif source:
+        rows = conn.execute("SELECT id FROM articles WHERE UPPER(source) = ?", (source.upper(),))
+    else:
+        rows = conn.execute("SELECT id FROM articles")
+    return set(row[0] for row in rows)
+
+
+def list_failed(conn, source=None):
+    """
+    The articles whose last scrape failed (optionally only one source).
+
+    RETURNS:
+    - A list of (article_id, source) tuples
+    """
+    if source:
+        rows = conn.execute(
+            "SELECT id, source FROM articles WHERE status = 'failed' AND UPPER(source) = ? ORDER BY id",
+            (source.upper(),),
+        )
+    else:
+        rows = conn.execute("SELECT id, source FROM articles WHERE status = 'failed' ORDER BY id")
+    return rows.fetchall()
+
+
+def rebuild_from_disk(conn, articles_dir=ARTICLES_DIR):
+    """
+    Fill the manifest by reading every article file once.
+
+    This is the slow scan the manifest exists to avoid, so it only runs when
+    the manifest is empty or when you ask for it (--rebuild).
+    """
+    files = list(Path(articles_dir).glob("*.json"))
+    print(f"[INFO] Building article manifest from {len(files)} files in {articles_dir}...")
+
+    conn.execute("DELETE FROM articles")
+
+    rows = []
+    for filepath in files:
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[WARNING] Could not read {filepath.name}: {e}")
+            continue
+
+        data["id"] = data.get("id") or filepath.stem
+        row = build_row(data)
+        # Articles cleaned before the manifest existed: version unknown
+        cleaner_version = None
+        if data.get("text") is not None:
+            cleaner_version = data.get("cleaner_version", "unknown")
+        rows.append(row + (cleaner_version, get_text_hash(data.get("text"))))
+
+    conn.executemany(
+        "INSERT OR REPLACE INTO articles"
+        " (id, source, link, status, status_code, scraped_at, content_hash, cleaner_version, text_hash)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    duplicates = mark_all_duplicates(conn)
+    print(f"[INFO] Article manifest: {len(rows)} articles ({duplicates} duplicates)")
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def main():
+    """
+    Show (or rebuild) the article manifest.
+    """
+    parser = argparse.ArgumentParser(description="Article manifest for data/articles")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the manifest from the files on disk")
+    parser.add_argument("--dedup", action="store_true", help="Recompute which articles are duplicates")
+    args = parser.parse_args()
+
+    conn = open_manifest()
+    if args.rebuild:
+        rebuild_from_disk(conn)
+    elif args.dedup:
+        print(f"[INFO] Marked {mark_all_duplicates(conn)} duplicate articles")
+
+    print()
+    print(f"{'SOURCE':<28} {'SUCCESS':>8} {'FAILED':>8} {'CLEANED':>8} {'DUPS':>6}")
+    print("-" * 63)
+    rows = conn.execute(
+        "SELECT source,"
+        " SUM(status = 'success'), SUM(status = 'failed'), COUNT(cleaner_version), COUNT(duplicate_of)"
+        " FROM articles GROUP BY source ORDER BY source"
+    )
+    for source, success, failed, cleaned, duplicates in rows:
+        print(f"{str(source)[:28]:<28} {success:>8} {failed:>8} {cleaned:>8} {duplicates:>6}")
+    print()
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
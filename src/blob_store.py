@@ -0,0 +1,224 @@
+"""
+blob_store.py - Compressed, content-addressed store for raw scraped pages
+==========================================================================
+
+ScrapingBee gives us the full page as markdown. Keeping it inside every
+article JSON file (next to all response headers, indented) made
+data/articles big and slow to read for every later step, even though only
+03__cleaner.py ever looks at the raw page.
+
+In "blob" storage mode (the default, see 02__scraper.py --storage) the raw
+page goes here instead, gzip-compressed, named after its SHA-256 hash:
+
+    data/blobs/3f/a2/3fa2...e1.gz
+
+and the article file only keeps the reference:
+
+    "scrapingbee": {"success": true, "status_code": 200,
+                    "content_blob": "3fa2...e1", "content_chars": 48213, ...}
+
+WHY "CONTENT-ADDRESSED"?
+- The same page scraped twice is stored once
+- A blob never changes after it is written, so it is safe to cache or copy
+
+Read the raw page of an article with load_raw_content(article_data); it
+works for both storage modes (and for the older "body" archive format).
+
+MOVE EXISTING ARTICLES TO THE BLOB STORE:
+    python src/blob_store.py --migrate
+
+(zstd would compress a bit better, but gzip is built into Python, so the
+pipeline does not need an extra package.)
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Where the blobs live
+BLOB_DIR = "data/blobs"
+
+# gzip level: 6 is the usual balance between speed and size
+COMPRESS_LEVEL = 6
+
+# Where the scraper saves the articles (for --migrate)
+ARTICLES_DIR = "data/articles"
+
+
+def get_blob_path(blob_hash, blob_dir=BLOB_DIR):
+    """
+    Path of a blob, e.g. data/blobs/3f/a2/3fa2...e1.gz
+
+    Two levels of sub-folders keep every folder small, even with
+    hundreds of thousands of blobs.
+    """
+    return os.path.join(blob_dir, blob_hash[:2], blob_hash[2:4], f"{blob_hash}.gz")
+
+
+def put_blob(content, blob_dir=BLOB_DIR):
+    """
+    Store a text and return its hash (does nothing if it is already stored).
+
+    PARAMETERS:
+    - content: The text to store (e.g. ScrapingBee markdown)
+
+    RETURNS:
+    - The SHA-256 hex hash of the text (use it with get_blob)
+    """
+    data = content.encode("utf-8")
+    blob_hash = hashlib.sha256(data).hexdigest()
+    path = get_blob_path(blob_hash, blob_dir)
+
+    if os.path.exists(path):
+        return blob_hash
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Temporary file + rename: a blob is either complete or not there
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    os.replace(temp_path, path)
+
+    return blob_hash
+
+
+def get_blob(blob_hash, blob_dir=BLOB_DIR):
+    """
+    Read a text back from the store.
+
+    RAISES:
+    - FileNotFoundError if the blob does not exist
+    """
+    with open(get_blob_path(blob_hash, blob_dir), "rb") as f:
+        return gzip.decompress(f.read()).decode("utf-8")
+
+
+def load_raw_content(article_data, blob_dir=BLOB_DIR):
+    """
+    Get the raw scraped page of an article, whatever way it was stored.
+
+    ORDER:
+    1. "scrapingbee.content_blob" - blob storage mode
+    2. "scrapingbee.content"      - inline storage mode (older files)
+    3. "scrapingbee.body"         - archive files
+    4. "content"                  - oldest format
+
+    RETURNS:
+    - The raw text, or None if the article has no content
+    """
+    scrapingbee = article_data.get("scrapingbee") or {}
+
+    if scrapingbee.get("content_blob"):
+        return get_blob(scrapingbee["content_blob"], blob_dir)
+    if "content" in scrapingbee:
+        return scrapingbee["content"]
+    if "body" in scrapingbee:
+        return scrapingbee["body"]
+    if "content" in article_data:
+        return article_data["content"]
+    return None
+
+
+def move_content_to_blob(scrapingbee, blob_dir=BLOB_DIR):
+    """
+    Replace the inline raw page of a ScrapingBee result by a blob reference.
+
+    We also drop the response headers except the ones worth keeping
+    (ScrapingBee's own "Spb-*" headers, Content-Type and Date).
+
+    PARAMETERS:
+    - scrapingbee: The dictionary returned by scrape_article() (changed in place)
+
+    RETURNS:
+    - The same dictionary
+    """
+    content = scrapingbee.pop("content", None)
+    if content is None:
+        content = scrapingbee.pop("body", None)
+
+    if content is not None:
+        scrapingbee["content_blob"] = put_blob(content, blob_dir)
+        scrapingbee["content_chars"] = len(content)
+
+    headers = scrapingbee.get("headers")
+    if headers:
+        kept = {}
+        for name, value in headers.items():
+            if name.lower().startswith("spb-") or name.lower() in ("content-type", "date"):
+                kept[name] = value
+        scrapingbee["headers"] = kept
+
+    return scrapingbee
+
+
+def migrate_articles(articles_dir=ARTICLES_DIR, blob_dir=BLOB_DIR):
+    """
+    Move the raw pages of existing article files into the blob store.
+
+    RETURNS:
+    - A tuple (files_migrated, bytes_before, bytes_after)
+    """
+    files_migrated = 0
+    bytes_before = 0
+    bytes_after = 0
+
+    for filepath in Path(articles_dir).glob("*.json"):
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        scrapingbee = data.get("scrapingbee") or {}
+        if "content" not in scrapingbee and "body" not in scrapingbee:
+            continue
+
+        bytes_before += os.path.getsize(filepath)
+        move_content_to_blob(scrapingbee, blob_dir)
+
+        temp_path = str(filepath) + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, filepath)
+
+        bytes_after += os.path.getsize(filepath) + os.path.getsize(
+            get_blob_path(scrapingbee["content_blob"], blob_dir)
+        )
+        files_migrated += 1
+
+    return files_migrated, bytes_before, bytes_after
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def main():
+    """
+    Move the raw pages of data/articles into data/blobs
+    """
+    parser = argparse.ArgumentParser(description="Compressed blob store for raw scraped pages")
+    parser.add_argument("--migrate", action="store_true", help="Move inline raw pages of data/articles into the blob store")
+    args = parser.parse_args()
+
+    if not args.migrate:
+        parser.print_help()
+        return
+
+    print("=" * 60)
+    print("BLOB STORE MIGRATION - Starting")
+    print("=" * 60)
+
+    files_migrated, bytes_before, bytes_after = migrate_articles()
+
+    print(f"Files migrated: {files_migrated}")
+    if files_migrated:
+        print(f"Size before: {bytes_before / 1024 / 1024:.1f} MB")
+        print(f"Size after:  {bytes_after / 1024 / 1024:.1f} MB (article files + blobs, "
+              f"{bytes_before / max(bytes_after, 1):.1f}x smaller)")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,5 @@
-from .dispatcher import clean_and_enrich_text
+from .dispatcher import clean_and_enrich_text, resolve_cleaner, find_cleaner_module, get_unknown_sources, get_import_report
+
+# Bump this when a cleaner changes its output, so the article manifest
+# (article_manifest.py) shows which articles were cleaned by an older version
+CLEANER_VERSION = "2026.10.1"
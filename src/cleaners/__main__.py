@@ -0,0 +1,37 @@
+"""
+Cleaner import-time report
+==========================
+Imports the cleaners for the given sources (or all cleaners) and shows how
+long the registry scan and each module import took.
+
+HOW TO RUN (from src/):
+    python -m cleaners
+    python -m cleaners PUBLICO GUARDIAN_TRAVEL
+"""
+
+import sys
+import time
+
+from .dispatcher import REGISTRY, get_import_report, resolve_cleaner
+
+
+def import_seconds(item):
+    """
+    Sort key for (module_name, seconds) pairs: the import time.
+    """
+    return item[1]
+
+
+sources = sys.argv[1:] or sorted(REGISTRY)
+start = time.perf_counter()
+for source in sources:
+    if resolve_cleaner(source) is None:
+        print(f"[INFO] No cleaner for {source} (generic cleaning)")
+total = time.perf_counter() - start
+
+report = get_import_report()
+print(f"Registry: {len(REGISTRY)} source keys in {len(set(REGISTRY.values()))} modules, "
+      f"read in {report['scan'] * 1000:.1f} ms")
+for module_name, seconds in sorted(report["modules"].items(), key=import_seconds, reverse=True):
+    print(f"  {module_name:<32} {seconds * 1000:>7.1f} ms")
+print(f"Imported {len(report['modules'])} of {len(set(REGISTRY.values()))} modules in {total * 1000:.1f} ms")
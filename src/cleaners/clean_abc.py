@@ -3,6 +3,12 @@ import json
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["ABC_ESPANA"]
+CLEAN_FUNCTION = "clean_abc_espana"
+TAG_EXTRACTOR = "extract_abc_tags"
+TAG_EXTRACTOR_ONLY_WITHOUT_TAGS = True  # Only when the feed gave no tags
+
 # ==============================================================================
 #           STANDALONE ABC_ESPANA CLEANING SCRIPT
 # ==============================================================================
@@ -8,6 +8,10 @@ These articles have author avatars, newsletter signups, and WordPress footer noi
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["AIR_CURRENT"]
+CLEAN_FUNCTION = "clean_air_current"
+
 
 def clean_air_current(text, meta):
     """
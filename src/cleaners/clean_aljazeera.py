@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["AL_JAZEERA"]
+CLEAN_FUNCTION = "clean_aljazeera"
+
 def clean_aljazeera(text, meta):
     """
     Specific cleaner for Al Jazeera articles.
@@ -1,5 +1,9 @@
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["AMBITUR"]
+CLEAN_FUNCTION = "clean_ambitur"
+
 def clean_ambitur(text, meta):
     """
     Cleaning logic for AMBITUR articles.
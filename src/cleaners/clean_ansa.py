@@ -1,5 +1,9 @@
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["ANSA_VIAGGI"]
+CLEAN_FUNCTION = "clean_ansa"
+
 def clean_ansa(text, meta):
     """
     Cleaner for ANSA_VIAGGI articles.
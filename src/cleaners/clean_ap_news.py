@@ -11,6 +11,10 @@ import re
 
 from .utils import trim_header_by_title
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["AP_NEWS"]
+CLEAN_FUNCTION = "clean_ap_news"
+
 _TIME_RE = re.compile(r"^\d{1,2}:\d{2}\s(?:AM|PM)\sGMT$")
 _LIVE_HINT_RE = re.compile(r"^\d{1,2}:\d{2}\s(?:AM|PM)\sGMT$", re.MULTILINE)
 _SETEXT_LINE_RE = re.compile(r"^[=\-]{4,}$")
@@ -1,5 +1,9 @@
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["BBC_TRAVEL"]
+CLEAN_FUNCTION = "clean_bbc"
+
 def clean_bbc(text, meta):
     # 1. Header Cleaning
     
@@ -8,6 +8,10 @@ These articles have navigation headers, sidebars, and footer content.
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["BREAKING_TRAVEL_NEWS"]
+CLEAN_FUNCTION = "clean_breaking_travel_news"
+
 
 def clean_breaking_travel_news(text, meta):
     """
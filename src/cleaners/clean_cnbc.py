@@ -1,6 +1,10 @@
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["CNBC"]
+CLEAN_FUNCTION = "clean_cnbc"
+
 def clean_cnbc(text, meta):
     # 1. Header Cleaning
     # --------------------------------------------------------------------------
@@ -1,6 +1,10 @@
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["CNN_TRAVEL"]
+CLEAN_FUNCTION = "clean_cnn"
+
 def clean_cnn(text, meta):
     # 1. Header Cleaning
     # --------------------------------------------------------------------------
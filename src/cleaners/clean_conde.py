@@ -1,11 +1,93 @@
 
 import re
+from . import toolkit
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["CONDE_NAST_TRAVELER"]
+CLEAN_FUNCTION = "clean_conde_nast"
+
+# ==============================================================================
+#           PATTERNS (compiled once, when the module is imported)
+# ==============================================================================
+
+# Privacy / consent blocks (span many lines)
+CONSENT_CHOICES_RE = re.compile(r'Manage your consent preferences.*?Confirm My ChoicesReject AllAccept All', re.DOTALL)
+PRIVACY_CENTER_RE = re.compile(r'Privacy Center.*?OK', re.DOTALL | re.IGNORECASE)
+PRIVACY_CHOICES_RE = re.compile(r'Your Privacy Choices.*?privacy notice\.', re.DOTALL | re.IGNORECASE)
+RESIDENT_BLOCK_RE = re.compile(r'If you are a resident of.*?Confirm My Choices', re.DOTALL | re.IGNORECASE)
+ABOUT_PRIVACY_RE = re.compile(r'About Your Privacy.*?EnglishDeutsch\w*', re.DOTALL | re.IGNORECASE)
+WE_CARE_RE = re.compile(r'We Care About Your Privacy.*?Your Privacy Choices', re.DOTALL | re.IGNORECASE)
+LANGUAGE_SELECTOR_RE = re.compile(r'EnglishDeutschEspañolFrançaisItaliano.*', re.IGNORECASE)
+COOKIE_TOGGLE_RE = re.compile(r'(Social Media|Targeted|Essential|Performance|Functional|Audience Measurement).*?\n\s*(On|Off)', re.MULTILINE | re.IGNORECASE)
+SEPARATOR_LINE_RE = re.compile(r'^---\s*$', re.MULTILINE)
+
+# The header consistently ends with "Sign In" variations in the first few KB
+HEADER_END_RES = [
+    re.compile(r'Sign In\s*Sign In', re.IGNORECASE | re.DOTALL),
+    re.compile(r'\[Sign In\]\([^\)]+\)\s*\[Sign In\]\([^\)]+\)', re.IGNORECASE | re.DOTALL), # Markdown version double
+    re.compile(r'\[Sign In\]\([^\)]+\)', re.IGNORECASE | re.DOTALL), # Markdown version single
+    re.compile(r'Newsletters\s*Sign In', re.IGNORECASE | re.DOTALL),
+    re.compile(r'\[Newsletters\]\([^\)]+\)\s*\[Sign In\]\([^\)]+\)', re.IGNORECASE | re.DOTALL), # Markdown version
+    re.compile(r'Skip to main content', re.IGNORECASE | re.DOTALL), # Fallback
+]
+LEADING_SIGN_IN_RE = re.compile(r'^Sign In\s*', re.IGNORECASE)
+
+# UI buttons (whole lines), then UI text anywhere in a line
+UI_LINE_RULES = toolkit.compile_line_rules([
+    ("ui", [
+        r'\s*Menu\s*',
+        r'\s*Search\s*',
+        r'\s*Close\s*',
+        r'\s*Save Story\s*',
+        r'\s*Save this story\s*',
+        r'\s*Save to wishlist\s*', # User requested removal
+    ], re.IGNORECASE),
+])
+UI_TEXT_RES = [
+    re.compile(r'^\s*\[Search\s*Search\]\(/search\)\s*$', re.IGNORECASE | re.MULTILINE), # \s* can join two lines
+    re.compile(r'confirm my choices', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'reject all', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'accept all', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'Allow Sale/Targeted Advertising\?', re.IGNORECASE | re.MULTILINE), # User specific report
+]
+
+AFFILIATE_DISCLAIMER_RE = re.compile(r'All products and listings featured.*?through these links\.?', re.DOTALL | re.IGNORECASE)
+
+# Photo credits: "Patrick Dolande/Gotham Burger Social Club" (the \s+ can join two lines)
+PHOTO_CREDIT_RE = re.compile(r'(?m)^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*/\s*[A-Z].*$')
+# Agency credits, Pinterest files and recurring sections (a \s* inside can join two lines)
+AGENCY_LINE_RE = re.compile(r'(?i)^.*(?:Getty\s*Images|Photo\s*Library).*$', re.MULTILINE)
+PINTEREST_LINE_RE = re.compile(r'(?i)^.*Pinterest\.(?:jpg|png|svg).*$', re.MULTILINE)
+SECTION_LINE_RE = re.compile(r'(?i)^.*(?:Editor-recommended\s+hotels|Frequently\s+asked\s+questions).*$', re.MULTILINE)
+# Broken image artifacts and footer SVG links
+IMAGE_LINE_RULES = toolkit.compile_line_rules([
+    ("broken_image", [r'\s*[!+].*\.(?:jpg|png|svg|jpeg|gif).*']),
+    ("svg_link", [r'.*!\[\].*']),
+])
+
+MARKDOWN_IMAGE_RE = re.compile(r'!\[.*?\]\(.*?\)', re.DOTALL)
+START_SIGN_IN_RE = re.compile(r'(?i)\A\s*Sign\s+In\s*')
+SIGN_IN_LINE_RE = re.compile(r'(?i)^\s*Sign\s+In\s*$', re.MULTILINE)
+
+BREADCRUMB_RE = re.compile(r'\[.*?\]\(/.*?\)\s*Chevron')
+UI_ARTIFACT_RES = [
+    re.compile(r'AccordionItemContainerButton', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'LargeChevron', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'Arrow', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'en\s*We Care\s*en', re.IGNORECASE | re.MULTILINE), # "en We Care en" noise
+    re.compile(r'^\s*en\s*$', re.IGNORECASE | re.MULTILINE),
+]
+CONSENT_TEXT_RE = re.compile(r'Manage your consent preferences', re.IGNORECASE)
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+
 def clean_conde_nast(text, meta):
     """
     Cleaner for Conde Nast Traveler.
     Removes massive GDPR/Cookie consent blocks, navigation menus, and affiliate disclaimers.
+
+    All patterns are compiled at import (top of the file) and run in their
+    old order; the runs of whole-line patterns go through toolkit.remove_lines.
     """
     
     # 1. Header Trimming by Title (Best bet if title is accurate)
@@ -20,129 +102,89 @@ def clean_conde_nast(text, meta):
     if "Privacy Center" in text and "Confirm My Choices" in text:
          # This is the "Manage your consent" style
          # Remove from start to "Confirm My ChoicesReject AllAccept All"
-         text = re.sub(r'Manage your consent preferences.*?Confirm My ChoicesReject AllAccept All', '', text, flags=re.DOTALL)
+         text = CONSENT_CHOICES_RE.sub('', text)
          
     # Pattern B: "Privacy Center... OK" 
     # This block often ends with "OK" followed by language selector
     # We use a non-greedy match across lines
-    text = re.sub(r'Privacy Center.*?OK', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = PRIVACY_CENTER_RE.sub('', text)
 
     # Remove "About Your Privacy" / "Manage Consent" blocks
-    # Flexible match for start, and multiple potential ends
-    privacy_starts = [
-        r'Manage your consent preferences',
-        r'About Your Privacy',
-        r'If you are a resident of Colorado',
-        r'We Care About Your Privacy',
-        r'Privacy Center'
-    ]
-    
-    privacy_ends = [
-        r'Confirm My ChoicesReject AllAccept All',
-        r'SaveI Accept',
-        r'SaveReject AllI Accept',
-        r'Confirm My Choices',
-        r'Accept All',
-        r'Reject All'
-    ]
-    
     # Combined regex is risky if too broad, so let's target specific known chunks
     
     # 1. The "Resident of..." block (Generalizing for California/Colorado etc)
     # Ends with "Confirm My Choices" OR just falls through to "Allow Sale... On"
-    text = re.sub(r'Your Privacy Choices.*?privacy notice\.', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'If you are a resident of.*?Confirm My Choices', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = PRIVACY_CHOICES_RE.sub('', text)
+    text = RESIDENT_BLOCK_RE.sub('', text)
     
     # 2. "About Your Privacy" Block (Massive GDPR/Vendor List)
     # Previous regex failed because it matched "acceptance" inside the text.
     # We target the Language Selector "EnglishDeutsch..." which reliably ends this block.
     # Matches: Start "About Your Privacy" ... content ... End "EnglishDeutsch..."
-    text = re.sub(r'About Your Privacy.*?EnglishDeutsch\w*', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = ABOUT_PRIVACY_RE.sub('', text)
     
     # 3. "We Care About Your Privacy" ... "Your Privacy Choices"
-    text = re.sub(r'We Care About Your Privacy.*?Your Privacy Choices', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = WE_CARE_RE.sub('', text)
     
     # 4. Standard "Privacy Center... OK"
-    text = re.sub(r'Privacy Center.*?OK', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = PRIVACY_CENTER_RE.sub('', text)
 
     # Remove Language Selector line string
-    text = re.sub(r'EnglishDeutschEspañolFrançaisItaliano.*', '', text, flags=re.IGNORECASE)
+    text = LANGUAGE_SELECTOR_RE.sub('', text)
 
     # Remove repeated "Social Media... On" blocks
     # Remove repeated "Social Media... On/Off" blocks
     # Handle "Social Media Cookies" or other variants followed by On/Off
-    text = re.sub(r'(Social Media|Targeted|Essential|Performance|Functional|Audience Measurement).*?\n\s*(On|Off)', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'^---\s*$', '', text, flags=re.MULTILINE) # Remove empty separator lines left behind
+    text = COOKIE_TOGGLE_RE.sub('', text)
+    text = SEPARATOR_LINE_RE.sub('', text) # Remove empty separator lines left behind
     
     # Remove Navigation / UI Noise
     # Robust Strategy: Identify the END of the header block and slice it off.
-    # The header consistently ends with "Sign In" variations in the first few KB.
-    header_end_markers = [
-        r'Sign In\s*Sign In',
-        r'\[Sign In\]\([^\)]+\)\s*\[Sign In\]\([^\)]+\)', # Markdown version double
-        r'\[Sign In\]\([^\)]+\)', # Markdown version single
-        r'Newsletters\s*Sign In',
-        r'\[Newsletters\]\([^\)]+\)\s*\[Sign In\]\([^\)]+\)', # Markdown version
-        r'Skip to main content', # Fallback
-    ]
-    
-    for marker in header_end_markers:
-        # Search the first 6000 chars (privacy block is usually ~4000 chars)
-        match = re.search(marker, text[:6000], flags=re.IGNORECASE | re.DOTALL)
+    # The header consistently ends with "Sign In" variations in the first few KB
+    # (HEADER_END_RES).
+    header = text[:6000]  # Search the first 6000 chars (privacy block is usually ~4000 chars)
+    for marker_re in HEADER_END_RES:
+        match = marker_re.search(header)
         if match:
             # Keep everything AFTER the match
             text = text[match.end():].lstrip()
             # Remove potential residual "Sign In" text (sometimes appears as plain text after the link)
-            text = re.sub(r'^Sign In\s*', '', text, flags=re.IGNORECASE).lstrip()
+            text = LEADING_SIGN_IN_RE.sub('', text).lstrip()
             break
     
-    ui_patterns = [
-        r'^\s*Menu\s*$',
-        r'^\s*Search\s*$',
-        r'^\s*Close\s*$',
-        r'^\s*Save Story\s*$',
-        r'^\s*Save this story\s*$',
-        r'^\s*Save to wishlist\s*$', # User requested removal
-        r'^\s*\[Search\s*Search\]\(/search\)\s*$',
-        r'confirm my choices',
-        r'reject all',
-        r'accept all',
-        r'Allow Sale/Targeted Advertising\?', # User specific report
-    ]
-    for pat in ui_patterns:
-        text = re.sub(pat, '', text, flags=re.IGNORECASE | re.MULTILINE)
+    text = toolkit.remove_lines(text, UI_LINE_RULES)
+    for ui_re in UI_TEXT_RES:
+        text = ui_re.sub('', text)
 
     # 4. Remove the standard Affiliate Disclaimer
     # "All products and listings featured... we may receive compensation..."
-    text = re.sub(r'All products and listings featured.*?through these links\.?', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = AFFILIATE_DISCLAIMER_RE.sub('', text)
 
     # 5. Remove persistent noise patterns (User Feedback & Generalized)
     # Photo credits (Generic "Name / Agency" detection)
     # Catches: "Patrick Dolande/Gotham Burger Social Club", "AGB Photo Library / Getty Images"
     # Pattern: Start of line, Capitalized Words, forward slash, Capitalized Words, End of line.
-    text = re.sub(r'(?m)^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*/\s*[A-Z].*$', '', text)
+    text = PHOTO_CREDIT_RE.sub('', text)
     # Known Agencies (Getty, etc) if they appear without the slash structure
-    text = re.sub(r'(?i)^.*(?:Getty\s*Images|Photo\s*Library).*$', '', text, flags=re.MULTILINE)
+    text = AGENCY_LINE_RE.sub('', text)
     
     # Social media artifacts (e.g., Pinterest links/filenames)
-    text = re.sub(r'(?i)^.*Pinterest\.(?:jpg|png|svg).*$', '', text, flags=re.MULTILINE)
+    text = PINTEREST_LINE_RE.sub('', text)
     
     # Recurring Headers/Sections to strip (flexible whitespace)
-    text = re.sub(r'(?i)^.*(?:Editor-recommended\s+hotels|Frequently\s+asked\s+questions).*$', '', text, flags=re.MULTILINE)
-    
-    # Broken image/link artifacts (lines starting with ! or + ending in image ext or link syntax)
-    text = re.sub(r'(?m)^\s*[!+].*\.(?:jpg|png|svg|jpeg|gif).*$', '', text)
+    text = SECTION_LINE_RE.sub('', text)
     
-    # Footer SVG links
-    text = re.sub(r'(?m)^.*!\[\].*$', '', text)
+    # Broken image/link artifacts (lines starting with ! or + ending in image
+    # ext or link syntax) and footer SVG links
+    text = toolkit.remove_lines(text, IMAGE_LINE_RULES)
 
     # Remove all Markdown images (User reported "massive links")
     # Matches: ![Alt Text](URL)
-    text = re.sub(r'!\[.*?\]\(.*?\)', '', text, flags=re.DOTALL)
+    text = MARKDOWN_IMAGE_RE.sub('', text)
     
     # Residual "Sign In" text (Force removal at start of string and standalone lines)
-    text = re.sub(r'(?i)\A\s*Sign\s+In\s*', '', text) # Start of text
-    text = re.sub(r'(?i)^\s*Sign\s+In\s*$', '', text, flags=re.MULTILINE) # Standalone lines
+    text = START_SIGN_IN_RE.sub('', text) # Start of text
+    text = SIGN_IN_LINE_RE.sub('', text) # Standalone lines
 
 
 
@@ -150,25 +192,18 @@ def clean_conde_nast(text, meta):
 
     # 5. Remove Breadcrumbs and UI Buttons
     # [North America](/destinations/north-america)Chevron
-    text = re.sub(r'\[.*?\]\(/.*?\)\s*Chevron', '', text)
+    text = BREADCRUMB_RE.sub('', text)
     
     # Remove UI artifacts seen in verification
-    ui_artifacts = [
-        r'AccordionItemContainerButton',
-        r'LargeChevron',
-        r'Arrow',
-        r'en\s*We Care\s*en', # "en We Care en" noise
-        r'^\s*en\s*$',
-    ]
-    for pat in ui_artifacts:
-        text = re.sub(pat, '', text, flags=re.IGNORECASE | re.MULTILINE)
+    for artifact_re in UI_ARTIFACT_RES:
+        text = artifact_re.sub('', text)
 
     # 6. Remove specific footer/cookie anomalies if they survived
-    text = re.sub(r'Manage your consent preferences', '', text, flags=re.IGNORECASE)
+    text = CONSENT_TEXT_RE.sub('', text)
 
     # 7. Flatten all remaining inline links: [Text](URL) -> Text
     # This addresses the user complaint about "links in the middle of text"
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    text = MARKDOWN_LINK_RE.sub(r'\1', text)
 
     # 8. Standard Inline Cleanup
     text = remove_inline_noise(text)
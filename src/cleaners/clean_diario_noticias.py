@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["DIARIO_NOTICIAS"]
+CLEAN_FUNCTION = "clean_diario_noticias"
+
 def clean_diario_noticias(text, meta):
     """
     Cleaner for Diário de Notícias (Portuguese news).
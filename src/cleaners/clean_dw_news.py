@@ -8,6 +8,10 @@ DW articles in markdown format have navigation, related articles, and footer noi
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["DW_NEWS"]
+CLEAN_FUNCTION = "clean_dw_news"
+
 
 def clean_dw_news(text, meta):
     """
@@ -1,6 +1,11 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+# None: inactive, see docs/eco_removal_decision.md (ECO_SAPO still goes to clean_sapo)
+SOURCE_KEYS = []
+CLEAN_FUNCTION = "clean_eco"
+
 def clean_eco(text, meta):
     # 1. Header Trim
     # Strategy A: Try to find the summary text in the body
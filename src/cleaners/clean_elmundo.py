@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["EL_MUNDO"]
+CLEAN_FUNCTION = "clean_elmundo"
+
 def clean_elmundo(text, meta):
     """
     Cleaner for EL_MUNDO articles.
@@ -2,6 +2,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["EL_PAIS"]
+CLEAN_FUNCTION = "clean_elpais"
+
 def clean_elpais(text, meta):
     """
     Cleaner for EL_PAIS variations.
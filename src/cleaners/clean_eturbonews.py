@@ -16,6 +16,10 @@ These articles have a heavy template that includes:
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["ETURBONEWS"]
+CLEAN_FUNCTION = "clean_eturbonews"
+
 
 # Known social-media / nav items that appear as bullet-list items
 _SOCIAL_NAV = {
@@ -1,6 +1,11 @@
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["EURONEWS_NEWS", "EURONEWS_TRAVEL", "EURONEWS_CULTURE"]
+CLEAN_FUNCTION = "clean_euronews"
+TAG_EXTRACTOR = "extract_euronews_tags"
+
 def extract_euronews_tags(text):
     """
     Extracts tags from the footer area of Euronews articles.
@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["EXPRESSO"]
+CLEAN_FUNCTION = "clean_expresso"
+
 def clean_expresso(text, meta):
     if not text:
         return ""
@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["FAZ"]
+CLEAN_FUNCTION = "clean_faz"
+
 def clean_faz(text, meta):
     """
     Basic cleaner for FAZ (Frankfurter Allgemeine Zeitung).
@@ -8,6 +8,10 @@ France24 articles have navigation, related articles, "Most read" sections, and f
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["FRANCE24"]
+CLEAN_FUNCTION = "clean_france24"
+
 
 def clean_france24(text, meta):
     """
@@ -1,7 +1,10 @@
 
 import re
-from datetime import datetime, timedelta
-from .utils import trim_header_by_title, remove_inline_noise
+from .utils import trim_header_by_title, remove_inline_noise, is_older_than
+
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["GUARDIAN"]
+CLEAN_FUNCTION = "clean_guardian"
 
 MAX_AGE_DAYS = 90
 
@@ -15,15 +18,9 @@ def clean_guardian(text, meta):
     """
     
     # 00a. Freshness Filter (90 days)
-    raw_date = meta.get('date') or meta.get('updated', '')
-    if raw_date:
-        try:
-            article_date = datetime.fromisoformat(raw_date.replace('Z', '+00:00'))
-            cutoff = datetime.now(article_date.tzinfo) - timedelta(days=MAX_AGE_DAYS)
-            if article_date < cutoff:
-                return ""  # Article too old
-        except (ValueError, TypeError):
-            pass  # If date parsing fails, keep the article
+    # Integer comparison on the pre-parsed publication epoch (see date_utils.py)
+    if is_older_than(meta, MAX_AGE_DAYS):
+        return ""
     
     # 00. Content Filtering (News & Travel ONLY)
     # User Request: "Focus on news and travel, nothing else." (Exclude Wellness, Nutrition, Sport, etc.)
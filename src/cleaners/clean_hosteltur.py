@@ -2,6 +2,10 @@
 import re
 from .utils import remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["HOSTELTUR"]
+CLEAN_FUNCTION = "clean_hosteltur"
+
 
 def clean_hosteltur(text, meta):
     """
@@ -8,6 +8,10 @@ These articles have notification prompts, newsletter signups, and footer noise.
 
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["INDEPENDENT_TRAVEL"]
+CLEAN_FUNCTION = "clean_independent_travel"
+
 
 def clean_independent_travel(text, meta):
     """
@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["JORNAL_NEGOCIOS"]
+CLEAN_FUNCTION = "clean_jornal_negocios"
+
 def clean_jornal_negocios(text, meta):
     """
     Cleaner for Jornal de Negócios (Portuguese business news).
@@ -1,7 +1,10 @@
 
 import re
-from datetime import datetime, timedelta
-from .utils import trim_header_by_title, remove_inline_noise
+from .utils import trim_header_by_title, remove_inline_noise, is_older_than
+
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["LE_FIGARO"]
+CLEAN_FUNCTION = "clean_le_figaro"
 
 MAX_AGE_DAYS = 90
 
@@ -15,16 +18,9 @@ def clean_le_figaro(text, meta):
     """
     
     # 00a. Freshness Filter (90 days)
-    raw_date = meta.get('date') or meta.get('published') or meta.get('updated', '')
-    if raw_date:
-        try:
-            from email.utils import parsedate_to_datetime
-            article_date = parsedate_to_datetime(raw_date)
-            cutoff = datetime.now(article_date.tzinfo) - timedelta(days=MAX_AGE_DAYS)
-            if article_date < cutoff:
-                return ""  # Article too old
-        except (ValueError, TypeError):
-            pass
+    # Integer comparison on the pre-parsed publication epoch (see date_utils.py)
+    if is_older_than(meta, MAX_AGE_DAYS):
+        return ""
     
     # 0. Header Trim (Title based)
     title = meta.get('title', '')
@@ -1,6 +1,10 @@
 import re
 from .utils import remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["PORTUGAL_NEWS"]
+CLEAN_FUNCTION = "clean_portugal_news"
+
 def clean_portugal_news(text, meta):
     """
     Cleaner for The Portugal News (English news about Portugal).
@@ -1,5 +1,9 @@
 import re
-from .utils import remove_inline_noise
+from .utils import remove_inline_noise, get_feed_payload
+
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["PORTUGAL_RESIDENT"]
+CLEAN_FUNCTION = "clean_portugal_resident"
 
 def clean_portugal_resident(text, meta):
     """
@@ -13,6 +17,12 @@ def clean_portugal_resident(text, meta):
     
     title = meta.get('title', '')
     
+    # Lean link records only keep "author"; the full "authors" list lives in the
+    # link store side table. Load it once here (not per line below).
+    meta_authors = meta.get('authors')
+    if not meta_authors and not meta.get('author'):
+        meta_authors = get_feed_payload(meta).get('authors')
+    
     print(f"Processing article '{title}'") # Keep minimal log or remove? Let's remove to be clean.
     
     # --- Header TrimStrategy ---
@@ -149,8 +159,8 @@ def clean_portugal_resident(text, meta):
         # Gather author names
         authors = []
         if meta.get('author'): authors.append(meta['author'])
-        if meta.get('authors'):
-             for a in meta['authors']:
+        if meta_authors:
+             for a in meta_authors:
                  if isinstance(a, dict) and a.get('name'): authors.append(a['name'])
                  elif isinstance(a, str): authors.append(a)
         
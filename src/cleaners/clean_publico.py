@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["PUBLICO"]
+CLEAN_FUNCTION = "clean_publico"
+
 def clean_publico(text, meta):
     """
     Cleaner for Publico (Portuguese news).
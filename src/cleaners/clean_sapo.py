@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["SAPO", "ECO_SAPO"]
+CLEAN_FUNCTION = "clean_sapo"
+
 def clean_sapo(text, meta):
     """
     Cleaner for Sapo Notícias and related sub-brands (SAPO_VIAGENS, Magg, etc.).
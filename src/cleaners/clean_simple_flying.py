@@ -2,6 +2,10 @@ import re
 from datetime import datetime, timedelta
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["SIMPLE_FLYING"]
+CLEAN_FUNCTION = "clean_simple_flying"
+
 def extract_simple_flying_date(text, scraped_at=None):
     """
     Extract publication date from Simple Flying raw content.
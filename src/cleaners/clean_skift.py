@@ -1,7 +1,166 @@
 import re
 from datetime import datetime, timedelta
+from . import toolkit
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["SKIFT"]
+CLEAN_FUNCTION = "clean_skift"
+
+# ==============================================================================
+#           PATTERNS (compiled once, when the module is imported)
+# ==============================================================================
+
+# Relative publication time near the byline: "| 8 hours ago"
+RELATIVE_DATE_RE = re.compile(r'\|\s*(\d+)\s*(hours?|days?|minutes?|weeks?|months?)\s*ago', re.IGNORECASE)
+
+MARKDOWN_IMAGE_RE = re.compile(r'!\[[^\]]*\]\([^\)]+\)')
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+
+COOKIE_BANNER_RE = re.compile(r'^×\s*\n.*?Accept\s*\nDecline\s*\n', re.DOTALL)
+COOKIE_DECLINE_RE = re.compile(r'If you decline, your information won\'t be tracked.*?Decline\s*\n', re.DOTALL)
+PRICING_BLOCK_RE = re.compile(r'BEST VALUE.*?CONTINUE\s*\nCONTINUE', re.DOTALL | re.IGNORECASE)
+
+# Header menu lines (removed before the  character, which can hide one)
+MENU_LINE_RULES = toolkit.compile_line_rules([
+    ("menu", [r'\s*' + item + r'\s*' for item in [
+        r'\* Latest News',
+        r'\* Ask Skift Search',
+        r'\* Travel Megatrends',
+        r'\* Travel Stock Index',
+        r'\* Advertise',
+        r'\* Skift Newsletters',
+        r'\* Skift Travel Podcasts',
+        r'\* Sectors',
+        r'\* Events',
+        r'\* Skift Forum Videos',
+        r'\* Leer en Español',
+        r'\+ Airlines',
+        r'\+ Business Travel',
+        r'\+ Hotels',
+        r'\+ Online Travel',
+        r'\+ Short-Term Rentals',
+        r'\+ Cruises',
+        r'\+ Startups',
+        r'\+ Tourism',
+        r'\+ Meetings',
+        r'\+ Travel Technology',
+        r'\+ All Sectors',
+        r'\+ All Events',
+        r'\+ Megatrends.*',
+        r'\+ Skift.*Forum.*',
+        r'\+ Skift.*Summit.*',
+        r'\+ Skift.*Awards.*',
+        r'\+ Women Leading Travel Forum',
+        r'Read in English',
+        r'Account',
+        r'Register',
+        r'Login',
+        r'Summarize Story',
+        r'!Play',  # Audio player button
+    ]]),
+])
+
+# Paywall and pricing lines (removed before the title trim)
+PAYWALL_LINE_RULES = toolkit.compile_line_rules([
+    ("paywall", [
+        r'First read is on us\.\s*',
+        r'-+\s*',  # Separator lines
+        r'Get unlimited access with Skift Pro\.\s*',
+        r'Unlock your next read\s*',
+        r'Enter your email for one more complimentary article.*?',
+        r'New users get\s*',
+        r'\*\*20% off\*\*\s*',
+        r'their first year of Skift Pro\s*',
+        r'Please ensure Javascript is enabled.*?accessibility.*?',
+        r'This website requires JavaScript to run\.\s*',
+        # Pricing table / Subscription block
+        r'BEST VALUE\s*',
+        r'### BILLED (ANNUALLY|MONTHLY)\s*',
+        r'\$\d+ per (year|month)\s*',
+        r'\(\$\d+/year\)\s*',
+        r'CONTINUE\s*',
+        r'Up Next\s*',
+        r'Industry Insights: \d+ Questions With.*',
+    ], re.IGNORECASE),
+])
+
+# Share buttons, "Ask Skift" questions and the podcast player (after the title trim)
+SHARE_LINE_RULES = toolkit.compile_line_rules([
+    ("skift_take", [r'Skift Take\s*']),
+    ("share", [
+        r'\* LinkedIn\s*',
+        r'\* X\s*',
+        r'\* Facebook\s*',
+        r'\* WhatsApp\s*',
+        r'\* Email\s*',
+        r'\* (What|How|Why|When|Which|Who|Where|Are there|Is the|Can|Will|Does|Did).*?\?\s*',
+        r'Select a question above.*?',
+    ]),
+    ("podcast", [
+        r'play_circle_filled\s*',
+        r'play\\_circle\\_filled\s*',
+        r'Listen to Story\s*',
+        r'Share\s*',
+        r'-+\s*',
+        r'00:00:00\s*',
+        r'Forward 15 seconds\s*',
+        r'Back 15 seconds\s*',
+        r'Description\s*',
+        r'Share this episode with your friends\s*',
+        r'Keep up to date by subscribing to this podcast\s*',
+        r'In This Playlist\s*',
+        r'\d+ (of \d+ )?Episodes?\s*',
+    ], re.IGNORECASE),
+])
+# Duration like "42 min", "1 hr 3 min" (its \s+ can join two lines, so not a line rule)
+DURATION_LINE_RE = re.compile(r'^\d+ (min|hr)(\s+\d+ min)?\s*$', re.MULTILINE | re.IGNORECASE)
+PLAYLIST_LINE_RULES = toolkit.compile_line_rules([
+    ("podcast", [
+        r'Load more\s*',
+        r'Save to Spotify\s*',
+        r'Airline Weekly Lounge( Podcast)?\s*',
+        r'Share Airline Weekly Lounge( Podcast)?\s*',
+        r'Follow the Hosts:.*',
+        r'Connect with (Airline Weekly|Skift).*',
+        r'Recorded on-stage at.*',  # Common intro for podcast transcripts
+    ], re.IGNORECASE),
+    # Episode titles and podcast descriptions from playlists
+    ("episode", [r'(Inside|The|In Conversation|What|Why|How|Is|Even|Airlines in|America\'s).*?(Interview|Playbook|2026|Profitable|Laurels|Squeeze|Sunrise|All-Stars)\s*']),
+    # Podcast host info
+    ("hosts", [r'Gordon Smith.*?LinkedIn.*?', r'Jay Shabat.*?LinkedIn.*?'], re.IGNORECASE),
+    # "Summary" section header (bold or plain; its "---" underline is already
+    # gone by now, so the old "Summary\n---" pattern never matched)
+    ("summary", [r'\s*(\*\*)?Summary(\*\*)?\s*']),
+])
+
+# Blocks: a header line and everything up to the next blank line
+REFERENCED_BLOCK_RE = re.compile(r'^\s*(\*\*)?Articles Referenced:(\*\*)?.*?(?=\n\n|\Z)', re.MULTILINE | re.DOTALL)
+PODCAST_BLOCK_RES = [
+    re.compile(r'^\s*\*\*Follow the Hosts:.*?(?=\n\n|\Z)', re.MULTILINE | re.DOTALL),
+    re.compile(r'^\s*\*\*Connect with (Airline Weekly|Skift).*?(?=\n\n|\Z)', re.MULTILINE | re.DOTALL),
+    re.compile(r'^\s*\*\*Your daily travel podcast:.*?(?=\n\n|\Z)', re.MULTILINE | re.DOTALL),
+    # Newsletter footers
+    re.compile(r'^\s*Curated by \*\*.*?(?=\n\n|\Z)', re.MULTILINE | re.DOTALL),
+    re.compile(r'^\s*\*\*Early Check-In\*\* helps y.*?(?=\n\n|\Z)', re.MULTILINE | re.DOTALL),
+]
+
+# Footer gibberish and social media links (after the blocks)
+GIBBERISH_LINE_RE = re.compile(r'^mmMwWLliI0fiflO&1\s*$', re.MULTILINE)
+WORD_GIBBERISH_RE = re.compile(r'^(word\s+){10,}word\s*$', re.MULTILINE)  # "word word word..." (may span lines)
+SOCIAL_LINE_RULES = toolkit.compile_line_rules([
+    ("social", [r'(LinkedIn|X|Instagram|Threads|Bluesky):.*?', r'@skiftnews.*?'], re.IGNORECASE),
+])
+
+# Related article blocks: "### Title\nDescription...\nAuthor | X hours ago"
+RELATED_BLOCK_RE = re.compile(r'###\s+.+\n.+\n.+\|\s*\d+\s*(hours?|days?)\s*ago', re.IGNORECASE)
+# Orphaned author bylines (the \s+ can join two lines) and "Sponsored" tags
+BYLINE_LINE_RE = re.compile(r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+\|\s+\d+\s+(hours?|days?|months?)\s+ago\s*$', re.MULTILINE)
+SPONSORED_LINE_RE = re.compile(r'^Sponsored\s*$', re.MULTILINE)
+
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+SEPARATOR_LINE_RE = re.compile(r'^\s*[-=_]{3,}\s*$', re.MULTILINE)
+
 def extract_skift_date(text, scraped_at=None):
     """
     Extract publication date from Skift raw content.
@@ -9,7 +168,7 @@ def extract_skift_date(text, scraped_at=None):
     """
     # Look for relative time patterns often found near author bylines
     # Examples: "| 8 hours ago", "| 1 day ago", "| 23 hours ago"
-    match = re.search(r'\|\s*(\d+)\s*(hours?|days?|minutes?|weeks?|months?)\s*ago', text, re.IGNORECASE)
+    match = RELATIVE_DATE_RE.search(text)
     
     if match:
         amount = int(match.group(1))
@@ -58,6 +217,11 @@ def clean_skift(text, meta, scraped_at=None):
     - Social links: "LinkedIn", "* X", "* Email"
     - AI questions: "* What...?"
     - Footer gibberish: "mmMwWLli..."
+    
+    The junk LINES are listed in the *_LINE_RULES at the top and removed in
+    one pass each (cleaners/toolkit.py); the patterns that span several lines
+    run in between, in their old order, so the text is the same as with one
+    re.sub() per pattern.
     """
     
     # 0. Extract Date BEFORE cleaning (from raw text)
@@ -68,167 +232,49 @@ def clean_skift(text, meta, scraped_at=None):
 
     # 0. Formatting normalization
     # Remove markdown images first (they are noise)
-    text = re.sub(r'!\[[^\]]*\]\([^\)]+\)', '', text)
+    text = MARKDOWN_IMAGE_RE.sub('', text)
     # Convert markdown links to text (e.g. [text](url) -> text)
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    text = MARKDOWN_LINK_RE.sub(r'\1', text)
     
     # 1. Remove cookie consent banner
-    text = re.sub(r'^×\s*\n.*?Accept\s*\nDecline\s*\n', '', text, flags=re.DOTALL)
-    text = re.sub(r'If you decline, your information won\'t be tracked.*?Decline\s*\n', '', text, flags=re.DOTALL)
+    text = COOKIE_BANNER_RE.sub('', text)
+    text = COOKIE_DECLINE_RE.sub('', text)
     
-    # 2. Remove entire header menu block (match beginning up to article content)
-    # Look for the pattern where the menu ends and content starts
-    # The menu typically ends with "Register" or similar, then article begins
+    # 2. Remove header menu items
+    text = toolkit.remove_lines(text, MENU_LINE_RULES)
     
-    # Remove individual menu items with flexible whitespace
-    menu_items = [
-        r'\* Latest News',
-        r'\* Ask Skift Search',
-        r'\* Travel Megatrends',
-        r'\* Travel Stock Index',
-        r'\* Advertise',
-        r'\* Skift Newsletters',
-        r'\* Skift Travel Podcasts',
-        r'\* Sectors',
-        r'\* Events',
-        r'\* Skift Forum Videos',
-        r'\* Leer en Español',
-        r'\+ Airlines',
-        r'\+ Business Travel',
-        r'\+ Hotels',
-        r'\+ Online Travel',
-        r'\+ Short-Term Rentals',
-        r'\+ Cruises',
-        r'\+ Startups',
-        r'\+ Tourism',
-        r'\+ Meetings',
-        r'\+ Travel Technology',
-        r'\+ All Sectors',
-        r'\+ All Events',
-        r'\+ Megatrends.*',
-        r'\+ Skift.*Forum.*',
-        r'\+ Skift.*Summit.*',
-        r'\+ Skift.*Awards.*',
-        r'\+ Women Leading Travel Forum',
-        r'Read in English',
-        r'Account',
-        r'Register',
-        r'Login',
-        r'Summarize Story',
-        r'!Play',  # Audio player button
-    ]
-    for item in menu_items:
-        text = re.sub(r'^\s*' + item + r'\s*$', '', text, flags=re.MULTILINE)
-        
     # Remove specific residual characters
-    text = re.sub(r'[\ue602]', '', text)  #  character
+    text = text.replace('\ue602', '')  #  character
     
     # 3. Remove paywall / subscription prompts
-    paywall_patterns = [
-        r'^First read is on us\.\s*$',
-        r'^-+\s*$',  # Separator lines
-        r'^Get unlimited access with Skift Pro\.\s*$',
-        r'^Unlock your next read\s*$',
-        r'^Enter your email for one more complimentary article.*?$',
-        r'^New users get\s*$',
-        r'^\*\*20% off\*\*\s*$',
-        r'^their first year of Skift Pro\s*$',
-        r'^Please ensure Javascript is enabled.*?accessibility.*?$',
-        r'^This website requires JavaScript to run\.\s*$',
-        # Pricing table / Subscription block
-        r'^BEST VALUE\s*$',
-        r'^### BILLED (ANNUALLY|MONTHLY)\s*$',
-        r'^\$\d+ per (year|month)\s*$',
-        r'^\(\$\d+/year\)\s*$',
-        r'^CONTINUE\s*$',
-        r'^Up Next\s*$',
-        r'^Industry Insights: \d+ Questions With.*$',
-    ]
-    for pat in paywall_patterns:
-        text = re.sub(pat, '', text, flags=re.MULTILINE | re.IGNORECASE)
+    text = toolkit.remove_lines(text, PAYWALL_LINE_RULES)
         
     # Remove block for subscription pricing if multiple lines match
-    text = re.sub(r'BEST VALUE.*?CONTINUE\s*\nCONTINUE', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = PRICING_BLOCK_RE.sub('', text)
     
     # 4. Header Trimming (Title Based) 
     text = trim_header_by_title(text, meta.get('title'))
     
-    # 5. Remove "Skift Take" section header
-    text = re.sub(r'^Skift Take\s*$', '', text, flags=re.MULTILINE)
-    
-    # 6. Remove social share / AI questions block
-    # These appear as "* LinkedIn\n* X\n* Email" and "* What...?\n* How...?"
-    text = re.sub(r'^\* LinkedIn\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\* X\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\* Facebook\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\* WhatsApp\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\* Email\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\* (What|How|Why|When|Which|Who|Where|Are there|Is the|Can|Will|Does|Did).*?\?\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^Select a question above.*?$', '', text, flags=re.MULTILINE)
-    
-    # 7. Remove podcast player elements
-    podcast_patterns = [
-        r'^play_circle_filled\s*$',
-        r'^play\\_circle\\_filled\s*$',
-        r'^Listen to Story\s*$',
-        r'^Share\s*$',
-        r'^-+\s*$',
-        r'^00:00:00\s*$',
-        r'^Forward 15 seconds\s*$',
-        r'^Back 15 seconds\s*$',
-        r'^Description\s*$',
-        r'^Share this episode with your friends\s*$',
-        r'^Keep up to date by subscribing to this podcast\s*$',
-        r'^In This Playlist\s*$',
-        r'^\d+ (of \d+ )?Episodes?\s*$',
-        r'^\d+ (min|hr)(\s+\d+ min)?\s*$',  # Duration like "42 min", "1 hr 3 min"
-        r'^Load more\s*$',
-        r'^Save to Spotify\s*$',
-        r'^Airline Weekly Lounge( Podcast)?\s*$',
-        r'^Share Airline Weekly Lounge( Podcast)?\s*$',
-        r'^Follow the Hosts:.*$',
-        r'^Connect with (Airline Weekly|Skift).*$',
-        r'^Recorded on-stage at.*$',  # Common intro for podcast transcripts
-    ]
-    for pat in podcast_patterns:
-        text = re.sub(pat, '', text, flags=re.MULTILINE | re.IGNORECASE)
-    
-    # 8. Remove episode titles and podcast descriptions from playlists
-    text = re.sub(r'^(Inside|The|In Conversation|What|Why|How|Is|Even|Airlines in|America\'s).*?(Interview|Playbook|2026|Profitable|Laurels|Squeeze|Sunrise|All-Stars)\s*$', '', text, flags=re.MULTILINE)
-    
-    # Remove podcast host info blocks
-    text = re.sub(r'^Gordon Smith.*?LinkedIn.*?$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'^Jay Shabat.*?LinkedIn.*?$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    
-    # Remove "Summary" section header (handle bold, whitespace, underlines)
-    text = re.sub(r'^\s*(\*\*)?Summary(\*\*)?\s*\n-+\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\s*(\*\*)?Summary(\*\*)?\s*$', '', text, flags=re.MULTILINE)
+    # 5. - 8. Remove "Skift Take", social share / AI questions, podcast
+    # player elements, episode titles, host info and the "Summary" header
+    text = toolkit.remove_lines(text, SHARE_LINE_RULES)
+    text = DURATION_LINE_RE.sub('', text)
+    text = toolkit.remove_lines(text, PLAYLIST_LINE_RULES)
     
     # Remove "Articles Referenced" block (and the list that follows)
-    # Match header and subsequent bullet points
-    text = re.sub(r'^\s*(\*\*)?Articles Referenced:(\*\*)?.*?(?=\n\n|\Z)', '', text, flags=re.MULTILINE | re.DOTALL)
+    text = REFERENCED_BLOCK_RE.sub('', text)
     
     # Remove Podcast/Newsletter bold headers AND the content following them
     # "Follow the Hosts:" usually followed by "Gordon Smith..." lines
     # "Connect with..." usually followed by social links
-    text = re.sub(r'^\s*\*\*Follow the Hosts:.*?(?=\n\n|\Z)', '', text, flags=re.MULTILINE | re.DOTALL)
-    text = re.sub(r'^\s*\*\*Connect with (Airline Weekly|Skift).*?(?=\n\n|\Z)', '', text, flags=re.MULTILINE | re.DOTALL)
-    text = re.sub(r'^\s*\*\*Your daily travel podcast:.*?(?=\n\n|\Z)', '', text, flags=re.MULTILINE | re.DOTALL)
-    
-    # Remove Newsletter specific footers
-    text = re.sub(r'^\s*Curated by \*\*.*?(?=\n\n|\Z)', '', text, flags=re.MULTILINE | re.DOTALL)
-    text = re.sub(r'^\s*\*\*Early Check-In\*\* helps y.*?(?=\n\n|\Z)', '', text, flags=re.MULTILINE | re.DOTALL)
+    for block_re in PODCAST_BLOCK_RES:
+        text = block_re.sub('', text)
     
-    # 9. Remove footer gibberish
-    text = re.sub(r'^mmMwWLliI0fiflO&1\s*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^(word\s+){10,}word\s*$', '', text, flags=re.MULTILINE)  # "word word word..."
-    
-    # 10. Remove social media links (clean up any stragglers)
-    # Also handle "Threads:", "Bluesky:", "@skiftnews"
-    text = re.sub(r'^(LinkedIn|X|Instagram|Threads|Bluesky):.*?$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'^@skiftnews.*?$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    
-    # [Markdown link removal moved to step 0]
+    # 9. + 10. Remove footer gibberish and social media links (stragglers,
+    # "Threads:", "Bluesky:", "@skiftnews")
+    text = GIBBERISH_LINE_RE.sub('', text)
+    text = WORD_GIBBERISH_RE.sub('', text)
+    text = toolkit.remove_lines(text, SOCIAL_LINE_RULES)
     
     # 12. Aggressive footer/section trimming
     # These signals indicate the main article content has ended
@@ -266,23 +312,21 @@ def clean_skift(text, meta, scraped_at=None):
     
     # 13. Remove any remaining related article blocks
     # Pattern: "### Title\nDescription...\nAuthor | X hours ago"
-    text = re.sub(r'###\s+.+\n.+\n.+\|\s*\d+\s*(hours?|days?)\s*ago', '', text, flags=re.IGNORECASE)
-    
-    # Remove stray author bylines that got orphaned
-    text = re.sub(r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+\|\s+\d+\s+(hours?|days?|months?)\s+ago\s*$', '', text, flags=re.MULTILINE)
+    text = RELATED_BLOCK_RE.sub('', text)
     
-    # Remove "Sponsored" tags
-    text = re.sub(r'^Sponsored\s*$', '', text, flags=re.MULTILINE)
+    # Remove stray author bylines that got orphaned, and "Sponsored" tags
+    text = BYLINE_LINE_RE.sub('', text)
+    text = SPONSORED_LINE_RE.sub('', text)
     
     # 14. Inline noise
     text = remove_inline_noise(text)
     
     # 15. Clean up excessive newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = EXTRA_NEWLINES_RE.sub('\n\n', text)
     
     # 16. Remove separation markers (lines of -, =, or _) using flexible cleaning
     # Must be done cautiously to not remove markdown headers that were actually content
     # But Skift uses them mostly for noise separation
-    text = re.sub(r'^\s*[-=_]{3,}\s*$', '', text, flags=re.MULTILINE)
+    text = SEPARATOR_LINE_RE.sub('', text)
     
     return text.strip()
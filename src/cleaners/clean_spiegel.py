@@ -3,6 +3,10 @@ import re
 from datetime import datetime
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["SPIEGEL"]
+CLEAN_FUNCTION = "clean_spiegel"
+
 def clean_spiegel(text, meta):
     """
     Cleaner for Spiegel Reise articles (Markdown input).
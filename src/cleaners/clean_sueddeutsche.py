@@ -1,6 +1,10 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["SUEDDEUTSCHE"]
+CLEAN_FUNCTION = "clean_sueddeutsche"
+
 def clean_sueddeutsche(text, meta):
     """
     Cleaner for Sueddeutsche Reise articles.
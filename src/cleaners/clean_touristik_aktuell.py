@@ -1,5 +1,9 @@
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["TOURISTIK_AKTUELL"]
+CLEAN_FUNCTION = "clean_touristik_aktuell"
+
 def clean_touristik_aktuell(text, meta):
     """
     Cleaner for Touristik Aktuell articles.
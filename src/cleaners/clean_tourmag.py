@@ -1,5 +1,9 @@
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["TOURMAG"]
+CLEAN_FUNCTION = "clean_tourmag"
+
 def clean_tourmag(text, meta):
     """
     Cleaner for TourMag articles.
@@ -1,9 +1,72 @@
 import re
+from . import toolkit
+
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["TRAVEL_LEISURE"]
+CLEAN_FUNCTION = "clean_travel_leisure"
+
+# ==============================================================================
+#           PATTERNS (compiled once, when the module is imported)
+# ==============================================================================
+
+# Image markdown (multiple formats)
+MAX_BYTES_IMAGE_RE = re.compile(r'!\[[^\]]*:max_bytes[^\]]*\](?:\([^)]*\))?')
+MARKDOWN_IMAGE_RE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+BROKEN_IMAGE_RE = re.compile(r'^!\[[^\]]+\n', re.MULTILINE)
+MAX_BYTES_FRAGMENT_RE = re.compile(r':max_bytes\([^)]+\):[^\n]+\.(jpg|png|webp|jpeg|JPG|PNG)\)?')
+# Photographer credits: "Name Name/Getty Images" or "Name/Source", "Getty Images"
+CREDIT_LINE_RULES = toolkit.compile_line_rules([
+    ("credit", [
+        r'[A-Z][a-zéèêë]+ [A-Z][a-zéèêë]+/[A-Za-z &]+',
+        r'Getty Images',
+        r'Travel \+ Leisure',
+    ]),
+])
+
+# Lines dropped in the line-by-line pass (one regex, matched at the line start)
+SKIP_LINE_RE = re.compile("|".join([
+    r'^={3,}$',                  # H1 underline: ===
+    r'^-{3,}$',                  # H2 underline: --- or horizontal rules
+    r'^By$',                     # Standalone "By" line
+    r'^Close$',                  # Close button text
+    r'^Credit:',                 # Photo credit
+    r'^Updated on \w+',          # "Updated on December 12..."
+    r'^Published on \w+',        # "Published on December 12..."
+    r'^In This Article$',        # Article navigation
+    r'^View All$',               # View all link
+    r'^\[\d+$',                  # Comment count: "[2"
+    r'^Comments\]',              # Comment link
+    r'^### Key Takeaway$',       # Summary section header
+    r'^\* \[',                   # Table of contents: * [Section]
+    r'^\[Leave a Comment\]',     # Comment link
+    r'^\[Travel \+ Leisure Editorial', # Editorial guidelines link
+    r'^Newsletter Sign Up$',     # Newsletter signup
+    r'^Read more:$',             # Read more link
+    r'^Comments$',               # Comments section header
+    r'^Account$',                # Account section
+    r'^All comments are subject', # Comment guidelines
+]))
+LINK_TEXT_RE = re.compile(r'\[([^\]]+)\]\(.*?\)')
+BIO_INDICATORS = ['writer', 'journalist', 'appeared in', 'contributing author', 
+                  'stories have appeared', 'work has appeared', 'freelance',
+                  'years of experience', 'editor who']
+CREDIT_TEXT_RE = re.compile(r'^[A-Z][a-zéèêë]+( [A-Z][a-zéèêë]+)*/[A-Za-z &\+]+$')
+
+# Inline noise
+ABSOLUTE_LINK_RE = re.compile(r'\[([^\]]+)\]\(https?://[^)]+\)')
+RELATIVE_LINK_RE = re.compile(r'\[([^\]]+)\]\(/[^)]+\)')
+SITE_URL_RE = re.compile(r'https://www\.travelandleisure\.com/[^\s\)]+')
+EMPTY_LINK_RE = re.compile(r'\[([^\]]+)\]\(\)')
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+EXTRA_SPACES_RE = re.compile(r'  +')
 
 def clean_travel_leisure(text, meta):
     """
     Cleaner for Travel + Leisure articles.
     Removes H1 underlines, author bios, photo credits, GDPR consent banners, and cookie UI.
+
+    All patterns are compiled at import (top of the file) and run in their
+    old order.
     """
     
     # 1. CUT FOOTER - Privacy/Cookie consent banners and newsletter
@@ -38,74 +101,42 @@ def clean_travel_leisure(text, meta):
     
     # 3. REMOVE IMAGE MARKDOWN (multiple formats)
     # Format: ![alt:max_bytes(150000):strip_icc():format(webp)/path] or similar
-    text = re.sub(r'!\[[^\]]*:max_bytes[^\]]*\](?:\([^)]*\))?', '', text)
+    text = MAX_BYTES_IMAGE_RE.sub('', text)
     # Standard image markdown: ![alt](url)
-    text = re.sub(r'!\[[^\]]*\]\([^)]*\)', '', text)
+    text = MARKDOWN_IMAGE_RE.sub('', text)
     # Broken image refs: ![alt text
-    text = re.sub(r'^!\[[^\]]+\n', '', text, flags=re.MULTILINE)
+    text = BROKEN_IMAGE_RE.sub('', text)
     # Standalone :max_bytes fragments (leftover from broken markdown) - catch all extensions
-    text = re.sub(r':max_bytes\([^)]+\):[^\n]+\.(jpg|png|webp|jpeg|JPG|PNG)\)?', '', text)
+    text = MAX_BYTES_FRAGMENT_RE.sub('', text)
     # Photographer credits: "Name Name/Getty Images" or "Name/Source"
-    text = re.sub(r'^[A-Z][a-zéèêë]+ [A-Z][a-zéèêë]+/[A-Za-z &]+$', '', text, flags=re.MULTILINE)
     # Single word credit sources: "Getty Images"
-    text = re.sub(r'^Getty Images$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^Travel \+ Leisure$', '', text, flags=re.MULTILINE)
+    text = toolkit.remove_lines(text, CREDIT_LINE_RULES)
     
     # 4. LINE-BY-LINE CLEANING
     lines = text.split('\n')
     cleaned_lines = []
     
-    skip_patterns = [
-        r'^={3,}$',                  # H1 underline: ===
-        r'^-{3,}$',                  # H2 underline: --- or horizontal rules
-        r'^By$',                     # Standalone "By" line
-        r'^Close$',                  # Close button text
-        r'^Credit:',                 # Photo credit
-        r'^Updated on \w+',          # "Updated on December 12..."
-        r'^Published on \w+',        # "Published on December 12..."
-        r'^In This Article$',        # Article navigation
-        r'^View All$',               # View all link
-        r'^\[\d+$',                  # Comment count: "[2"
-        r'^Comments\]',              # Comment link
-        r'^### Key Takeaway$',       # Summary section header
-        r'^\* \[',                   # Table of contents: * [Section]
-        r'^\[Leave a Comment\]',     # Comment link
-        r'^\[Travel \+ Leisure Editorial', # Editorial guidelines link
-        r'^Newsletter Sign Up$',     # Newsletter signup
-        r'^Read more:$',             # Read more link
-        r'^Comments$',               # Comments section header
-        r'^Account$',                # Account section
-        r'^All comments are subject', # Comment guidelines
-    ]
-    
     for line in lines:
         s_line = line.strip()
         if not s_line:
             continue
             
-        # Skip matching patterns
-        skip = False
-        for pattern in skip_patterns:
-            if re.match(pattern, s_line):
-                skip = True
-                break
-        if skip:
+        # Skip matching patterns (SKIP_LINE_RE: all of them in one match)
+        if SKIP_LINE_RE.match(s_line):
             continue
         
         # Strip markdown links from line for checking content: [Text](url) -> Text
         # This is temporary for the check, the actual line is cleaned later or we can clean it now.
         # It's safer to just look at the text content for the decision.
-        content_only = re.sub(r'\[([^\]]+)\]\(.*?\)', r'\1', s_line).strip()
+        content_only = LINK_TEXT_RE.sub(r'\1', s_line).strip()
         
         # Skip author bio lines - check content_only
-        bio_indicators = ['writer', 'journalist', 'appeared in', 'contributing author', 
-                         'stories have appeared', 'work has appeared', 'freelance',
-                         'years of experience', 'editor who']
-        if any(ind in content_only.lower() for ind in bio_indicators):
+        lower_content = content_only.lower()
+        if any(ind in lower_content for ind in BIO_INDICATORS):
             continue
         
         # Skip photographer credits based on content_only
-        if re.match(r'^[A-Z][a-zéèêë]+( [A-Z][a-zéèêë]+)*/[A-Za-z &\+]+$', content_only):
+        if CREDIT_TEXT_RE.match(content_only):
             continue
         
         # Skip standalone author names based on content_only
@@ -123,18 +154,18 @@ def clean_travel_leisure(text, meta):
     
     # 5. REMOVE INLINE NOISE
     # Remove markdown links but keep text: [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\(https?://[^)]+\)', r'\1', text)
-    text = re.sub(r'\[([^\]]+)\]\(/[^)]+\)', r'\1', text)  # Relative URLs
+    text = ABSOLUTE_LINK_RE.sub(r'\1', text)
+    text = RELATIVE_LINK_RE.sub(r'\1', text)  # Relative URLs
     # Remove standalone URLs
-    text = re.sub(r'https://www\.travelandleisure\.com/[^\s\)]+', '', text)
+    text = SITE_URL_RE.sub('', text)
     # Remove empty link brackets: [text]()
-    text = re.sub(r'\[([^\]]+)\]\(\)', r'\1', text)
+    text = EMPTY_LINK_RE.sub(r'\1', text)
     # Remove GDPR elements
-    text = re.sub(r'checkbox label label', '', text)
-    text = re.sub(r'Consent Leg\.Interest', '', text)
+    text = text.replace('checkbox label label', '')
+    text = text.replace('Consent Leg.Interest', '')
     
     # 6. CLEAN UP
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r'  +', ' ', text)
+    text = EXTRA_NEWLINES_RE.sub('\n\n', text)
+    text = EXTRA_SPACES_RE.sub(' ', text)
     
     return text.strip()
@@ -1,5 +1,9 @@
 import re
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["WASHINGTON_POST"]
+CLEAN_FUNCTION = "clean_washington_post"
+
 def clean_washington_post(text, meta):
     """
     Cleaner for Washington Post articles.
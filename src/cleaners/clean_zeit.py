@@ -2,6 +2,11 @@
 import re
 from .utils import trim_header_by_title, remove_inline_noise
 
+# Registry entry: the sources this cleaner handles (see cleaners/dispatcher.py)
+SOURCE_KEYS = ["DIE_ZEIT"]
+CLEAN_FUNCTION = "clean_die_zeit"
+TAG_EXTRACTOR = "extract_zeit_tags"
+
 def extract_zeit_tags(text):
     """
     Extracts tags from the footer list in Die Zeit articles.
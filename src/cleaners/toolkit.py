@@ -0,0 +1,171 @@
+"""
+Cleaning toolkit - shared helpers for the cleaners/ modules
+===========================================================
+
+Most cleaners remove junk LINES ("* Latest News", "Share", "00:00:00") with
+one re.sub(r'^...$', '', text, flags=re.MULTILINE) per pattern. With 40
+patterns that is 40 passes over the whole article, and a pattern built in a
+loop (r'^\\s*' + item + r'\\s*$') is compiled again for every item.
+
+This module lets a cleaner declare its line rules ONCE, at import:
+
+    LINE_RULES = toolkit.compile_line_rules([
+        ("menu",    [r"\\s*\\* Latest News\\s*", r"\\s*\\+ Airlines\\s*"]),
+        ("paywall", [r"First read is on us\\.\\s*", r"Up Next\\s*"], re.IGNORECASE),
+    ])
+
+and then check every line against all of them in ONE pass over the text:
+
+    text = toolkit.remove_lines(text, LINE_RULES)
+
+The result is exactly what the old re.sub() calls gave, run one after the
+other in the order the patterns are listed. That includes the blank lines
+they swallowed: r'^\\s*X\\s*$' does not only remove the line "X", its \\s*
+also eats the blank lines around it (they are whitespace too), which moves
+every later character. Cleaners that cut "after 30% of the text" depend on
+that, so remove_lines() eats the same blank lines.
+
+The labels ("menu", "paywall") only name the rules for the reader. Rules
+that must run at different points of a cleaner go into separate
+compile_line_rules() calls (e.g. HEADER_LINE_RULES, FOOTER_LINE_RULES).
+
+RULES:
+- A pattern must match the WHOLE line: r'^Share\\s*$' becomes r'Share\\s*'
+  (no ^ and $, and no "\\n" inside)
+- Keep the r'\\s*' at the start / end of the old pattern: they decide which
+  blank lines before / after the line are removed with it
+- The pattern must not match an empty line or start with whitespace other
+  than that leading r'\\s*'
+- Patterns that span several lines ("BEST VALUE.*?CONTINUE") stay separate
+  re.compile() calls in the cleaner, run in their old order. So does a line
+  pattern whose \\s+ could join two lines ("John\\nSmith | 3 hours ago")
+- Anything that changes a line in between two groups of old re.sub() calls
+  (e.g. text.replace) splits them into two compile_line_rules() calls
+"""
+
+import re
+
+# Old r'^\s*X\s*$': the leading / trailing \s* also eat neighbouring blank lines
+BLANKS = r'\s*'
+
+
+def compile_line_rules(rules):
+    """
+    Merge all line rules into ONE compiled regex (one alternation), with a
+    named group per pattern so a match tells which pattern came first.
+
+    PARAMETERS:
+    - rules: List of (label, patterns) or (label, patterns, flags) tuples.
+      label is a short name ("menu", "paywall"), patterns a list of regex
+      strings for whole lines, flags 0 or re.IGNORECASE.
+
+    RETURNS:
+    - Dictionary for remove_lines:
+      {"regex": compiled alternation,
+       "patterns": {group name: {"order": n, "blanks_before": bool, "blanks_after": bool}}}
+    """
+    groups = []
+    patterns_info = {}
+    for rule in rules:
+        patterns = rule[1]
+        flags = rule[2] if len(rule) > 2 else 0
+        for pattern in patterns:
+            name = f"p{len(patterns_info)}"
+            patterns_info[name] = {
+                "order": len(patterns_info),
+                "blanks_before": pattern.startswith(BLANKS),
+                "blanks_after": pattern.endswith(BLANKS),
+            }
+            if flags & re.IGNORECASE:
+                groups.append(f"(?P<{name}>(?i:{pattern}))")
+            else:
+                groups.append(f"(?P<{name}>{pattern})")
+    return {"regex": re.compile("|".join(groups)), "patterns": patterns_info}
+
+
+def remove_lines(text, line_rules):
+    """
+    Remove every line that matches a rule, with one regex check per line.
+
+    Gives the same text as running re.sub('^' + pattern + '$', '', text,
+    flags=re.MULTILINE) for each pattern in turn:
+    - a matched line becomes one empty line
+    - with a leading \\s*, the blank lines just above it go into that empty line
+    - with a trailing \\s*, so do the blank lines just below it
+    Lines matched by an earlier pattern are handled first, as the old
+    re.sub() calls did, because the blank lines they leave are what the later
+    patterns' \\s* can eat.
+
+    PARAMETERS:
+    - text: The article text
+    - line_rules: Dictionary from compile_line_rules
+
+    RETURNS:
+    - The cleaned text
+    """
+    lines = text.split("\n")
+    match_line = line_rules["regex"].fullmatch
+    patterns_info = line_rules["patterns"]
+
+    # 1. One pass: which lines match, and which pattern would remove them first
+    hits = []
+    for i, line in enumerate(lines):
+        if line and not line.isspace():
+            match = match_line(line)
+            if match is not None:
+                hits.append((patterns_info[match.lastgroup]["order"], i, match.lastgroup))
+    if not hits:
+        return text
+
+    # 2. Remove them in the old order. Removed lines are unlinked from a
+    # doubly linked list of line numbers, so the blank lines around a hit
+    # are found without shifting the list.
+    count = len(lines)
+    is_blank = [not line or line.isspace() for line in lines]
+    previous_line = list(range(-1, count - 1))
+    next_line = list(range(1, count + 1))
+
+    # re.sub() goes on searching where its last match ended: the empty line a
+    # match leaves can only be eaten by the next match of the SAME pattern if
+    # that match ended at the start of a line (on an empty line)
+    barrier = -1
+    previous_order = -1
+
+    hits.sort()
+    for order, i, name in hits:
+        info = patterns_info[name]
+        if order != previous_order:
+            barrier = -1
+            previous_order = order
+        first = i
+        if info["blanks_before"]:
+            j = previous_line[first]
+            while j > barrier and is_blank[j]:
+                first = j
+                j = previous_line[j]
+        last = i
+        if info["blanks_after"]:
+            j = next_line[last]
+            while j < count and is_blank[j]:
+                last = j
+                j = next_line[j]
+
+        if lines[last] == "":
+            barrier = first - 1
+        else:
+            barrier = first
+
+        # Lines first..last become ONE empty line (kept at "first")
+        lines[first] = ""
+        is_blank[first] = True
+        after = next_line[last]
+        next_line[first] = after
+        if after < count:
+            previous_line[after] = first
+
+    kept = []
+    j = 0
+    while j < count:
+        kept.append(lines[j])
+        j = next_line[j]
+    return "\n".join(kept)
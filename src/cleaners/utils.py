@@ -1,62 +1,63 @@
 import re
-from datetime import datetime
-from email.utils import parsedate_to_datetime
+import date_utils  # src/date_utils.py (src is on sys.path for all entry points)
+import keyword_matcher  # src/keyword_matcher.py
+from . import toolkit
+
+# remove_inline_noise: lines that are only an image or a link ("* [Home](...)")
+NOISE_LINE_RULES = toolkit.compile_line_rules([
+    ("image", [r'!\[.*\]\(.*']),
+    ("link_list", [r'[\*\-\+]? ?\[.*?\]\(.*?\)\s*']),
+])
+
+# remove_inline_noise: lines containing one of these are dropped (any case)
+NOISE_KEYWORDS = keyword_matcher.compile_keywords([
+    "read comments", "share on", "whatsapp", "facebook", "twitter",
+    "subscribe", "iniciar sesión", "log in", "sign up", 
+    "reportar un error", "publicidad", "advertisement", "sponsor",
+    "all rights reserved", "copyright", 
+    "privacidade", "consentimento", "cookies", "aceitar", "concordo",
+    "partilhar", "copiar link", "subscrever", "já é subscritor"
+], ignore_case=True)
+
+# Title noise removed before trim_header_by_title looks for the title
+CDATA_RE = re.compile(r'<!\[CDATA\[|\]\]>')
 
 def get_best_date(doc_json):
     """
     Tries to extract a best-guess publication date from various metadata fields.
+    Uses the indexer's pre-parsed "published_ts" when present, otherwise the
+    shared cached parser in date_utils.py (no exception-driven format guessing).
     Returns YYYY-MM-DD string or 'Unknown Date'.
     """
     meta = doc_json.get("metadata", {}) or {}
     headers = meta.get("headers", {}) or {}
 
-    candidates = [
-        meta.get("published"),
-        meta.get("updated"),
-        headers.get("Date")
-    ]
+    epoch = date_utils.get_meta_epoch(meta, ["published", "updated"])
+    if epoch is None:
+        epoch = date_utils.parse_date_to_epoch(headers.get("Date"))
+    if epoch is not None:
+        return date_utils.epoch_to_iso_date(epoch)
 
-    for raw_date in candidates:
-        if not raw_date:
-            continue
-            
-        raw_date = str(raw_date).strip()
-        
-        # Try various formats
-        fmts = [
-            None, # RFC 2822 (parsedate_to_datetime)
-            "iso", # ISO
-            "%d %b %Y, %H:%M", # TPN format: 15 Jan 2026, 13:59
-            "%Y-%m-%d %H:%M:%S",
-            "%d/%m/%Y, %H:%M",
-            "%a, %d %b %Y %H:%M:%S %z", # Spiegel format: Sat, 29 Nov 2025 ...
-        ]
-        
-        for fmt in fmts:
-            try:
-                if fmt is None:
-                    dt = parsedate_to_datetime(raw_date)
-                elif fmt == "iso":
-                    dt = datetime.fromisoformat(raw_date)
-                else:
-                    dt = datetime.strptime(raw_date, fmt)
-                
-                return dt.strftime("%Y-%m-%d")
-            except Exception:
-                continue
-    
     # Try just the first 10 chars if it looks like YYYY-MM-DD
-    for raw_date in candidates:
+    for raw_date in [meta.get("published"), meta.get("updated"), headers.get("Date")]:
         if raw_date and len(str(raw_date)) >= 10:
-             try:
-                 s = str(raw_date)[:10]
-                 datetime.strptime(s, "%Y-%m-%d")
-                 return s
-             except:
-                 pass
+            s = str(raw_date)[:10]
+            if date_utils.parse_date_to_epoch(s) is not None:
+                return s
 
     return "Unknown Date"
 
+def is_older_than(meta, max_age_days):
+    """
+    Freshness check used by cleaners: True if the article's publication time
+    is known and older than max_age_days. An integer comparison on the
+    pre-parsed epoch; unknown dates count as fresh.
+    """
+    epoch = date_utils.get_meta_epoch(meta, ["date", "published", "updated"])
+    if epoch is None:
+        return False
+    return epoch < date_utils.days_ago_epoch(max_age_days)
+
 def get_tags(doc_json):
     """
     Extracts tags as a comma-separated string.
@@ -96,7 +97,7 @@ def trim_header_by_title(text, title):
         return text
     
     # 1. Clean Title for matching
-    clean_title = re.sub(r'<!\[CDATA\[|\]\]>', '', title).strip()
+    clean_title = CDATA_RE.sub('', title).strip()
     
     if len(clean_title) < 10:
         return text
@@ -117,28 +118,18 @@ def remove_inline_noise(text):
     """
     lines = text.split('\n')
     cleaned_lines = []
-    
-    # Common triggers
-    noise_keywords = [
-        "read comments", "share on", "whatsapp", "facebook", "twitter",
-        "subscribe", "iniciar sesión", "log in", "sign up", 
-        "reportar un error", "publicidad", "advertisement", "sponsor",
-        "all rights reserved", "copyright", 
-        "privacidade", "consentimento", "cookies", "aceitar", "concordo",
-        "partilhar", "copiar link", "subscrever", "já é subscritor"
-    ]
+    is_noise_line = NOISE_LINE_RULES["regex"].fullmatch
+    # Only the keywords that occur somewhere in this text (usually none)
+    noise_keywords = keyword_matcher.keywords_in_text(NOISE_KEYWORDS, text)
 
     for line in lines:
         stripped = line.strip()
         if not stripped:
             continue
 
-        # A. Remove Markdown Images: ![...](...)
-        if stripped.startswith("![") and "](" in stripped:
-            continue
-            
-        # B. Remove "Functional" Link Lists e.g. "* [Home](...)"
-        if re.match(r'^[\*\-\+]? ?\[.*?\]\(.*?\)\s*$', stripped):
+        # A. + B. Remove Markdown Images "![...](...)" and "Functional" Link
+        # Lists e.g. "* [Home](...)" (one match, see NOISE_LINE_RULES)
+        if is_noise_line(stripped):
             continue
 
         # C. Remove Breadcrumbs e.g. "Home > News > Portugal"
@@ -147,10 +138,24 @@ def remove_inline_noise(text):
                 continue
 
         # D. Keyword Filtering
-        lower_line = stripped.lower()
-        if any(keyword in lower_line for keyword in noise_keywords):
+        if noise_keywords["keywords"] and keyword_matcher.contains_any(noise_keywords, stripped):
             continue
             
         cleaned_lines.append(stripped)
 
     return "\n".join(cleaned_lines)
+
+def get_feed_payload(meta):
+    """
+    Lazily loads the heavy RSS fields (authors, media, content, full summary)
+    that the indexer keeps out of lean link records.
+    Returns {} when the record has no side payload.
+    """
+    if not meta.get("has_payload"):
+        return {}
+
+    try:
+        import link_store  # src/link_store.py (src is on sys.path for all entry points)
+        return link_store.load_payload(meta.get("source"), meta.get("link"))
+    except Exception:
+        return {}
@@ -0,0 +1,168 @@
+"""
+date_utils.py - One shared, fast date parser for the whole pipeline
+====================================================================
+
+RSS feeds and scraped pages give us dates in many shapes:
+
+    "Sat, 07 Feb 2026 08:01:17 +0100"   (RSS / RFC 2822)
+    "2026-02-07T08:01:17Z"              (ISO 8601)
+    "15 Jan 2026, 13:59"                (The Portugal News)
+    "07/02/2026, 08:01"
+
+Before this module, the indexer, the cleaners, the embedder and the report
+generator each tried up to six formats one after the other, and every
+failed format raised (and caught) an exception.
+
+Here we:
+1. Look at the SHAPE of the string first and only try the matching format
+2. Remember every string we already parsed (a simple dictionary cache),
+   because the same RSS date is parsed again in every pipeline step
+3. Return a plain integer: seconds since 1970 in UTC ("epoch")
+
+The indexer stores that integer as "published_ts" (plus "published_date",
+YYYY-MM-DD) in every link record, and it is carried through the scraper,
+cleaner and embedder metadata. Time-window checks then become a simple
+integer comparison:  if published_ts >= cutoff_ts: ...
+"""
+
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_tz, mktime_tz
+
+# Cache: raw date string -> epoch (or None if we could not parse it)
+# We cap its size so a long-running process cannot grow it forever.
+_EPOCH_CACHE = {}
+EPOCH_CACHE_MAX = 100000
+
+# Shapes we recognise (checked with cheap regexes, no exceptions)
+ISO_SHAPE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+TPN_SHAPE = re.compile(r"^\d{1,2} [A-Za-z]{3} \d{4}, \d{1,2}:\d{2}$")
+SLASH_SHAPE = re.compile(r"^\d{1,2}/\d{1,2}/\d{4}, \d{1,2}:\d{2}$")
+
+# Metadata fields we look at, in priority order
+DATE_FIELDS = ["published", "updated", "date", "pubDate"]
+
+
+def parse_date_to_epoch(raw_date):
+    """
+    Parse a date string into seconds since 1970 (UTC).
+
+    Dates without a timezone are treated as UTC.
+
+    PARAMETERS:
+    - raw_date: A date string (or an int/float epoch, returned as-is)
+
+    RETURNS:
+    - An integer epoch, or None if the string is not a date we understand
+    """
+    if raw_date is None or raw_date == "":
+        return None
+    if isinstance(raw_date, bool):
+        return None
+    if isinstance(raw_date, (int, float)):
+        return int(raw_date)
+
+    raw_date = str(raw_date).strip()
+
+    # Step 1: Already parsed this exact string?
+    if raw_date in _EPOCH_CACHE:
+        return _EPOCH_CACHE[raw_date]
+
+    # Step 2: Parse it based on its shape
+    epoch = _parse_by_shape(raw_date)
+
+    # Step 3: Remember the answer (also remember failures, they are frequent)
+    if len(_EPOCH_CACHE) >= EPOCH_CACHE_MAX:
+        _EPOCH_CACHE.clear()
+    _EPOCH_CACHE[raw_date] = epoch
+
+    return epoch
+
+
+def _parse_by_shape(raw_date):
+    """
+    Try ONLY the format that matches the shape of the string.
+
+    Everything that is not ISO, TPN or slash shaped goes to the RFC 2822
+    parser, which is lenient on purpose: two-digit years, full day and
+    month names ("Saturday, 07 February 26 08:01:17 +0100") all occur
+    in our feeds.
+    """
+    dt = None
+
+    try:
+        if ISO_SHAPE.match(raw_date):
+            # "2026-02-07", "2026-02-07T08:01:17Z", "2026-02-07 08:01:17"
+            dt = datetime.fromisoformat(raw_date.replace("Z", "+00:00"))
+        elif TPN_SHAPE.match(raw_date):
+            dt = datetime.strptime(raw_date, "%d %b %Y, %H:%M")
+        elif SLASH_SHAPE.match(raw_date):
+            dt = datetime.strptime(raw_date, "%d/%m/%Y, %H:%M")
+        else:
+            # parsedate_tz returns None instead of raising on bad input
+            parts = parsedate_tz(raw_date)
+            if parts:
+                if parts[9] is None:
+                    # No timezone in the string: treat as UTC
+                    parts = parts[:9] + (0,)
+                return int(mktime_tz(parts))
+    except (ValueError, OverflowError):
+        return None
+
+    if dt is None:
+        return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return int(dt.timestamp())
+
+
+def epoch_to_iso_date(epoch):
+    """
+    Turn an epoch into a "YYYY-MM-DD" string (UTC), or "" if epoch is None.
+    """
+    if epoch is None:
+        return ""
+    return time.strftime("%Y-%m-%d", time.gmtime(epoch))
+
+
+def get_meta_epoch(meta, fields=None):
+    """
+    Get the best publication time of an article as an epoch.
+
+    ORDER:
+    1. "published_ts" - already resolved by the indexer (no parsing at all)
+    2. The date strings in "fields" (default: published, updated, date, pubDate)
+
+    PARAMETERS:
+    - meta: Article metadata dictionary
+    - fields: Optional list of field names to try instead of DATE_FIELDS
+
+    RETURNS:
+    - An integer epoch, or None
+    """
+    if not meta:
+        return None
+
+    published_ts = meta.get("published_ts")
+    if isinstance(published_ts, (int, float)) and not isinstance(published_ts, bool):
+        return int(published_ts)
+
+    if fields is None:
+        fields = DATE_FIELDS
+
+    for field in fields:
+        epoch = parse_date_to_epoch(meta.get(field))
+        if epoch is not None:
+            return epoch
+
+    return None
+
+
+def days_ago_epoch(days):
+    """
+    The epoch of "now minus N days" (handy for cutoffs).
+    """
+    return int(time.time()) - int(days * 24 * 60 * 60)
@@ -0,0 +1,323 @@
+"""
+feed_stats.py - Per-feed health and throughput log for the indexer
+===================================================================
+
+Every time 01__indexer.py polls a feed it appends ONE line to a JSONL run log:
+
+    data/state/indexer_runs.jsonl
+
+    {"run_id": "20260101_152600", "feed": "PUBLICO", "status": "new",
+     "http_status": 200, "dns_seconds": 0.004, "headers_seconds": 0.31,
+     "download_seconds": 0.12, "parse_seconds": 0.05, "total_seconds": 0.52,
+     "bytes": 84213, "entries_seen": 50, "entries_new": 3, "entries_stale": 0,
+     "error_class": null, ...}
+
+TIMINGS:
+- dns_seconds:      looking up the website's IP address
+- headers_seconds:  connecting (TCP + TLS) and waiting for the server's answer
+                    (the requests library does not report the connect time
+                    on its own, so it is included here)
+- download_seconds: reading the XML body
+- parse_seconds:    feedparser + building the article dictionaries
+- total_seconds:    everything for this feed, including saving
+
+ERROR CLASSES:
+    dns, timeout, connection, http_4xx, http_5xx, parse, other
+
+HOW TO SEE THE SUMMARY:
+    python src/feed_stats.py              # rank feeds by seconds per new article
+    python src/feed_stats.py --runs 10    # only look at the last 10 runs
+    python src/feed_stats.py --top 20     # show 20 feeds per table
+
+The summary answers two questions:
+1. Which feeds cost the most indexing time for what they give us?
+2. Which feeds are broken (e.g. the SIC/TSF 404s) and since when?
+"""
+
+import argparse
+import json
+import os
+import socket
+
+# Where the run log lives
+RUN_LOG_FILE = "data/state/indexer_runs.jsonl"
+
+# How many feeds to show per table in the summary
+REPORT_TOP = 15
+
+
+# =============================================================================
+# BUILDING RECORDS (used by 01__indexer.py)
+# =============================================================================
+
+def new_feed_stats(feed, run_id, mode):
+    """
+    Create an empty stats record for one poll of one feed.
+
+    PARAMETERS:
+    - feed: Dictionary with "name" and "url"
+    - run_id: Identifier of this indexer run (e.g. "20260101_152600")
+    - mode: "sequential", "async" or "daemon"
+
+    RETURNS:
+    - A dictionary that the indexer fills in while it works
+    """
+    return {
+        "run_id": run_id,
+        "mode": mode,
+        "feed": feed["name"],
+        "url": feed["url"],
+        "status": None,
+        "http_status": None,
+        "dns_seconds": None,
+        "headers_seconds": None,
+        "download_seconds": None,
+        "parse_seconds": None,
+        "total_seconds": 0.0,
+        "bytes": 0,
+        "entries_seen": 0,
+        "entries_new": 0,
+        "entries_updated": 0,
+        "entries_stale": 0,
+        "error_class": None,
+        "error": None,
+    }
+
+
+def classify_error(error, http_status=None):
+    """
+    Put an error into a small number of classes, so we can count them.
+
+    PARAMETERS:
+    - error: The exception (or an error message string)
+    - http_status: The HTTP status code, if the server answered
+
+    RETURNS:
+    - One of: dns, timeout, connection, http_4xx, http_5xx, parse, other
+    """
+    if http_status is not None and http_status >= 500:
+        return "http_5xx"
+    if http_status is not None and http_status >= 400:
+        return "http_4xx"
+
+    if isinstance(error, socket.gaierror):
+        return "dns"
+
+    # Check the class name so we don't need to import requests/asyncio here
+    error_type = type(error).__name__
+    message = str(error)
+
+    if "Timeout" in error_type or "timed out" in message.lower():
+        return "timeout"
+    if "NameResolution" in message or "Name or service not known" in message or "getaddrinfo" in message:
+        return "dns"
+    if "Connection" in error_type or "SSL" in error_type:
+        return "connection"
+    if "Parse" in error_type or "XML" in error_type or "SAX" in error_type:
+        return "parse"
+    return "other"
+
+
+def append_run_log(records, log_file=RUN_LOG_FILE):
+    """
+    Append stats records to the run log (one JSON object per line).
+    """
+    if not records:
+        return
+
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    with open(log_file, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+# =============================================================================
+# READING AND SUMMARIZING
+# =============================================================================
+
+def load_run_log(log_file=RUN_LOG_FILE, last_runs=None):
+    """
+    Read the run log.
+
+    PARAMETERS:
+    - log_file: Path to the JSONL run log
+    - last_runs: Only keep records from the N most recent runs (None = all)
+
+    RETURNS:
+    - A list of stats records (oldest first)
+    """
+    if not os.path.exists(log_file):
+        return []
+
+    records = []
+    with open(log_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A crash while appending can leave half a line at the end
+                continue
+
+    if last_runs:
+        run_ids = sorted(set(record.get("run_id") for record in records))
+        keep = set(run_ids[-last_runs:])
+        records = [record for record in records if record.get("run_id") in keep]
+
+    return records
+
+
+def summarize_feeds(records):
+    """
+    Add up the records of each feed.
+
+    RETURNS:
+    - A dictionary { feed_name: summary_dict }
+    """
+    summary = {}
+
+    for record in records:
+        name = record.get("feed")
+        if name not in summary:
+            summary[name] = {
+                "feed": name,
+                "polls": 0,
+                "errors": 0,
+                "unchanged": 0,
+                "total_seconds": 0.0,
+                "bytes": 0,
+                "entries_seen": 0,
+                "entries_new": 0,
+                "entries_stale": 0,
+                "error_classes": {},
+                "last_status": None,
+                "last_error": None,
+                "failing_since": None,
+            }
+        feed = summary[name]
+
+        feed["polls"] += 1
+        feed["total_seconds"] += record.get("total_seconds") or 0.0
+        feed["bytes"] += record.get("bytes") or 0
+        feed["entries_seen"] += record.get("entries_seen") or 0
+        feed["entries_new"] += record.get("entries_new") or 0
+        feed["entries_stale"] += record.get("entries_stale") or 0
+
+        if record.get("status") == "unchanged":
+            feed["unchanged"] += 1
+
+        if record.get("status") == "error":
+            feed["errors"] += 1
+            error_class = record.get("error_class") or "other"
+            feed["error_classes"][error_class] = feed["error_classes"].get(error_class, 0) + 1
+            feed["last_error"] = record.get("error")
+            # Remember when the current streak of failures started
+            if feed["last_status"] != "error":
+                feed["failing_since"] = record.get("run_id")
+        else:
+            feed["failing_since"] = None
+
+        feed["last_status"] = record.get("status")
+
+    # Cost per new article (None when the feed gave us nothing new)
+    for feed in summary.values():
+        if feed["entries_new"] > 0:
+            feed["seconds_per_new"] = feed["total_seconds"] / feed["entries_new"]
+        else:
+            feed["seconds_per_new"] = None
+
+    return summary
+
+
+def rank_by_cost(summary):
+    """
+    Sort feeds from most to least expensive per new article.
+
+    Feeds that cost time but gave us NOTHING new come first (infinitely
+    expensive), ordered by the time they cost.
+    """
+    def sort_key(feed):
+        if feed["seconds_per_new"] is None:
+            return (0, -feed["total_seconds"])
+        return (1, -feed["seconds_per_new"])
+
+    return sorted(summary.values(), key=sort_key)
+
+
+def print_report(records, top=REPORT_TOP):
+    """
+    Print the feed health and throughput summary.
+    """
+    summary = summarize_feeds(records)
+    run_ids = sorted(set(record.get("run_id") for record in records))
+
+    print("=" * 78)
+    print("INDEXER FEED REPORT")
+    print("=" * 78)
+    print(f"Runs: {len(run_ids)} ({run_ids[0]} -> {run_ids[-1]})")
+    print(f"Feeds: {len(summary)}")
+
+    total_seconds = sum(feed["total_seconds"] for feed in summary.values())
+    total_new = sum(feed["entries_new"] for feed in summary.values())
+    total_bytes = sum(feed["bytes"] for feed in summary.values())
+    print(f"Feed time: {total_seconds:.1f}s, downloaded: {total_bytes / 1024 / 1024:.1f} MB, new articles: {total_new}")
+    print()
+
+    # Table 1: cost per new article
+    print(f"{'FEED':<28} {'POLLS':>5} {'TIME(s)':>8} {'MB':>6} {'NEW':>5} {'STALE':>6} {'S/NEW':>7}")
+    print("-" * 78)
+    for feed in rank_by_cost(summary)[:top]:
+        if feed["seconds_per_new"] is None:
+            cost = "-"
+        else:
+            cost = f"{feed['seconds_per_new']:.2f}"
+        print(f"{feed['feed'][:28]:<28} {feed['polls']:>5} {feed['total_seconds']:>8.1f} "
+              f"{feed['bytes'] / 1024 / 1024:>6.2f} {feed['entries_new']:>5} "
+              f"{feed['entries_stale']:>6} {cost:>7}")
+    print()
+
+    # Table 2: broken feeds (last poll failed)
+    def failing_since(feed):
+        return feed["failing_since"] or ""
+
+    broken = []
+    for feed in summary.values():
+        if feed["last_status"] == "error":
+            broken.append(feed)
+    broken.sort(key=failing_since)
+
+    print(f"Broken feeds (last poll failed): {len(broken)}")
+    print("-" * 78)
+    for feed in broken[:top]:
+        classes = ", ".join(f"{name}={count}" for name, count in sorted(feed["error_classes"].items()))
+        print(f"{feed['feed'][:28]:<28} failing since {feed['failing_since']}  [{classes}]")
+        print(f"{'':<28} {str(feed['last_error'])[:48]}")
+    print()
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def main():
+    """
+    Print the summary of data/state/indexer_runs.jsonl
+    """
+    parser = argparse.ArgumentParser(description="Summarize the indexer run log")
+    parser.add_argument("--log-file", type=str, default=RUN_LOG_FILE, help=f"Run log to read (default: {RUN_LOG_FILE})")
+    parser.add_argument("--runs", type=int, default=None, help="Only look at the last N runs (default: all)")
+    parser.add_argument("--top", type=int, default=REPORT_TOP, help=f"Feeds per table (default: {REPORT_TOP})")
+    args = parser.parse_args()
+
+    records = load_run_log(args.log_file, args.runs)
+    if not records:
+        print(f"[WARNING] No records in {args.log_file} - run 01__indexer.py first")
+        return
+
+    print_report(records, args.top)
+
+
+if __name__ == "__main__":
+    main()
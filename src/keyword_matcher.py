@@ -0,0 +1,78 @@
+"""
+keyword_matcher.py - Find any of a list of keywords, fast
+=========================================================
+
+Several steps ask "does this text contain ANY of these keywords?":
+- the cleaner: consent-wall phrases in the whole page (source_rules.py),
+  noise keywords in every line (cleaners/utils.py remove_inline_noise)
+- the scraper: tag/link keywords in should_scrape (source_rules.py) and
+  the travel-section names in get_source_weight (02__scraper.py)
+
+Build a matcher ONCE per keyword list (at import) and use it everywhere:
+
+    CONSENT = keyword_matcher.compile_keywords(["CookieConsent", "Consent Selection"])
+    keyword_matcher.contains_any(CONSENT, page)
+
+WHY NOT ONE REGEX OR AN AHO-CORASICK AUTOMATON:
+We measured both against plain "keyword in text" (scripts/benchmark_keywords.py).
+Python's re module tries every alternative of "a|b|c" at every position,
+and an automaton written in Python walks the text one character at a time
+in the interpreter. "keyword in text" runs in C (a fast substring search),
+so one C search per keyword wins by far for our lists of 5 to 25 keywords.
+What costs time is the Python work AROUND those searches, so a matcher:
+- keeps only the keywords that can matter: duplicates and keywords that
+  contain a shorter keyword of the list are dropped ("videos" is already
+  found by "video")
+- lower-cases the keywords once (ignore_case=True), and the text once per call
+- for line-by-line checks, keywords_in_text() first keeps the few keywords
+  that occur ANYWHERE in the text (one C search each), so most lines are
+  checked against no keyword at all
+"""
+
+
+def compile_keywords(keywords, ignore_case=False):
+    """
+    Build a matcher for a list of keywords.
+
+    PARAMETERS:
+    - keywords: List of strings
+    - ignore_case: Lower-case the keywords, and the text when matching
+
+    RETURNS:
+    - A matcher dictionary {"keywords": tuple, "ignore_case": bool}
+    """
+    if ignore_case:
+        keywords = [keyword.lower() for keyword in keywords]
+
+    # Shortest first: a keyword that contains a shorter one is never needed
+    needed = []
+    for keyword in sorted(set(keywords), key=len):
+        if not any(shorter in keyword for shorter in needed):
+            needed.append(keyword)
+
+    return {"keywords": tuple(needed), "ignore_case": ignore_case}
+
+
+def contains_any(matcher, text):
+    """
+    Does the text contain at least one of the keywords?
+    """
+    if matcher["ignore_case"]:
+        text = text.lower()
+    for keyword in matcher["keywords"]:
+        if keyword in text:
+            return True
+    return False
+
+
+def keywords_in_text(matcher, text):
+    """
+    A smaller matcher with only the keywords that occur somewhere in the text.
+
+    Use it before checking the lines of a text one by one: usually no
+    keyword (or one or two) is left, so each line costs (almost) nothing.
+    """
+    if matcher["ignore_case"]:
+        text = text.lower()
+    found = tuple(keyword for keyword in matcher["keywords"] if keyword in text)
+    return {"keywords": found, "ignore_case": matcher["ignore_case"]}
@@ -0,0 +1,261 @@
+"""
+link_index.py - Cross-run index of every RSS entry we have already saved
+=========================================================================
+
+The indexer (01__indexer.py) sees the same 50-100 entries per feed on every
+run. Without this index each run would write all of them again into a new
+JSONL file, and the scraper would have to read them all again.
+
+This module keeps a small SQLite table with one row per (source, link):
+
+    source | link | fingerprint | updated | first_seen | last_seen
+
+The key includes the source ON PURPOSE. Several feeds overlap (GUARDIAN_GENERAL
+and GUARDIAN_TRAVEL, CNBC and CNBC_TRAVEL, ...), and each feed must still
+write its own record: the per-source rules (source_rules.py, SOURCE_WEIGHTS,
+the cleaner routing) depend on it. An article found by two feeds is scraped
+only once anyway, by the scraper's article-ID check.
+
+Before saving, the indexer asks the index which entries are:
+- NEW:     never seen before              -> saved
+- UPDATED: seen, but the "updated" field  -> saved again, marked "is_update"
+           from the feed has changed
+- SEEN:    nothing changed                -> skipped
+
+WHY SQLITE?
+- It is built into Python (no extra install)
+- Looking up a link is instant, even with hundreds of thousands of rows
+- Writes are transactional, so a crash never leaves a half-written index
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+import link_store  # Compacted per-source link store (link_store.py)
+
+# Where the index lives
+LINK_INDEX_FILE = "data/state/link_index.sqlite"
+
+# One row per (source, link): overlapping feeds each keep their own record
+SEEN_LINKS_COLUMNS = (
+    "source TEXT NOT NULL, link TEXT NOT NULL, fingerprint TEXT, updated TEXT,"
+    " first_seen TEXT, last_seen TEXT, PRIMARY KEY (source, link)"
+)
+
+# SQLite can only take a limited number of "?" placeholders per query
+LOOKUP_BATCH_SIZE = 500
+
+
+def open_link_index(index_file=LINK_INDEX_FILE, seed_dir=None):
+    """
+    Open (or create) the link index.
+
+    PARAMETERS:
+    - index_file: Path to the SQLite file
+    - seed_dir: Optional data/links folder. If the index is brand new, we fill
+      it from the JSONL files already on disk so the first run does not
+      re-emit every entry we saved before the index existed.
+
+    RETURNS:
+    - An open sqlite3 connection
+    """
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+
+    conn = sqlite3.connect(index_file)
+    migrate_link_only_index(conn)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS seen_links ({SEEN_LINKS_COLUMNS})")
+    conn.commit()
+
+    count = conn.execute("SELECT COUNT(*) FROM seen_links").fetchone()[0]
+    print(f"[INFO] Link index: {count} known links ({index_file})")
+
+    if count == 0 and seed_dir and os.path.exists(seed_dir):
+        seed_from_jsonl(conn, seed_dir)
+
+    return conn
+
+
+def migrate_link_only_index(conn):
+    """
+    Convert an index keyed by link alone (older versions) to (source, link).
+
+    The old rows are kept under the source that saved them. Overlapping
+    feeds that lost the race for a link simply see it as new once and
+    write their own record.
+    """
+    columns = conn.execute("PRAGMA table_info(seen_links)").fetchall()
+    key_columns = [column[1] for column in columns if column[5] > 0]
+    if key_columns != ["link"]:
+        return
+
+    print("[INFO] Link index: migrating to one row per (source, link)")
+    conn.execute("ALTER TABLE seen_links RENAME TO seen_links_old")
+    conn.execute(f"CREATE TABLE seen_links ({SEEN_LINKS_COLUMNS})")
+    conn.execute(
+        "INSERT INTO seen_links (source, link, fingerprint, updated, first_seen, last_seen)"
+        " SELECT COALESCE(source, ''), link, fingerprint, updated, first_seen, last_seen"
+        " FROM seen_links_old"
+    )
+    conn.execute("DROP TABLE seen_links_old")
+    conn.commit()
+
+
+def seed_from_jsonl(conn, links_dir):
+    """
+    Fill an empty index from the links we already have on disk.
+
+    We read through link_store.py, so both the compacted stores
+    (data/link_store/) and the per-run JSONL files are included.
+
+    PARAMETERS:
+    - conn: Open link index
+    - links_dir: Base folder with data/links/<SOURCE>/<timestamp>.jsonl files
+    """
+    sources = link_store.list_sources(links_dir)
+    print(f"[INFO] Seeding link index from {len(sources)} sources already on disk...")
+
+    for source in sources:
+        articles = []
+        for article in link_store.iter_source_articles(source, links_dir):
+            # Old records may not carry their source: it is the folder name
+            if not article.get("source"):
+                article["source"] = source
+            articles.append(article)
+
+            # Write in batches so we never hold the whole history in memory
+            if len(articles) >= 10000:
+                remember_articles(conn, articles)
+                articles = []
+
+        remember_articles(conn, articles)
+
+    count = conn.execute("SELECT COUNT(*) FROM seen_links").fetchone()[0]
+    print(f"[INFO] Link index seeded with {count} links")
+
+
+def get_index_key(article):
+    """
+    The key we use for an article: its link, or the fingerprint if there is no link.
+    """
+    return article.get("link") or article.get("fingerprint") or ""
+
+
+def get_source(article):
+    """
+    The feed an article came from ("" if unknown).
+    """
+    return article.get("source") or ""
+
+
+def split_new_articles(conn, articles):
+    """
+    Split freshly parsed articles into new / updated / already seen.
+
+    PARAMETERS:
+    - conn: Open link index
+    - articles: List of article dictionaries from the indexer
+
+    RETURNS:
+    - A tuple (new_articles, updated_articles, seen_articles)
+      Updated articles get "is_update": True so downstream steps can tell.
+      An entry that appears twice in the same batch is only saved once
+      (the second copy counts as seen).
+    """
+    # Step 1: Look up all keys in a few big queries (not one per article),
+    # grouped by source because the index is keyed by (source, link)
+    keys_by_source = {}
+    for article in articles:
+        keys_by_source.setdefault(get_source(article), set()).add(get_index_key(article))
+
+    known = {}
+    for source, source_keys in keys_by_source.items():
+        source_keys = list(source_keys)
+        for start in range(0, len(source_keys), LOOKUP_BATCH_SIZE):
+            batch = source_keys[start:start + LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT link, updated FROM seen_links WHERE source = ? AND link IN ({placeholders})",
+                [source] + batch,
+            ).fetchall()
+            for link, updated in rows:
+                known[(source, link)] = updated
+
+    # Step 2: Classify each article
+    new_articles = []
+    updated_articles = []
+    seen_articles = []
+    in_batch = set()
+
+    for article in articles:
+        key = (get_source(article), get_index_key(article))
+
+        if key in in_batch:
+            seen_articles.append(article)
+            continue
+        in_batch.add(key)
+
+        if key not in known:
+            new_articles.append(article)
+        elif article.get("updated") and article.get("updated") != known[key]:
+            article["is_update"] = True
+            updated_articles.append(article)
+        else:
+            seen_articles.append(article)
+
+    return new_articles, updated_articles, seen_articles
+
+
+def remember_articles(conn, articles):
+    """
+    Record articles in the index (insert new links, refresh known ones).
+
+    Call this AFTER the JSONL file was written, so a crash in between
+    simply means the entries are emitted again next run (never lost).
+
+    PARAMETERS:
+    - conn: Open link index
+    - articles: List of article dictionaries
+    """
+    if not articles:
+        return
+
+    now = datetime.now().isoformat()
+    rows = []
+    for article in articles:
+        rows.append((
+            get_source(article),
+            get_index_key(article),
+            article.get("fingerprint"),
+            article.get("updated"),
+            now,
+            now,
+        ))
+
+    # "Upsert": insert new links, or refresh fingerprint/updated/last_seen
+    conn.executemany(
+        "INSERT INTO seen_links (source, link, fingerprint, updated, first_seen, last_seen)"
+        " VALUES (?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT(source, link) DO UPDATE SET"
+        " fingerprint = excluded.fingerprint,"
+        " updated = excluded.updated,"
+        " last_seen = excluded.last_seen",
+        rows,
+    )
+    conn.commit()
+
+
+def touch_articles(conn, articles):
+    """
+    Update "last_seen" for entries that are still in the feed but unchanged.
+    """
+    if not articles:
+        return
+
+    now = datetime.now().isoformat()
+    rows = []
+    for article in articles:
+        rows.append((now, get_source(article), get_index_key(article)))
+
+    conn.executemany("UPDATE seen_links SET last_seen = ? WHERE source = ? AND link = ?", rows)
+    conn.commit()
@@ -0,0 +1,396 @@
+"""
+link_store.py - Compacted, deduplicated store of indexed links
+===============================================================
+
+The indexer (01__indexer.py) writes one small JSONL file per feed per run:
+
+    data/links/PUBLICO/20260101_152601.jsonl
+    data/links/PUBLICO/20260101_162603.jsonl
+    ...
+
+After a few weeks that is thousands of files, and the scraper used to read
+every line of every file into memory on startup.
+
+This module merges ("compacts") those files into ONE SQLite file per source:
+
+    data/link_store/PUBLICO.sqlite   (one row per link, latest record wins)
+
+and gives the scraper a streaming reader, so it walks the candidates one
+by one instead of holding the whole link history in RAM.
+
+The same file also has a "payloads" side table: in lean mode the indexer
+keeps the bulky feed fields (media, content, authors, full summary HTML)
+there instead of in the JSONL records. Read them with load_payload().
+
+HOW TO RUN THE COMPACTION:
+    python src/link_store.py                    # compact every source
+    python src/link_store.py --source PUBLICO   # compact one source
+    python src/link_store.py --keep-files       # merge but keep the JSONL files
+
+JSONL files that were not compacted yet are still read by the streaming
+reader, so the scraper never misses links written since the last compaction.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+# Where the indexer writes its per-run JSONL files
+LINKS_DIR = "data/links"
+
+# Where the compacted per-source stores live
+STORE_DIR = "data/link_store"
+
+
+# =============================================================================
+# OPENING A STORE
+# =============================================================================
+
+def get_store_path(source, store_dir=STORE_DIR):
+    """
+    Path of the SQLite store for one source (e.g. data/link_store/PUBLICO.sqlite).
+    """
+    return os.path.join(store_dir, f"{source}.sqlite")
+
+
+def open_store(source, store_dir=STORE_DIR):
+    """
+    Open (or create) the store for one source.
+
+    TABLES:
+    - links: one row per link with the latest JSON record
+    - compacted_files: JSONL files already merged (so --keep-files never merges twice)
+    - payloads: heavy feed fields per link (written by the indexer in lean mode)
+
+    RETURNS:
+    - An open sqlite3 connection
+    """
+    os.makedirs(store_dir, exist_ok=True)
+
+    conn = sqlite3.connect(get_store_path(source, store_dir))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS links ("
+        " link TEXT PRIMARY KEY,"
+        " record TEXT,"
+        " first_seen TEXT,"
+        " last_seen TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS compacted_files ("
+        " name TEXT PRIMARY KEY,"
+        " compacted_at TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS payloads ("
+        " link TEXT PRIMARY KEY,"
+        " payload TEXT)"
+    )
+    conn.commit()
+    return conn
+
+
+# =============================================================================
+# HEAVY PAYLOAD SIDE TABLE
+# =============================================================================
+
+def save_payloads(source, payloads, store_dir=STORE_DIR):
+    """
+    Store the heavy feed fields of some entries.
+
+    PARAMETERS:
+    - source: Source name (e.g. "PUBLICO")
+    - payloads: List of (link, payload_dict) tuples
+    """
+    rows = []
+    for link, payload in payloads:
+        rows.append((link, json.dumps(payload, ensure_ascii=False)))
+
+    conn = open_store(source, store_dir)
+    conn.executemany("INSERT OR REPLACE INTO payloads (link, payload) VALUES (?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def load_payload(source, link, store_dir=STORE_DIR):
+    """
+    Read the heavy feed fields of one entry (only call this when you need them).
+
+    RETURNS:
+    - A dictionary (e.g. {"authors": [...], "summary": "<p>..."}), or {} if none
+    """
+    if not source or not link:
+        return {}
+    if not os.path.exists(get_store_path(source, store_dir)):
+        return {}
+
+    conn = open_store(source, store_dir)
+    row = conn.execute("SELECT payload FROM payloads WHERE link = ?", (link,)).fetchone()
+    conn.close()
+
+    if not row:
+        return {}
+    return json.loads(row[0])
+
+
+# =============================================================================
+# COMPACTION
+# =============================================================================
+
+def compact_source(source, links_dir=LINKS_DIR, store_dir=STORE_DIR, keep_files=False):
+    """
+    Merge all JSONL files of one source into its store.
+
+    Files are merged oldest first, so when a link appears in several runs the
+    NEWEST record wins (it has the freshest title/tags/updated fields).
+    Each file is merged in its own transaction and deleted only AFTER the
+    transaction is committed, so a crash never loses links.
+
+    PARAMETERS:
+    - source: Source name (the subfolder name in data/links)
+    - links_dir: Base folder of the JSONL files
+    - store_dir: Folder of the compacted stores
+    - keep_files: If True, do not delete the merged JSONL files
+
+    RETURNS:
+    - A tuple (files_merged, lines_read)
+    """
+    source_dir = os.path.join(links_dir, source)
+    jsonl_files = sorted(Path(source_dir).glob("*.jsonl"))
+
+    if not jsonl_files:
+        return 0, 0
+
+    conn = open_store(source, store_dir)
+
+    files_merged = 0
+    lines_read = 0
+
+    for jsonl_path in jsonl_files:
+        # Skip files we merged before (only happens with --keep-files)
+        already = conn.execute(
+            "SELECT 1 FROM compacted_files WHERE name = ?", (jsonl_path.name,)
+        ).fetchone()
+        if already:
+            if not keep_files:
+                os.remove(jsonl_path)
+            continue
+
+        try:
+            rows = []
+            with open(jsonl_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    article = json.loads(line)
+                    link = article.get("link")
+                    if not link:
+                        continue
+                    rows.append((link, line, jsonl_path.stem, jsonl_path.stem))
+
+            # Insert new links, or replace the record of known ones
+            conn.executemany(
+                "INSERT INTO links (link, record, first_seen, last_seen) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(link) DO UPDATE SET"
+                " record = excluded.record,"
+                " last_seen = excluded.last_seen",
+                rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO compacted_files (name, compacted_at) VALUES (?, ?)",
+                (jsonl_path.name, datetime.now().isoformat()),
+            )
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            print(f"[WARNING] Could not compact {jsonl_path}: {e}")
+            continue
+
+        files_merged += 1
+        lines_read += len(rows)
+
+        if not keep_files:
+            os.remove(jsonl_path)
+
+    conn.close()
+    return files_merged, lines_read
+
+
+def compact_all(links_dir=LINKS_DIR, store_dir=STORE_DIR, keep_files=False, only_source=None):
+    """
+    Compact every source folder in data/links.
+
+    RETURNS:
+    - The number of JSONL files merged
+    """
+    if not os.path.exists(links_dir):
+        print(f"[WARNING] Directory does not exist: {links_dir}")
+        return 0
+
+    total_files = 0
+    sources = sorted(os.listdir(links_dir))
+
+    for source in sources:
+        if not os.path.isdir(os.path.join(links_dir, source)):
+            continue
+        if only_source and source.upper() != only_source.upper():
+            continue
+
+        files_merged, lines_read = compact_source(source, links_dir, store_dir, keep_files)
+        if files_merged:
+            print(f"[INFO] {source}: merged {files_merged} files ({lines_read} lines)")
+        total_files += files_merged
+
+    return total_files
+
+
+# =============================================================================
+# STREAMING READER (used by 02__scraper.py)
+# =============================================================================
+
+def list_sources(links_dir=LINKS_DIR, store_dir=STORE_DIR):
+    """
+    List every source that has a compacted store OR uncompacted JSONL files.
+
+    RETURNS:
+    - A sorted list of source names
+    """
+    sources = set()
+
+    if os.path.exists(store_dir):
+        for filename in os.listdir(store_dir):
+            if filename.endswith(".sqlite"):
+                sources.add(filename[:-len(".sqlite")])
+
+    if os.path.exists(links_dir):
+        for name in os.listdir(links_dir):
+            if os.path.isdir(os.path.join(links_dir, name)):
+                sources.add(name)
+
+    return sorted(sources)
+
+
+def read_uncompacted_articles(source, conn, links_dir=LINKS_DIR):
+    """
+    Read the JSONL files of one source that were not compacted yet.
+
+    Files are read oldest first and a later record replaces an earlier one,
+    exactly like compact_source(), so the NEWEST record of each link wins.
+
+    PARAMETERS:
+    - source: Source name (e.g. "PUBLICO")
+    - conn: The open store of the source, or None if it has no store yet
+
+    RETURNS:
+    - A dictionary { link: article } (only links written since the last compaction)
+    """
+    articles = {}
+    source_dir = os.path.join(links_dir, source)
+    if not os.path.isdir(source_dir):
+        return articles
+
+    for jsonl_path in sorted(Path(source_dir).glob("*.jsonl")):
+        if conn is not None:
+            already = conn.execute(
+                "SELECT 1 FROM compacted_files WHERE name = ?", (jsonl_path.name,)
+            ).fetchone()
+            if already:
+                continue
+
+        with open(jsonl_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    article = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                link = article.get("link")
+                if link:
+                    articles[link] = article
+
+    return articles
+
+
+def iter_source_articles(source, links_dir=LINKS_DIR, store_dir=STORE_DIR):
+    """
+    Yield the articles of one source, one at a time, each link only once.
+
+    The newest record of each link wins, whether it was compacted or not
+    (the same rule as compact_source), so "is_update" records and refreshed
+    titles/tags are seen before the next compaction too.
+
+    ORDER:
+    1. Links from JSONL files written since the last compaction
+    2. Links from the compacted store (skipping links a newer JSONL record replaced)
+
+    WHY A GENERATOR?
+    - The caller sees one article at a time. Only the JSONL records written
+      since the last compaction are held in memory, never the whole history.
+
+    PARAMETERS:
+    - source: Source name (e.g. "PUBLICO")
+
+    YIELDS:
+    - Article dictionaries (as written by the indexer)
+    """
+    conn = None
+    store_path = get_store_path(source, store_dir)
+    if os.path.exists(store_path):
+        conn = open_store(source, store_dir)
+
+    # try/finally: the caller may stop early (e.g. --per-source limit),
+    # and we still want the store connection closed
+    try:
+        # Step 1: JSONL files not compacted yet (newer than anything in the store)
+        uncompacted = read_uncompacted_articles(source, conn, links_dir)
+        for article in uncompacted.values():
+            yield article
+
+        # Step 2: The compacted store
+        if conn is not None:
+            for link, record in conn.execute("SELECT link, record FROM links ORDER BY rowid"):
+                if link in uncompacted:
+                    continue
+                yield json.loads(record)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def main():
+    """
+    Compact data/links/<SOURCE>/*.jsonl into data/link_store/<SOURCE>.sqlite
+    """
+    parser = argparse.ArgumentParser(description="Compact indexer JSONL files into per-source stores")
+    parser.add_argument("--source", type=str, default=None, help="Only compact this source (e.g. PUBLICO)")
+    parser.add_argument("--keep-files", action="store_true", help="Keep the JSONL files after merging them")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("LINK STORE COMPACTION - Starting")
+    print("=" * 60)
+    print()
+
+    total_files = compact_all(keep_files=args.keep_files, only_source=args.source)
+
+    print()
+    print("=" * 60)
+    print("LINK STORE COMPACTION - Finished")
+    print("=" * 60)
+    print(f"JSONL files merged: {total_files}")
+    print(f"Store directory: {STORE_DIR}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
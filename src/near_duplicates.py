@@ -0,0 +1,445 @@
+"""
+near_duplicates.py - Group lightly edited copies of the same story (MinHash + LSH)
+===================================================================================
+
+article_manifest.py already marks EXACT duplicates (same page, same text).
+But many outlets republish a wire story with a new headline, one extra
+paragraph or a different closing line. Those copies have different hashes,
+so they are all embedded, and a question about that story fills the
+TOP_K = 10 retrieval slots of 11__web_app.py with the same story five
+times. The report generator pays for every copy in its prompts, too.
+
+Comparing every new article with every old one would get slower with every
+run. Instead, for each cleaned article we:
+
+1. Cut the text into overlapping 5-word pieces ("shingles")
+2. Compute a MinHash signature: NUM_PERMUTATIONS numbers, where two
+   signatures agree in about the same share of positions as the two
+   texts share shingles (their Jaccard similarity). We use "one permutation
+   hashing": every shingle is hashed ONCE, its hash picks one of the
+   NUM_PERMUTATIONS bins and competes for that bin's minimum - one pass
+   over the shingles instead of one pass per position.
+3. Cut the signature into LSH_BANDS bands and look each band up in a table
+   (locality-sensitive hashing): texts that are alike share a band with
+   high probability, different texts almost never do. So only a handful
+   of candidates are compared, however many articles we have.
+4. A candidate whose signature agrees in at least SIMILARITY_THRESHOLD of
+   the positions is a near-duplicate: the new article joins its cluster.
+   Otherwise the article starts its own cluster (cluster ID = its own ID).
+
+WHERE IT IS STORED (in data/state/article_manifest.sqlite):
+- articles.cluster_id   the cluster of every article
+- minhash_signatures    id | signature (NUM_PERMUTATIONS x 64-bit numbers)
+- minhash_bands         band_key | id  (the LSH table)
+
+WHO USES IT:
+- 03__cleaner.py and "02__scraper.py --stream" add every cleaned article
+- 10__embedder.py stores "cluster_id" in the metadata of every chunk
+- 11__web_app.py and 12__report_generator.py keep one article per
+  cluster (collapse_chunks / collapse_articles)
+
+HOW TO RUN:
+    # Show the biggest clusters
+    python src/near_duplicates.py
+
+    # Rebuild the index from all cleaned articles (e.g. after changing the settings)
+    python src/near_duplicates.py --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from array import array
+from pathlib import Path
+
+import article_manifest  # The manifest database we store the index in (article_manifest.py)
+
+# Where the articles are
+ARTICLES_DIR = "data/articles"
+
+# Words per shingle
+SHINGLE_WORDS = 5
+
+# Texts with fewer words are not clustered (too little to compare)
+MIN_WORDS = 50
+
+# MinHash signature length = LSH_BANDS x LSH_ROWS
+# With 16 bands of 8 rows, a text that shares 90% of its shingles with an
+# indexed one is compared with it 99.99% of the time (80%: 95%), a text
+# that shares only 50% just 6% of the time.
+NUM_PERMUTATIONS = 128
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# Share of equal signature positions that makes two articles near-duplicates
+SIMILARITY_THRESHOLD = 0.8
+
+# The low bits of a shingle hash pick its bin, the other bits are its value
+BIN_BITS = NUM_PERMUTATIONS.bit_length() - 1  # NUM_PERMUTATIONS is a power of 2
+BIN_MASK = NUM_PERMUTATIONS - 1
+EMPTY_BIN = 1 << (64 - BIN_BITS)               # Larger than any value
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+# =============================================================================
+# SIGNATURES
+# =============================================================================
+
+def get_shingles(text):
+    """
+    The set of overlapping SHINGLE_WORDS-word pieces of a text, each hashed
+    to a 64-bit number.
+
+    RETURNS:
+    - A set of integers (empty if the text has fewer than MIN_WORDS words)
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return set()
+
+    shingles = set()
+    for i in range(len(words) - SHINGLE_WORDS + 1):
+        piece = " ".join(words[i:i + SHINGLE_WORDS]).encode("utf-8")
+        shingles.add(int.from_bytes(hashlib.blake2b(piece, digest_size=8).digest(), "little"))
+    return shingles
+
+
+def compute_signature(text):
+    """
+    The MinHash signature of a cleaned text.
+
+    RETURNS:
+    - A list of NUM_PERMUTATIONS integers, or None if the text is too short
+    """
+    if not text:
+        return None
+    shingles = get_shingles(text)
+    if not shingles:
+        return None
+
+    signature = [EMPTY_BIN] * NUM_PERMUTATIONS
+    for x in shingles:
+        position = x & BIN_MASK
+        value = x >> BIN_BITS
+        if value < signature[position]:
+            signature[position] = value
+
+    # Short texts leave some bins empty: an empty bin borrows the value of
+    # the next filled bin to its right, plus a step per bin it had to go,
+    # so the bin still agrees between two similar texts ("densification")
+    filled = [value != EMPTY_BIN for value in signature]
+    for position in range(NUM_PERMUTATIONS):
+        if filled[position]:
+            continue
+        distance = 1
+        while not filled[(position + distance) & BIN_MASK]:
+            distance += 1
+        signature[position] = signature[(position + distance) & BIN_MASK] + distance * EMPTY_BIN
+    return signature
+
+
+def estimate_similarity(signature_a, signature_b):
+    """
+    Estimated Jaccard similarity of two texts: the share of equal positions.
+    """
+    equal = 0
+    for x, y in zip(signature_a, signature_b):
+        if x == y:
+            equal += 1
+    return equal / len(signature_a)
+
+
+def get_band_keys(signature):
+    """
+    The LSH table keys of a signature (one per band).
+    """
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = array("Q", signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]).tobytes()
+        keys.append(f"{band}:{hashlib.blake2b(rows, digest_size=8).hexdigest()}")
+    return keys
+
+
+# =============================================================================
+# THE INDEX (tables in the article manifest)
+# =============================================================================
+
+def ensure_index(conn):
+    """
+    Create the index tables in the manifest if they are missing.
+    """
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS minhash_signatures ("
+        " id TEXT PRIMARY KEY,"
+        " signature BLOB)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS minhash_bands ("
+        " band_key TEXT,"
+        " id TEXT)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_minhash_bands_key ON minhash_bands (band_key)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_minhash_bands_id ON minhash_bands (id)")
+    conn.commit()
+
+
+def load_signature(conn, article_id):
+    """
+    The stored signature of an article (or None).
+    """
+    row = conn.execute("SELECT signature FROM minhash_signatures WHERE id = ?", (article_id,)).fetchone()
+    if row is None:
+        return None
+    return array("Q", row[0]).tolist()
+
+
+def remove_article(conn, article_id):
+    """
+    Take an article out of the index (before it is added again, re-cleaned).
+    """
+    conn.execute("DELETE FROM minhash_signatures WHERE id = ?", (article_id,))
+    conn.execute("DELETE FROM minhash_bands WHERE id = ?", (article_id,))
+
+
+def find_near_duplicate(conn, article_id, signature):
+    """
+    The most similar indexed article, if it is similar enough.
+
+    Only the articles that share at least one LSH band are compared.
+
+    RETURNS:
+    - A tuple (article_id, similarity), or (None, 0.0)
+    """
+    band_keys = get_band_keys(signature)
+    placeholders = ",".join("?" * len(band_keys))
+    candidates = conn.execute(
+        f"SELECT DISTINCT id FROM minhash_bands WHERE band_key IN ({placeholders})",
+        band_keys,
+    ).fetchall()
+
+    best_id = None
+    best_similarity = 0.0
+    for (candidate_id,) in candidates:
+        if candidate_id == article_id:
+            continue
+        candidate_signature = load_signature(conn, candidate_id)
+        if candidate_signature is None:
+            continue
+        similarity = estimate_similarity(signature, candidate_signature)
+        if similarity >= SIMILARITY_THRESHOLD and similarity > best_similarity:
+            best_id = candidate_id
+            best_similarity = similarity
+    return best_id, best_similarity
+
+
+def add_article(conn, article_id, signature):
+    """
+    Put an article in the index and give it a cluster.
+
+    The caller commits (so a batch of articles is one transaction).
+
+    PARAMETERS:
+    - conn: Open article manifest (with ensure_index() done)
+    - article_id: The article's ID
+    - signature: From compute_signature() (None = not clustered)
+
+    RETURNS:
+    - The cluster ID (the ID of the first article of the cluster)
+    """
+    remove_article(conn, article_id)
+    if signature is None:
+        conn.execute("UPDATE articles SET cluster_id = ? WHERE id = ?", (article_id, article_id))
+        return article_id
+
+    cluster_id = article_id
+    similar_id, _ = find_near_duplicate(conn, article_id, signature)
+    if similar_id is not None:
+        row = conn.execute("SELECT cluster_id FROM articles WHERE id = ?", (similar_id,)).fetchone()
+        if row and row[0]:
+            cluster_id = row[0]
+        else:
+            cluster_id = similar_id
+
+    conn.execute(
+        "INSERT INTO minhash_signatures (id, signature) VALUES (?, ?)",
+        (article_id, array("Q", signature).tobytes()),
+    )
+    conn.executemany(
+        "INSERT INTO minhash_bands (band_key, id) VALUES (?, ?)",
+        [(band_key, article_id) for band_key in get_band_keys(signature)],
+    )
+    conn.execute("UPDATE articles SET cluster_id = ? WHERE id = ?", (cluster_id, article_id))
+    return cluster_id
+
+
+def get_cluster_ids(conn):
+    """
+    The cluster of every clustered article.
+
+    RETURNS:
+    - A dictionary { article_id: cluster_id } (articles that are not in it
+      are their own cluster)
+    """
+    rows = conn.execute("SELECT id, cluster_id FROM articles WHERE cluster_id IS NOT NULL")
+    return dict(rows.fetchall())
+
+
+# =============================================================================
+# COLLAPSING CLUSTERS
+# =============================================================================
+
+def collapse_chunks(documents, top_k):
+    """
+    Keep the chunks of ONE article per cluster in a retrieval result.
+
+    PARAMETERS:
+    - documents: List of {"content", "metadata"}, best match first
+      (metadata has "doc_id" and, for chunks embedded since clustering
+      exists, "cluster_id")
+    - top_k: Number of chunks to keep
+
+    RETURNS:
+    - The kept chunks (best match first) and the number of chunks dropped
+    """
+    article_by_cluster = {}
+    kept = []
+    dropped = 0
+    for doc in documents:
+        meta = doc.get("metadata") or {}
+        doc_id = meta.get("doc_id")
+        cluster_id = meta.get("cluster_id") or doc_id
+        # The first (best) article of a cluster wins; its other chunks stay
+        if article_by_cluster.setdefault(cluster_id, doc_id) != doc_id:
+            dropped += 1
+            continue
+        if len(kept) < top_k:
+            kept.append(doc)
+    return kept, dropped
+
+
+def collapse_articles(articles, cluster_ids):
+    """
+    Keep one article per cluster (the first in the list, e.g. the newest).
+
+    The kept article gets a "_cluster_sources" list with the outlets of the
+    dropped copies, so a report can still say who else covered the story.
+
+    PARAMETERS:
+    - articles: List of article dictionaries (with "id" and "source")
+    - cluster_ids: From get_cluster_ids()
+
+    RETURNS:
+    - The kept articles, in the same order
+    """
+    first_by_cluster = {}
+    kept = []
+    for article in articles:
+        article_id = article.get("id")
+        cluster_id = cluster_ids.get(article_id, article_id)
+        if cluster_id is None or cluster_id not in first_by_cluster:
+            first_by_cluster[cluster_id] = article
+            kept.append(article)
+            continue
+        first = first_by_cluster[cluster_id]
+        source = article.get("source")
+        if source and source != first.get("source") and source not in first.setdefault("_cluster_sources", []):
+            first["_cluster_sources"].append(source)
+    return kept
+
+
+# =============================================================================
+# REBUILDING
+# =============================================================================
+
+def rebuild_index(conn, articles_dir=ARTICLES_DIR):
+    """
+    Build the index again from every cleaned article on disk.
+
+    Articles are added in scrape order, so the first article of a story
+    gives the cluster its ID (the same as when they came in one by one).
+
+    RETURNS:
+    - A tuple (articles indexed, clusters with more than one article)
+    """
+    conn.execute("DELETE FROM minhash_signatures")
+    conn.execute("DELETE FROM minhash_bands")
+    conn.execute("UPDATE articles SET cluster_id = NULL")
+
+    duplicate_ids = article_manifest.get_duplicate_ids(conn)
+    rows = conn.execute(
+        "SELECT id FROM articles WHERE cleaner_version IS NOT NULL ORDER BY scraped_at, id"
+    ).fetchall()
+
+    indexed = 0
+    for (article_id,) in rows:
+        if article_id in duplicate_ids:
+            continue
+        filepath = Path(articles_dir) / f"{article_id}.json"
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[WARNING] Could not read {filepath.name}: {e}")
+            continue
+        add_article(conn, article_id, compute_signature(data.get("text")))
+        indexed += 1
+        if indexed % 1000 == 0:
+            conn.commit()
+            print(f"[INFO] Indexed {indexed} articles...")
+
+    conn.commit()
+    return indexed, count_shared_clusters(conn)
+
+
+def count_shared_clusters(conn):
+    """
+    The number of clusters with more than one article.
+    """
+    row = conn.execute(
+        "SELECT COUNT(*) FROM (SELECT cluster_id FROM articles WHERE cluster_id IS NOT NULL"
+        " GROUP BY cluster_id HAVING COUNT(*) > 1)"
+    ).fetchone()
+    return row[0]
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def main():
+    """
+    Show the biggest near-duplicate clusters (or rebuild the index).
+    """
+    parser = argparse.ArgumentParser(description="Near-duplicate article clusters (MinHash + LSH)")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from all cleaned articles")
+    parser.add_argument("--top", type=int, default=10, help="How many clusters to show (default: 10)")
+    args = parser.parse_args()
+
+    conn = article_manifest.open_manifest()
+    ensure_index(conn)
+
+    if args.rebuild:
+        indexed, shared = rebuild_index(conn)
+        print(f"[INFO] Indexed {indexed} articles, {shared} clusters with near-duplicates")
+
+    rows = conn.execute(
+        "SELECT cluster_id, COUNT(*), GROUP_CONCAT(DISTINCT source) FROM articles"
+        " WHERE cluster_id IS NOT NULL GROUP BY cluster_id HAVING COUNT(*) > 1"
+        " ORDER BY COUNT(*) DESC LIMIT ?",
+        (args.top,),
+    ).fetchall()
+
+    print()
+    print(f"{'CLUSTER':<14} {'ARTICLES':>8}  SOURCES")
+    print("-" * 60)
+    for cluster_id, count, sources in rows:
+        print(f"{cluster_id[:12]:<14} {count:>8}  {sources}")
+    print()
+    print(f"[INFO] {count_shared_clusters(conn)} clusters with more than one article")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
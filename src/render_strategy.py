@@ -0,0 +1,274 @@
+"""
+render_strategy.py - Learn per source whether ScrapingBee must render JavaScript
+=================================================================================
+
+The scraper used to ask ScrapingBee for render_js=true on EVERY article.
+That runs a full headless browser: it is the slowest mode and costs
+5 credits per request instead of 1. Most of our outlets are plain HTML
+pages, where a normal fetch gives exactly the same article.
+
+So for every source we learn which mode it needs, and remember it in:
+
+    data/state/render_strategy.json
+
+    {"sources": {
+        "PUBLICO":    {"mode": "static", "static_ok": 5, "static_bad": 0, ...},
+        "CNN_TRAVEL": {"mode": "js", "static_ok": 1, "static_bad": 4, "decided_at": 1767281160},
+        "NEW_SOURCE": {"mode": "probe", "static_ok": 2, "static_bad": 0, ...}
+    }}
+
+HOW A SOURCE IS DECIDED:
+1. "probe":  new source. Every article is fetched without rendering first.
+             If the page fails the quality check, the same article is
+             fetched again WITH rendering (so no article is lost).
+             After PROBE_ARTICLES checks we decide:
+2. "static": enough static pages passed -> keep fetching without rendering
+             (a single bad page is still retried with rendering). After
+             ESCALATION_STREAK_LIMIT bad pages in a row, switch to "js".
+3. "js":     static pages were not good enough -> render right away.
+             After RECHECK_DAYS we probe the source again (sites change).
+
+THE QUALITY CHECK (is_good_static_page):
+- the page is not a cookie/consent wall (source_rules.is_consent_wall,
+  the same check the cleaner uses)
+- after the source's own cleaner there are at least MIN_CLEAN_CHARS
+  characters of article text left
+The check needs the source's OWN cleaner: the generic cleaner keeps most
+navigation junk, so it would pass almost any page. Sources without a
+cleaner are therefore always rendered (like before), and a page whose
+cleaner raised an error is rendered without counting for or against the
+source.
+
+SEE THE DECISIONS:
+    python src/render_strategy.py
+
+FORGET A SOURCE (it is probed again next run):
+    python src/render_strategy.py --reset CNN_TRAVEL
+"""
+
+import argparse
+import json
+import os
+import time
+
+import source_rules  # Consent-wall phrases (source_rules.py)
+from cleaners import find_cleaner_module, resolve_cleaner  # The per-source cleaners (cleaners/)
+
+# Where the decisions are stored
+STRATEGY_FILE = "data/state/render_strategy.json"
+
+# Static pages checked before we decide about a new source
+PROBE_ARTICLES = 5
+
+# Share of good static pages needed to stay with static fetching
+STATIC_MIN_SUCCESS_RATE = 0.8
+
+# Bad static pages in a row that send a "static" source back to rendering
+ESCALATION_STREAK_LIMIT = 3
+
+# Days before a "js" source is probed again
+RECHECK_DAYS = 14
+
+# Minimum characters of cleaned article text for a static page to count as good
+MIN_CLEAN_CHARS = 500
+
+# ScrapingBee credits per request (for the run summary)
+CREDITS_STATIC = 1
+CREDITS_JS = 5
+
+
+# =============================================================================
+# LOADING AND SAVING
+# =============================================================================
+
+def load_strategy(strategy_file=STRATEGY_FILE):
+    """
+    Load the per-source decisions (an empty strategy if the file is missing).
+
+    RETURNS:
+    - A dictionary {"sources": {source_name: entry}}
+    """
+    if not os.path.exists(strategy_file):
+        return {"sources": {}}
+
+    try:
+        with open(strategy_file, "r", encoding="utf-8") as f:
+            strategy = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[WARNING] Could not read {strategy_file} ({e}), every source will be probed again")
+        return {"sources": {}}
+
+    if "sources" not in strategy:
+        strategy["sources"] = {}
+    return strategy
+
+
+def save_strategy(strategy, strategy_file=STRATEGY_FILE):
+    """
+    Save the per-source decisions (temporary file + rename, never half-written).
+    """
+    os.makedirs(os.path.dirname(strategy_file), exist_ok=True)
+    temp_path = strategy_file + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(strategy, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(temp_path, strategy_file)
+
+
+def get_source_entry(strategy, source):
+    """
+    The decision record of one source (created in "probe" mode if new).
+    """
+    if source not in strategy["sources"]:
+        strategy["sources"][source] = {
+            "mode": "probe",
+            "static_ok": 0,
+            "static_bad": 0,
+            "bad_streak": 0,
+            "decided_at": None,
+        }
+    return strategy["sources"][source]
+
+
+# =============================================================================
+# DECIDING
+# =============================================================================
+
+def should_render_js(strategy, source, now=None):
+    """
+    Should this source's next article be fetched WITH JavaScript rendering?
+
+    RETURNS:
+    - True for "js" sources and sources without their own cleaner (their
+      static pages can't be checked), False for "probe" and "static"
+      sources (whose bad pages are escalated by the scraper)
+    """
+    if now is None:
+        now = time.time()
+
+    if find_cleaner_module(source) is None:
+        return True
+
+    entry = get_source_entry(strategy, source)
+    if entry["mode"] != "js":
+        return False
+
+    # Time to find out whether the site still needs a browser
+    if entry["decided_at"] and now - entry["decided_at"] > RECHECK_DAYS * 86400:
+        print(f"[INFO] {source}: rendered for {RECHECK_DAYS} days, trying static fetches again")
+        entry["mode"] = "probe"
+        entry["static_ok"] = 0
+        entry["static_bad"] = 0
+        entry["bad_streak"] = 0
+        return False
+
+    return True
+
+
+def record_static_check(strategy, source, good, now=None):
+    """
+    Remember whether a static page of this source passed the quality check,
+    and switch the source's mode when we know enough.
+
+    PARAMETERS:
+    - strategy: The loaded strategy
+    - source: Source name
+    - good: True if the static page passed is_good_static_page()
+      (don't call this when the check was inconclusive)
+    """
+    if now is None:
+        now = time.time()
+
+    entry = get_source_entry(strategy, source)
+    if good:
+        entry["static_ok"] += 1
+        entry["bad_streak"] = 0
+    else:
+        entry["static_bad"] += 1
+        entry["bad_streak"] += 1
+
+    checked = entry["static_ok"] + entry["static_bad"]
+
+    if entry["mode"] == "probe" and checked >= PROBE_ARTICLES:
+        if entry["static_ok"] / checked >= STATIC_MIN_SUCCESS_RATE:
+            entry["mode"] = "static"
+        else:
+            entry["mode"] = "js"
+        entry["decided_at"] = int(now)
+        print(f"[INFO] {source}: {entry['static_ok']}/{checked} static pages were good -> {entry['mode']}")
+
+    elif entry["mode"] == "static" and entry["bad_streak"] >= ESCALATION_STREAK_LIMIT:
+        entry["mode"] = "js"
+        entry["decided_at"] = int(now)
+        print(f"[INFO] {source}: {entry['bad_streak']} bad static pages in a row -> js")
+
+
+def is_good_static_page(content, article):
+    """
+    The quality check for a page fetched WITHOUT JavaScript rendering.
+
+    PARAMETERS:
+    - content: The markdown ScrapingBee returned
+    - article: The link record (source, link, title, tags) for the cleaner
+
+    RETURNS:
+    - A tuple (good, reason), e.g. (False, "consent wall").
+      good is None when the page can't be judged (no cleaner for the source,
+      or the cleaner raised an error): render it, but don't learn from it.
+    """
+    if not content:
+        return False, "empty page"
+
+    if source_rules.is_consent_wall(content):
+        return False, "consent wall"
+
+    entry = resolve_cleaner(article.get("source"))
+    if entry is None:
+        return None, "no cleaner for this source"
+
+    # The cleaner changes the metadata it gets (title, date, tags): give it a copy
+    meta = dict(article)
+    meta["tags"] = list(article.get("tags") or [])
+    try:
+        cleaned = entry["clean"](content, meta) or ""
+    except Exception as e:
+        return None, f"cleaner error ({e})"
+
+    if len(cleaned.strip()) < MIN_CLEAN_CHARS:
+        return False, f"only {len(cleaned.strip())} characters after cleaning"
+
+    return True, "ok"
+
+
+# =============================================================================
+# MAIN FUNCTION
+# =============================================================================
+
+def main():
+    """
+    Show the per-source render decisions (or forget one source).
+    """
+    parser = argparse.ArgumentParser(description="Per-source JavaScript rendering decisions of the scraper")
+    parser.add_argument("--reset", type=str, default=None, help="Forget a source, so it is probed again")
+    args = parser.parse_args()
+
+    strategy = load_strategy()
+
+    if args.reset:
+        source = args.reset.upper()
+        if strategy["sources"].pop(source, None) is None:
+            print(f"[WARNING] {source} is not in {STRATEGY_FILE}")
+        else:
+            save_strategy(strategy)
+            print(f"[INFO] {source} will be probed again on the next run")
+        return
+
+    print()
+    print(f"{'SOURCE':<28} {'MODE':<7} {'STATIC OK':>9} {'BAD':>5}")
+    print("-" * 52)
+    for source, entry in sorted(strategy["sources"].items()):
+        print(f"{source[:28]:<28} {entry['mode']:<7} {entry['static_ok']:>9} {entry['static_bad']:>5}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+scrape_journal.py - Crash-safe journal of a scraper run
+========================================================
+
+A big scrape can run for hours. If 02__scraper.py is killed halfway, we
+want the next run to continue EXACTLY where it stopped, without paying
+ScrapingBee again for articles we already received.
+
+Each run writes an append-only journal (one JSON event per line):
+
+    data/state/scrape_journal/20260101_152600.jsonl
+
+    {"event": "begin", "at": 1767281160.5}        <- when the run started
+    {"event": "plan", "id": "ab12...", "source": "PUBLICO", "article": {...}}
+    {"event": "plan", ...}                        <- the whole plan, first
+    {"event": "start", "id": "ab12..."}           <- request sent
+    {"event": "done", "id": "ab12...", "status": "success"}
+    ...
+    {"event": "end"}                              <- the run finished
+
+Appending a line never rewrites what is already there, so a crash can at
+worst cut off the LAST line (we ignore it when reading).
+
+When a run finishes, its journal is deleted (the article manifest keeps
+the permanent record), so any journal left in the folder is unfinished.
+
+HOW RESUMING WORKS (python src/02__scraper.py --resume):
+1. Find the newest journal without an "end" event
+2. Take its plan, minus every article with a "done" event
+3. Minus every article whose file was saved AFTER the run began
+   (we crashed between saving the file and writing "done")
+4. Scrape the rest, appending to the same journal
+
+Article files are written to a temporary file and renamed (see
+save_article in 02__scraper.py), so a crash never leaves half-written
+JSON in data/articles. Leftover temporary files are removed on startup.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Where the journals live
+JOURNAL_DIR = "data/state/scrape_journal"
+
+
+def start_journal(articles_to_scrape, journal_dir=JOURNAL_DIR):
+    """
+    Create the journal of a new run and write its plan.
+
+    PARAMETERS:
+    - articles_to_scrape: List of (article, article_id, source) tuples
+    - journal_dir: Folder for the journal files
+
+    RETURNS:
+    - A journal dictionary {"run_id", "path", "file"} for log_event()
+    """
+    os.makedirs(journal_dir, exist_ok=True)
+
+    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(journal_dir, f"{run_id}.jsonl")
+    journal = {"run_id": run_id, "path": path, "file": open(path, "a", encoding="utf-8")}
+
+    write_line(journal, {"event": "begin", "at": time.time()})
+    for article, article_id, source in articles_to_scrape:
+        write_line(journal, {"event": "plan", "id": article_id, "source": source, "article": article})
+
+    # The plan must be on disk before we spend any credits
+    journal["file"].flush()
+    os.fsync(journal["file"].fileno())
+
+    return journal
+
+
+def reopen_journal(path):
+    """
+    Open an existing journal to append to it (used by --resume).
+    """
+    run_id = Path(path).stem
+    return {"run_id": run_id, "path": path, "file": open(path, "a", encoding="utf-8")}
+
+
+def write_line(journal, record):
+    """
+    Append one event to the journal.
+    """
+    journal["file"].write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def log_event(journal, event, article_id, status=None):
+    """
+    Append a "start" or "done" event and push it to the operating system.
+
+    PARAMETERS:
+    - journal: Journal dictionary (or None to do nothing)
+    - event: "start" or "done"
+    - article_id: The article's unique ID
+    - status: For "done": "success" or "failed"
+    """
+    if journal is None:
+        return
+
+    record = {"event": event, "id": article_id}
+    if status:
+        record["status"] = status
+    write_line(journal, record)
+    # flush() hands the line to the OS, so it survives the scraper being killed
+    journal["file"].flush()
+
+
+def finish_journal(journal):
+    """
+    Mark the run as finished, close the journal and delete it.
+    """
+    if journal is None:
+        return
+    write_line(journal, {"event": "end", "at": datetime.now().isoformat()})
+    journal["file"].flush()
+    journal["file"].close()
+    os.remove(journal["path"])
+
+
+def close_journal(journal):
+    """
+    Close the journal WITHOUT marking it finished (so it can be resumed).
+    """
+    if journal is not None and not journal["file"].closed:
+        journal["file"].flush()
+        journal["file"].close()
+
+
+def read_events(path):
+    """
+    Yield the events of a journal, skipping a half-written last line.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def find_unfinished_journal(journal_dir=JOURNAL_DIR):
+    """
+    Find the newest journal that has no "end" event.
+
+    RETURNS:
+    - The path of the journal, or None
+    """
+    if not os.path.exists(journal_dir):
+        return None
+
+    for path in sorted(Path(journal_dir).glob("*.jsonl"), reverse=True):
+        finished = False
+        for event in read_events(path):
+            if event.get("event") == "end":
+                finished = True
+        if not finished:
+            return str(path)
+
+    return None
+
+
+def load_remaining_plan(path, articles_dir):
+    """
+    Work out what an interrupted run still has to scrape.
+
+    PARAMETERS:
+    - path: The unfinished journal
+    - articles_dir: Where article files are saved
+
+    RETURNS:
+    - A tuple (remaining, done_count, saved_not_logged)
+      remaining: list of (article, article_id, source) in the original order
+      done_count: articles with a "done" event
+      saved_not_logged: IDs whose file exists but whose "done" is missing
+    """
+    plan = []
+    done_ids = set()
+    began_at = None
+
+    for event in read_events(path):
+        if event.get("event") == "begin":
+            began_at = event["at"]
+        elif event.get("event") == "plan":
+            plan.append((event["article"], event["id"], event.get("source")))
+        elif event.get("event") == "done":
+            done_ids.add(event["id"])
+
+    remaining = []
+    saved_not_logged = []
+    for article, article_id, source in plan:
+        if article_id in done_ids:
+            continue
+        # Saved right before the crash: we already paid for it, don't scrape again.
+        # (The file may also be OLDER than the run, e.g. with --retry-failed;
+        # then it still has to be scraped.)
+        filepath = os.path.join(articles_dir, f"{article_id}.json")
+        if began_at is not None and os.path.exists(filepath) and os.path.getmtime(filepath) >= began_at:
+            saved_not_logged.append(article_id)
+            continue
+        remaining.append((article, article_id, source))
+
+    return remaining, len(done_ids), saved_not_logged
+
+
+def remove_temp_files(articles_dir):
+    """
+    Delete temporary files left behind by a crash during an atomic write.
+
+    RETURNS:
+    - The number of files removed
+    """
+    if not os.path.exists(articles_dir):
+        return 0
+
+    removed = 0
+    for temp_path in Path(articles_dir).glob("*.json.tmp"):
+        os.remove(temp_path)
+        removed += 1
+    return removed
@@ -0,0 +1,102 @@
+"""
+url_utils.py - One canonical form for every article link
+=========================================================
+
+The same article reaches us under many links:
+
+    https://www.publico.pt/2026/02/07/viagens/noticia/lisboa-1234?utm_source=rss&utm_medium=feed
+    http://publico.pt/2026/02/07/viagens/noticia/lisboa-1234/
+    https://www.publico.pt/2026/02/07/viagens/noticia/lisboa-1234#comments
+
+Before, the scraper hashed the raw link into the article ID, so each of
+these was scraped (and paid for) again. canonicalize_url() turns all of
+them into ONE link, and the scraper hashes that instead:
+
+    https://publico.pt/2026/02/07/viagens/noticia/lisboa-1234
+
+WHAT IS CHANGED:
+- scheme and host are lower-cased, http becomes https, "www." is dropped
+- the default port (:80 / :443) and the #fragment are dropped
+- tracking parameters (TRACKING_PARAMS, TRACKING_PREFIXES) are dropped,
+  the other query parameters are sorted
+- a trailing "/" at the end of the path is dropped
+
+The path itself is left alone: on many sites it is case-sensitive.
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only say where a click came from
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "yclid",
+    "mc_cid", "mc_eid", "_ga", "_gl",
+    "ref", "ref_src", "referrer", "cmpid", "ocid", "xtor", "smid", "sr_share",
+}
+
+# Query parameters starting with these are tracking parameters too
+TRACKING_PREFIXES = ("utm_", "ns_", "at_", "pk_", "mtm_")
+
+# Cache: link -> canonical link (the same links come back in every run)
+_CANONICAL_CACHE = {}
+CANONICAL_CACHE_MAX = 100000
+
+
+def is_tracking_param(name):
+    """
+    Is this query parameter only there for click tracking?
+    """
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(link):
+    """
+    The canonical form of an article link (see the top of this file).
+
+    PARAMETERS:
+    - link: The article URL as found in the feed
+
+    RETURNS:
+    - The canonical URL (the link itself if it can't be parsed)
+    """
+    if link in _CANONICAL_CACHE:
+        return _CANONICAL_CACHE[link]
+
+    try:
+        parts = urlsplit(link.strip())
+        port = parts.port
+    except ValueError:
+        return link
+
+    if not parts.netloc:
+        return link
+
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = parts.path
+    if len(path) > 1:
+        path = path.rstrip("/")
+    if path == "/":
+        path = ""
+
+    params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(name)
+    ]
+    query = urlencode(sorted(params))
+
+    canonical = urlunsplit((scheme, host, path, query, ""))
+
+    if len(_CANONICAL_CACHE) >= CANONICAL_CACHE_MAX:
+        _CANONICAL_CACHE.clear()
+    _CANONICAL_CACHE[link] = canonical
+    return canonical